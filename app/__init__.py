@@ -11,7 +11,31 @@ def create_app():
     app.config["SECRET_KEY"] = os.getenv("SECRET_KEY", "clave-por-defecto")
     app.config["SQLALCHEMY_DATABASE_URI"] = os.getenv("DATABASE_URL", "sqlite:///biblioteca.db")
     app.config["SQLALCHEMY_TRACK_MODIFICATIONS"] = False
+    app.config["DATABASE_REPLICA_URLS"] = os.getenv("DATABASE_REPLICA_URLS", "")
+    app.config["DB_READ_YOUR_WRITES_SECONDS"] = float(os.getenv("DB_READ_YOUR_WRITES_SECONDS", "5"))
+    app.config["QUERY_STATS_ENABLED"] = os.getenv("QUERY_STATS_ENABLED", "true").lower() == "true"
+    if os.getenv("QUERY_STATS_HEADERS"):
+        # Sin definir: solo con debug (ver app/query_stats.py)
+        app.config["QUERY_STATS_HEADERS"] = os.getenv("QUERY_STATS_HEADERS").lower() == "true"
+    app.config["QUERY_BUDGET_COUNT"] = int(os.getenv("QUERY_BUDGET_COUNT", "20"))
+    app.config["QUERY_BUDGET_MS"] = float(os.getenv("QUERY_BUDGET_MS", "500"))
+    # Posiciones máximas que sirve /books/search (paginación por OFFSET, ver app/search.py)
+    app.config["SEARCH_MAX_RESULTS"] = int(os.getenv("SEARCH_MAX_RESULTS", "1000"))
     app.config["JWT_SECRET_KEY"] = os.getenv("SECRET_KEY", "clave-jwt-secreta")
+    app.config["CACHE_BACKEND"] = os.getenv("CACHE_BACKEND", "memory")
+    app.config["CACHE_REDIS_URL"] = os.getenv("CACHE_REDIS_URL")
+    app.config["CACHE_DEFAULT_TTL"] = int(os.getenv("CACHE_DEFAULT_TTL", "300"))
+    # Workers del servidor (por defecto WEB_CONCURRENCY); con más de uno la caché 'memory' acorta sus TTL, ver app/cache.py
+    app.config["CACHE_WORKERS"] = os.getenv("CACHE_WORKERS")
+    app.config["CACHE_MEMORY_MULTIWORKER_TTL"] = int(os.getenv("CACHE_MEMORY_MULTIWORKER_TTL", "5"))
+    app.config["ADMIN_STATUS_TTL"] = int(os.getenv("ADMIN_STATUS_TTL", "30"))
+    app.config["PASSWORD_HASH_METHOD"] = os.getenv("PASSWORD_HASH_METHOD", "scrypt:32768:8:1")
+    app.config["PASSWORD_HASH_WORKERS"] = int(os.getenv("PASSWORD_HASH_WORKERS", "2"))
+    app.config["PASSWORD_HASH_QUEUE_SIZE"] = int(os.getenv("PASSWORD_HASH_QUEUE_SIZE", "16"))
+    app.config["PASSWORD_HASH_TIMEOUT"] = float(os.getenv("PASSWORD_HASH_TIMEOUT", "10"))
+    # RATE_LIMIT_BACKEND, RATE_LIMIT_REDIS_URL, RATE_LIMIT_PROXY_HOPS y los límites
+    # por regla (RATE_LIMIT_LOGIN_IP, RATE_LIMIT_LOGIN_EMAIL, ...), ver app/rate_limit.py
+    app.config.update({key: value for key, value in os.environ.items() if key.startswith("RATE_LIMIT_")})
     
     print(f"🔑 SECRET_KEY cargada: {'✅' if app.config['SECRET_KEY'] else '❌'}")
     print(f"🗄️ DATABASE_URL: {app.config['SQLALCHEMY_DATABASE_URI']}")
@@ -31,7 +55,8 @@ def create_app():
                         
                     ],
                     "methods": ["GET", "POST", "PUT", "DELETE", "PATCH","OPTIONS"],
-                    "allow_headers": ["Content-Type", "Authorization" ],
+                    "allow_headers": ["Content-Type", "Authorization", "X-DB-Primary-Until"],
+                    "expose_headers": ["X-DB-Primary-Until", "X-Next-Cursor"],
                     "supports_credentials": True
                 }
             })
@@ -46,14 +71,37 @@ def create_app():
             from flask import jsonify
             response = jsonify({'status': 'preflight'})
             response.headers.add('Access-Control-Allow-Methods', 'GET, POST, PUT, DELETE, OPTIONS')
-            response.headers.add('Access-Control-Allow-Headers', 'Content-Type, Authorization')
+            response.headers.add('Access-Control-Allow-Headers', 'Content-Type, Authorization, X-DB-Primary-Until')
             return response
     
     # Inicializar extensiones
+    from app.engine_config import configure_engine, init_engine
+    from app.db_routing import read_router
+    configure_engine(app)
+    read_router.configure(app)
     db.init_app(app)
+    init_engine(app)
+    read_router.init_app(app)
+    
+    from app.query_stats import init_query_stats
+    init_query_stats(app)
     migrate.init_app(app, db)
     jwt = JWTManager(app)
     
+    from app.cache import cache
+    cache.init_app(app)
+    
+    from app.rate_limit import rate_limiter
+    rate_limiter.init_app(app)
+    
+    from app.passwords import passwords, register_password_commands
+    passwords.init_app(app)
+    register_password_commands(app)
+    
+    from app.admin_auth import admin_status, register_admin_commands
+    admin_status.init_app(app)
+    register_admin_commands(app)
+    
     # Importar y registrar blueprints
     from app.routes import register_blueprints
     register_blueprints(app)
@@ -62,7 +110,40 @@ def create_app():
     from app.errors import register_error_handlers
     register_error_handlers(app)
     
+    from app.search import register_search_commands
+    register_search_commands(app)
+    
+    from app.rating_stats import init_rating_stats, register_rating_stats_commands
+    register_rating_stats_commands(app)
+    
+    from app.genre_stats import init_genre_stats, register_genre_stats_commands
+    register_genre_stats_commands(app)
+    
+    from app.catalog_import import register_import_commands
+    register_import_commands(app)
+    
+    from app.catalog_export import register_export_commands
+    register_export_commands(app)
+
+    from app.verify_seed import register_verify_commands
+    register_verify_commands(app)
+    
+    from app.conditional import init_catalog_version
+    from app.autocomplete import author_index
+    
     with app.app_context():
-        db.create_all()
+        # Solo el primario: las réplicas (binds replica_<n>) no reciben DDL
+        db.create_all(bind_key=None)
+        
+        # Índices y agregados precalculados; si el esquema todavía no está
+        # migrado (p. ej. al ejecutar init-db.py) se reconstruyen más tarde
+        try:
+            init_rating_stats(app)
+            init_genre_stats(app)
+            init_catalog_version(app)
+            author_index.init_app(app)
+        except Exception as e:
+            db.session.rollback()
+            print(f"⚠️ Precálculos omitidos (¿migraciones pendientes?): {e}")
     
     return app
\ No newline at end of file
@@ -0,0 +1,106 @@
+# app/admin_auth.py
+"""
+Autorización de las rutas de administración.
+
+    @admin_bp.route('/admin/books/list', methods=['GET'])
+    @admin_required('No tiene permiso para ver libros')
+    def admin_get_all_books(): ...
+
+El token debe estar firmado y llevar el claim is_admin (lo añaden el login y el
+registro de admins). Además se comprueba que el admin siga activo usando una
+copia en memoria de su estado que caduca a los ADMIN_STATUS_TTL segundos, así
+que la consulta por clave primaria se hace como mucho una vez por admin y TTL.
+Al desactivar un admin hay que llamar a admin_status.invalidate(id_admin);
+en otros procesos el cambio se aplica al caducar el TTL.
+"""
+import threading
+import time
+from functools import wraps
+import click
+from flask_jwt_extended import verify_jwt_in_request, get_jwt, get_jwt_identity
+from app.database import db
+from app.errors import unauthorized
+
+DEFAULT_STATUS_TTL = 30
+
+
+class AdminStatusCache:
+    def __init__(self):
+        self.ttl = DEFAULT_STATUS_TTL
+        self._entries = {}
+        self._lock = threading.Lock()
+
+    def init_app(self, app):
+        self.ttl = float(app.config.get('ADMIN_STATUS_TTL', DEFAULT_STATUS_TTL))
+        self.invalidate()
+
+    def is_active(self, admin_id):
+        """True si el admin existe y está activo"""
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(admin_id)
+            if entry and entry[1] > now:
+                return entry[0]
+
+        from app.models import Admin
+        active = bool(
+            db.session.query(Admin.is_active).filter(Admin.id_admin == admin_id).scalar()
+        )
+        with self._lock:
+            self._entries[admin_id] = (active, now + self.ttl)
+        return active
+
+    def invalidate(self, admin_id=None):
+        """Olvidar el estado de un admin (o de todos) para releerlo en la próxima petición"""
+        with self._lock:
+            if admin_id is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(admin_id, None)
+
+
+admin_status = AdminStatusCache()
+
+
+def _current_admin_id():
+    try:
+        return int(get_jwt_identity())
+    except (TypeError, ValueError):
+        return None
+
+
+def admin_required(message='No tiene permiso de administrador'):
+    """
+    Exigir un JWT de administrador activo.
+    Sustituye a @jwt_required() en las rutas de admin_bp.
+    """
+    def decorator(view):
+        @wraps(view)
+        def wrapper(*args, **kwargs):
+            verify_jwt_in_request()
+            admin_id = _current_admin_id()
+            if not get_jwt().get('is_admin') or admin_id is None:
+                return unauthorized(message)
+            if not admin_status.is_active(admin_id):
+                return unauthorized('Cuenta de administrador desactivada')
+            return view(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def register_admin_commands(app):
+    @app.cli.command('admin-set-active')
+    @click.argument('email')
+    @click.option('--active/--inactive', default=True, help='Activar o desactivar la cuenta')
+    def admin_set_active(email, active):
+        """Activar o desactivar un administrador"""
+        from app.models import Admin
+        admin = Admin.query.filter_by(email_admin=email).first()
+        if admin is None:
+            print(f"❌ No existe un administrador con el email {email}")
+            return
+        admin.is_active = active
+        db.session.commit()
+        admin_status.invalidate(admin.id_admin)
+        estado = 'activado' if active else 'desactivado'
+        print(f"✅ Administrador {email} {estado} (los demás procesos lo aplican en {admin_status.ttl:g}s)")
@@ -0,0 +1,210 @@
+# app/autocomplete.py
+"""
+Índice en memoria para el autocompletado de autores.
+
+Guarda por autor su nombre normalizado, el total de libros y el primer género,
+y un índice de n-gramas (bigramas y trigramas) sobre el nombre completo, de modo
+que cada búsqueda se responde sin consultar la base de datos.
+
+Cada proceso mantiene su propia copia: se construye al arrancar y se actualiza en
+las escrituras de admin. Para recoger cambios hechos por otros workers, cuando
+supera AUTOCOMPLETE_MAX_AGE segundos la búsqueda que lo detecta lanza una
+recarga en segundo plano (una sola a la vez) y sigue respondiendo con la copia
+anterior hasta que la nueva la sustituye. La recarga solo reconstruye el índice
+si ha cambiado la versión del catálogo (tabla version_catalogo).
+"""
+import threading
+import time
+from collections import defaultdict
+from sqlalchemy import func
+from app.database import db
+from app.search import normalize_text
+
+DEFAULT_MAX_AGE = 300
+
+
+def _grams(value, size):
+    return {value[i:i + size] for i in range(len(value) - size + 1)}
+
+
+class AuthorIndex:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._entries = {}
+        self._postings = {2: defaultdict(set), 3: defaultdict(set)}
+        self._built_at = None
+        self._catalog_etag = None
+        self._refresh_thread = None
+        self._app = None
+        self.max_age = DEFAULT_MAX_AGE
+
+    def init_app(self, app):
+        self.max_age = int(app.config.get('AUTOCOMPLETE_MAX_AGE', DEFAULT_MAX_AGE))
+        self._app = app
+        with app.app_context():
+            self.build()
+
+    # ===== CONSTRUCCIÓN =====
+    def _load(self, author_id=None):
+        """Leer los autores con sus totales (2 consultas, agregadas en la base de datos)"""
+        from app.models import Author, Book
+
+        authors_query = db.session.query(Author.id_autor, Author.nombre_autor, Author.apellido_autor)
+        # Primer libro (menor id) y total por autor; el género se toma del primer libro
+        totals = db.session.query(
+            Book.id_autor,
+            func.count(Book.id_libros).label('total_libros'),
+            func.min(Book.id_libros).label('primer_libro')
+        ).group_by(Book.id_autor)
+        if author_id is not None:
+            authors_query = authors_query.filter(Author.id_autor == author_id)
+            totals = totals.filter(Book.id_autor == author_id)
+        totals = totals.subquery()
+        books_query = db.session.query(
+            totals.c.id_autor, totals.c.total_libros, Book.genero_libro
+        ).join(Book, Book.id_libros == totals.c.primer_libro)
+
+        entries = {}
+        for id_autor, nombre, apellido in authors_query:
+            nombre_completo = f"{nombre} {apellido}"
+            entries[id_autor] = {
+                'id_autor': id_autor,
+                'nombre_completo': nombre_completo,
+                'normalized': normalize_text(nombre_completo),
+                'total_libros': 0,
+                'primer_genero': 'Sin género'
+            }
+
+        for id_autor, total_libros, genero in books_query:
+            entry = entries.get(id_autor)
+            if entry is not None:
+                entry['total_libros'] = total_libros
+                entry['primer_genero'] = genero
+
+        return entries
+
+    def _add_postings(self, postings, entry):
+        for size, index in postings.items():
+            for gram in _grams(entry['normalized'], size):
+                index[gram].add(entry['id_autor'])
+
+    def _remove_postings(self, entry):
+        for size, index in self._postings.items():
+            for gram in _grams(entry['normalized'], size):
+                ids = index.get(gram)
+                if ids:
+                    ids.discard(entry['id_autor'])
+                    if not ids:
+                        del index[gram]
+
+    def _current_etag(self):
+        from app.conditional import _catalog_validators
+        try:
+            return _catalog_validators()[2]
+        except Exception:
+            db.session.rollback()
+            return None
+
+    def build(self):
+        """Construir el índice completo"""
+        etag = self._current_etag()
+        entries = self._load()
+        postings = {2: defaultdict(set), 3: defaultdict(set)}
+        for entry in entries.values():
+            self._add_postings(postings, entry)
+
+        with self._lock:
+            self._entries = entries
+            self._postings = postings
+            self._built_at = time.monotonic()
+            self._catalog_etag = etag
+
+    def refresh(self):
+        """Reconstruir solo si la versión del catálogo ha cambiado desde el último build"""
+        etag = self._current_etag()
+        if etag is not None and etag == self._catalog_etag:
+            with self._lock:
+                self._built_at = time.monotonic()
+            return
+        self.build()
+
+    def _refresh_in_background(self):
+        try:
+            with self._app.app_context():
+                self.refresh()
+        except Exception:
+            self._app.logger.exception('No se pudo recargar el índice de autores')
+        finally:
+            with self._lock:
+                self._refresh_thread = None
+
+    def _schedule_refresh(self):
+        """Lanzar una recarga si no hay otra en curso (single-flight)"""
+        if self._app is None:
+            return
+        with self._lock:
+            if self._refresh_thread is not None:
+                return
+            self._refresh_thread = threading.Thread(
+                target=self._refresh_in_background, name='author-index-refresh', daemon=True
+            )
+            self._refresh_thread.start()
+
+    def refresh_author(self, author_id):
+        """Volver a cargar un autor tras crearlo, editarlo, borrarlo o cambiar sus libros"""
+        if author_id is None:
+            return
+        entry = self._load(author_id).get(author_id)
+
+        with self._lock:
+            old = self._entries.pop(author_id, None)
+            if old:
+                self._remove_postings(old)
+            if entry:
+                self._entries[author_id] = entry
+                self._add_postings(self._postings, entry)
+
+    def _is_stale(self):
+        return self._built_at is None or time.monotonic() - self._built_at > self.max_age
+
+    # ===== BÚSQUEDA =====
+    def search(self, query, limit=10):
+        """Autores cuyo nombre completo contiene `query` (sin distinguir acentos)"""
+        normalized = normalize_text(query).strip()
+        if len(normalized) < 2:
+            return []
+        if self._is_stale():
+            self._schedule_refresh()
+
+        size = 3 if len(normalized) >= 3 else 2
+        with self._lock:
+            candidates = None
+            for gram in _grams(normalized, size):
+                ids = self._postings[size].get(gram, set())
+                candidates = set(ids) if candidates is None else candidates & ids
+                if not candidates:
+                    return []
+            matches = [
+                self._entries[author_id] for author_id in candidates
+                if normalized in self._entries[author_id]['normalized']
+            ]
+
+        def rank(entry):
+            name = entry['normalized']
+            if name.startswith(normalized):
+                position = 0
+            elif f" {normalized}" in name:
+                position = 1
+            else:
+                position = 2
+            return (position, name, entry['id_autor'])
+
+        return [{
+            'id_autor': entry['id_autor'],
+            'nombre_completo': entry['nombre_completo'],
+            'total_libros': entry['total_libros'],
+            'primer_genero': entry['primer_genero']
+        } for entry in sorted(matches, key=rank)[:limit]]
+
+
+author_index = AuthorIndex()
@@ -0,0 +1,228 @@
+# app/cache.py
+"""
+Caché de respuestas para rutas GET.
+
+    @books_bp.route('/authors', methods=['GET'])
+    @cached(tags=['catalog'])
+    def get_authors(): ...
+
+La clave se forma con el endpoint, los argumentos de la ruta, el query string
+y (con per_user=True) la identidad del JWT. Cada tag tiene un contador de
+versión que forma parte de la clave: invalidar un tag incrementa su versión y
+las entradas antiguas dejan de encontrarse hasta que expiran por TTL/LRU.
+
+Backends (CACHE_BACKEND):
+- 'memory': LRU en memoria del proceso con TTL (por defecto)
+- 'redis': cualquier cliente compatible con Redis (get/set/mget/incr);
+  se crea desde CACHE_REDIS_URL o se pasa a RedisBackend directamente
+- 'null': sin caché
+
+IMPORTANTE: con 'memory' las invalidaciones solo afectan al proceso que las
+hace. Con varios workers (gunicorn -w N, WEB_CONCURRENCY=N) otro worker
+seguiría sirviendo 'user:<id>' o 'catalog' antiguos hasta que expire el TTL.
+Por eso, si CACHE_WORKERS (o WEB_CONCURRENCY) es mayor que 1, el backend
+'memory' limita todos los TTL a CACHE_MEMORY_MULTIWORKER_TTL segundos (5 por
+defecto). Para cachear más tiempo con varios workers use CACHE_BACKEND=redis.
+"""
+import base64
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from functools import wraps
+from flask import current_app, request, make_response
+from flask_jwt_extended import get_jwt_identity
+
+DEFAULT_TTL = 300
+DEFAULT_MAX_ENTRIES = 1024
+DEFAULT_MULTIWORKER_TTL = 5
+
+
+class MemoryBackend:
+    def __init__(self, max_entries=DEFAULT_MAX_ENTRIES):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._tags = {}
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires, value = entry
+            if expires < time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key, value, ttl):
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def get_tag_versions(self, tags):
+        with self._lock:
+            return [self._tags.get(tag, 0) for tag in tags]
+
+    def bump_tags(self, tags):
+        with self._lock:
+            for tag in tags:
+                self._tags[tag] = self._tags.get(tag, 0) + 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._tags.clear()
+
+
+class RedisBackend:
+    def __init__(self, client, prefix='booketlist:cache:'):
+        self.client = client
+        self.prefix = prefix
+
+    def get(self, key):
+        raw = self.client.get(self.prefix + key)
+        return json.loads(raw) if raw else None
+
+    def set(self, key, value, ttl):
+        self.client.set(self.prefix + key, json.dumps(value), ex=ttl)
+
+    def get_tag_versions(self, tags):
+        if not tags:
+            return []
+        values = self.client.mget([f'{self.prefix}tag:{tag}' for tag in tags])
+        return [int(value) if value else 0 for value in values]
+
+    def bump_tags(self, tags):
+        for tag in tags:
+            self.client.incr(f'{self.prefix}tag:{tag}')
+
+    def clear(self):
+        for key in self.client.scan_iter(f'{self.prefix}*'):
+            self.client.delete(key)
+
+
+class ResponseCache:
+    def __init__(self):
+        self.backend = None
+        self.default_ttl = DEFAULT_TTL
+        self.max_ttl = None
+
+    def init_app(self, app, backend=None):
+        """
+        Elegir el backend según CACHE_BACKEND.
+        Las invalidaciones de 'memory' no llegan a otros workers: con más de
+        un worker sus TTL se acortan (ver el docstring del módulo).
+        """
+        self.default_ttl = int(app.config.get('CACHE_DEFAULT_TTL', DEFAULT_TTL))
+        self.max_ttl = None
+        if backend is not None:
+            self.backend = backend
+            return
+
+        kind = app.config.get('CACHE_BACKEND', 'memory')
+        if kind == 'memory':
+            self.backend = MemoryBackend(int(app.config.get('CACHE_MAX_ENTRIES', DEFAULT_MAX_ENTRIES)))
+            workers = int(app.config.get('CACHE_WORKERS') or os.getenv('WEB_CONCURRENCY') or 1)
+            if workers > 1:
+                self.max_ttl = int(app.config.get('CACHE_MEMORY_MULTIWORKER_TTL', DEFAULT_MULTIWORKER_TTL))
+                app.logger.warning(
+                    f"CACHE_BACKEND=memory con {workers} workers: las invalidaciones no se comparten, "
+                    f"TTL limitado a {self.max_ttl}s (use CACHE_BACKEND=redis)"
+                )
+        elif kind == 'redis':
+            try:
+                import redis
+            except ImportError:
+                raise RuntimeError('CACHE_BACKEND=redis requiere el paquete "redis"')
+            self.backend = RedisBackend(redis.Redis.from_url(app.config['CACHE_REDIS_URL']))
+        else:
+            self.backend = None
+
+    def ttl(self, ttl=None):
+        """TTL efectivo de una entrada"""
+        ttl = ttl or self.default_ttl
+        return min(ttl, self.max_ttl) if self.max_ttl is not None else ttl
+
+    def invalidate(self, *tags):
+        """Invalidar todas las respuestas marcadas con alguno de los tags"""
+        if self.backend is None or not tags:
+            return
+        try:
+            self.backend.bump_tags(tags)
+        except Exception as e:
+            current_app.logger.warning(f"No se pudo invalidar la caché {tags}: {e}")
+
+    def clear(self):
+        if self.backend is not None:
+            self.backend.clear()
+
+
+cache = ResponseCache()
+
+
+def _cache_key(identity, tags, versions, view_args):
+    parts = {
+        'endpoint': request.endpoint,
+        'view_args': sorted((str(k), str(v)) for k, v in view_args.items()),
+        'args': sorted(request.args.items(multi=True)),
+        'identity': identity,
+        'tags': list(zip(tags, versions))
+    }
+    digest = hashlib.sha1(json.dumps(parts, sort_keys=True).encode('utf-8')).hexdigest()
+    return f'{request.endpoint}:{digest}'
+
+
+def cached(ttl=None, tags=(), per_user=False):
+    """
+    Cachear respuestas 200 de una ruta GET.
+    Los tags pueden usar los argumentos de la ruta: tags=['author:{author_id}'].
+    Con per_user=True la clave incluye get_jwt_identity() y se añade el tag 'user:<id>'
+    (el decorador debe ir debajo de @jwt_required()).
+    """
+    def decorator(view):
+        @wraps(view)
+        def wrapper(*args, **kwargs):
+            backend = cache.backend
+            if backend is None or request.method != 'GET':
+                return view(*args, **kwargs)
+
+            identity = get_jwt_identity() if per_user else None
+            resolved_tags = [tag.format(**kwargs) for tag in tags]
+            if per_user:
+                resolved_tags.append(f'user:{identity}')
+
+            try:
+                versions = backend.get_tag_versions(resolved_tags)
+                key = _cache_key(identity, resolved_tags, versions, kwargs)
+                hit = backend.get(key)
+            except Exception as e:
+                current_app.logger.warning(f"Caché no disponible: {e}")
+                return view(*args, **kwargs)
+
+            if hit is not None:
+                response = make_response(base64.b64decode(hit['body']), hit['status'])
+                response.mimetype = hit['mimetype']
+                response.headers['X-Cache'] = 'HIT'
+                return response
+
+            response = make_response(view(*args, **kwargs))
+            if response.status_code == 200:
+                try:
+                    backend.set(key, {
+                        'status': response.status_code,
+                        'mimetype': response.mimetype,
+                        'body': base64.b64encode(response.get_data()).decode('ascii')
+                    }, cache.ttl(ttl))
+                except Exception as e:
+                    current_app.logger.warning(f"No se pudo guardar en caché: {e}")
+            response.headers['X-Cache'] = 'MISS'
+            return response
+        return wrapper
+    return decorator
@@ -0,0 +1,157 @@
+# app/catalog_export.py
+"""
+Exportación en streaming del catálogo, las bibliotecas y las calificaciones.
+
+Las filas se leen con yield_per (cursor de servidor en PostgreSQL) y se
+escriben como NDJSON o CSV en trozos, opcionalmente comprimidos con gzip, de
+modo que la memoria usada no depende del tamaño de la tabla.
+
+El export de 'books' usa las mismas claves que acepta catalog_import, así que
+su salida se puede volver a importar.
+"""
+import csv
+import io
+import json
+import zlib
+from datetime import datetime
+import click
+from sqlalchemy import select
+from app.database import db
+from app.models import Author, Book, Rating, UserLibrary
+
+FORMATS = ('ndjson', 'csv')
+DEFAULT_BATCH_SIZE = 1000
+CONTENT_TYPES = {'ndjson': 'application/x-ndjson', 'csv': 'text/csv'}
+
+
+def _books_query():
+    return select(
+        Book.id_libros,
+        Book.titulo_libro,
+        Book.id_autor,
+        Author.nombre_autor,
+        Author.apellido_autor,
+        Book.genero_libro,
+        Book.descripcion_libros,
+        Book.enlace_asin_libro,
+        Book.enlace_portada_libro,
+        Book.created_at,
+        Book.updated_at
+    ).outerjoin(Author, Author.id_autor == Book.id_autor).order_by(Book.id_libros)
+
+
+def _library_query():
+    return select(
+        UserLibrary.id_biblioteca,
+        UserLibrary.id_usuario,
+        UserLibrary.id_libro,
+        UserLibrary.estado_lectura,
+        UserLibrary.created_at,
+        UserLibrary.updated_at
+    ).order_by(UserLibrary.id_biblioteca)
+
+
+def _ratings_query():
+    return select(
+        Rating.id_calificacion,
+        Rating.id_usuario,
+        Rating.id_libro,
+        Rating.calificacion,
+        Rating.resena,
+        Rating.created_at,
+        Rating.updated_at
+    ).order_by(Rating.id_calificacion)
+
+
+DATASETS = {
+    'books': _books_query,
+    'library': _library_query,
+    'ratings': _ratings_query
+}
+
+
+def _json_value(value):
+    return value.isoformat() if isinstance(value, datetime) else value
+
+
+def iter_rows(dataset, batch_size=DEFAULT_BATCH_SIZE):
+    """Devuelve (columnas, generador de tuplas) leyendo de batch_size en batch_size"""
+    statement = DATASETS[dataset]().execution_options(yield_per=batch_size)
+    result = db.session.execute(statement)
+    return list(result.keys()), (tuple(row) for row in result)
+
+
+def _ndjson_chunks(columns, rows, batch_size):
+    buffer = []
+    for row in rows:
+        buffer.append(json.dumps(
+            {column: _json_value(value) for column, value in zip(columns, row)},
+            ensure_ascii=False
+        ))
+        if len(buffer) >= batch_size:
+            yield '\n'.join(buffer) + '\n'
+            buffer = []
+    if buffer:
+        yield '\n'.join(buffer) + '\n'
+
+
+def _csv_chunks(columns, rows, batch_size):
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(columns)
+    pending = 0
+    for row in rows:
+        writer.writerow([_json_value(value) for value in row])
+        pending += 1
+        if pending >= batch_size:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+            pending = 0
+    yield buffer.getvalue()
+
+
+def _gzip(chunks):
+    compressor = zlib.compressobj(wbits=31)  # 31 = cabecera gzip
+    for chunk in chunks:
+        data = compressor.compress(chunk.encode('utf-8'))
+        if data:
+            yield data
+    yield compressor.flush()
+
+
+def export_chunks(dataset, fmt, gzip=False, batch_size=DEFAULT_BATCH_SIZE):
+    """Generador de trozos (str, o bytes si gzip) con el export completo"""
+    if dataset not in DATASETS:
+        raise ValueError(f"Export no soportado: {dataset} (use {', '.join(DATASETS)})")
+    if fmt not in FORMATS:
+        raise ValueError(f"Formato no soportado: {fmt} (use {', '.join(FORMATS)})")
+
+    columns, rows = iter_rows(dataset, batch_size)
+    writer = _ndjson_chunks if fmt == 'ndjson' else _csv_chunks
+    chunks = writer(columns, rows, batch_size)
+    return _gzip(chunks) if gzip else chunks
+
+
+def export_filename(dataset, fmt, gzip=False):
+    extension = 'ndjson' if fmt == 'ndjson' else 'csv'
+    return f"{dataset}.{extension}{'.gz' if gzip else ''}"
+
+
+def register_export_commands(app):
+    @app.cli.command('catalog-export')
+    @click.argument('dataset', type=click.Choice(list(DATASETS)))
+    @click.argument('output', type=click.Path(dir_okay=False))
+    @click.option('--format', 'fmt', type=click.Choice(FORMATS), default='ndjson', show_default=True)
+    @click.option('--gzip', 'use_gzip', is_flag=True, help='Comprimir la salida con gzip')
+    @click.option('--batch-size', default=DEFAULT_BATCH_SIZE, show_default=True)
+    def catalog_export(dataset, output, fmt, use_gzip, batch_size):
+        """Exportar libros, bibliotecas o calificaciones en NDJSON o CSV a un archivo"""
+        if use_gzip:
+            handle = open(output, 'wb')
+        else:
+            handle = open(output, 'w', encoding='utf-8', newline='')
+        with handle:
+            for chunk in export_chunks(dataset, fmt, use_gzip, batch_size):
+                handle.write(chunk)
+        print(f"✅ Export de {dataset} escrito en {output}")
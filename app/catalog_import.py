@@ -0,0 +1,388 @@
+# app/catalog_import.py
+"""
+Importación masiva del catálogo (libros y autores).
+
+Formatos de entrada (se leen en streaming, línea a línea):
+- 'ndjson': un objeto JSON por línea
+- 'csv': con cabecera
+- 'markdown': el formato de "BaseDatos-Libros Reales.txt"
+  (# sección = género, ## N. Título, - **Campo:** valor)
+
+Claves aceptadas en ndjson/csv: titulo (titulo_libro), autor (o nombre_autor +
+apellido_autor), genero (genero_libro), descripcion (descripcion_libros),
+asin (enlace_asin_libro) y portada (enlace_portada_libro).
+
+Los autores se deduplican por nombre normalizado (sin acentos ni mayúsculas) y
+los libros se insertan o actualizan por ASIN; si un ASIN se repite dentro del
+archivo las apariciones posteriores se rechazan como errores. Las escrituras se hacen por lotes
+con executemany y todo el import es una única transacción.
+"""
+import csv
+import json
+import re
+import time
+from itertools import islice
+import click
+from sqlalchemy import select, insert, update
+from app.database import db
+from app import search, genre_stats
+from app.models import Author, Book, Genre
+from app.models.genre import LEGACY_SLUGS, slugify
+from app.search import normalize_text
+
+FORMATS = ('ndjson', 'csv', 'markdown')
+DEFAULT_BATCH_SIZE = 1000
+MAX_REPORTED_ERRORS = 50
+
+FIELD_ALIASES = {
+    'titulo': ('titulo', 'titulo_libro', 'title'),
+    'autor': ('autor', 'author'),
+    'nombre_autor': ('nombre_autor',),
+    'apellido_autor': ('apellido_autor',),
+    'genero': ('genero', 'genero_libro', 'genre'),
+    'descripcion': ('descripcion', 'descripcion_libros', 'description'),
+    'asin': ('asin', 'enlace_asin_libro', 'amazon_asin'),
+    'portada': ('portada', 'enlace_portada_libro', 'cover_url')
+}
+
+# Campos del formato markdown
+MARKDOWN_FIELDS = {
+    'autor': 'autor',
+    'imagen de portada': 'portada',
+    'asin': 'asin',
+    'descripción': 'descripcion'
+}
+
+# Secciones del markdown cuyo título no coincide con el nombre del género
+# (el nombre se resuelve después con Genre.resolve / LEGACY_SLUGS)
+MARKDOWN_GENRES = {
+    'Clásicos de la Literatura Universal': 'Clásicos',
+    'Latinoamericanos': 'Latinoamericano'
+}
+
+# Partículas que forman parte del apellido ("Miguel de Cervantes")
+SURNAME_PARTICLES = {'de', 'del', 'da', 'di', 'van', 'von', 'la', 'le', 'y'}
+
+
+def detect_format(filename):
+    """Deducir el formato por la extensión del archivo"""
+    name = (filename or '').lower()
+    if name.endswith(('.ndjson', '.jsonl', '.json')):
+        return 'ndjson'
+    if name.endswith('.csv'):
+        return 'csv'
+    if name.endswith(('.txt', '.md')):
+        return 'markdown'
+    return None
+
+
+# ===== LECTURA =====
+def _read_ndjson(lines):
+    for number, line in enumerate(lines, start=1):
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            record = json.loads(line)
+        except ValueError:
+            yield number, None
+            continue
+        yield number, record if isinstance(record, dict) else None
+
+
+def _read_csv(lines):
+    for number, row in enumerate(csv.DictReader(lines), start=2):
+        yield number, row
+
+
+def _markdown_genre(heading):
+    heading = re.sub(r'^Top\s+\d+\s+', '', heading.strip())
+    heading = re.sub(r'^Libros\s+(de\s+)?', '', heading)
+    return MARKDOWN_GENRES.get(heading, heading)
+
+
+def _read_markdown(lines):
+    genre = None
+    record = None
+    start = None
+    for number, line in enumerate(lines, start=1):
+        line = line.strip()
+        if line.startswith('## '):
+            if record:
+                yield start, record
+            title = re.sub(r'^\d+\.\s*', '', line[3:]).strip()
+            record = {'titulo': title, 'genero': genre}
+            start = number
+        elif line.startswith('# '):
+            if record:
+                yield start, record
+                record = None
+            genre = _markdown_genre(line[2:])
+        elif record is not None:
+            match = re.match(r'^-\s*\*\*(.+?):\*\*\s*(.*)$', line)
+            if match:
+                field = MARKDOWN_FIELDS.get(match.group(1).strip().lower())
+                if field:
+                    record[field] = match.group(2).strip()
+    if record:
+        yield start, record
+
+
+READERS = {'ndjson': _read_ndjson, 'csv': _read_csv, 'markdown': _read_markdown}
+
+
+def _value(raw, field):
+    for key in FIELD_ALIASES[field]:
+        value = raw.get(key)
+        if value is not None and str(value).strip():
+            return str(value).strip()
+    return ''
+
+
+def split_author_name(full_name):
+    """'Miguel de Cervantes' -> ('Miguel', 'de Cervantes'); 'Homero' -> ('Homero', '')"""
+    words = full_name.split()
+    if len(words) <= 1:
+        return full_name.strip(), ''
+    for index, word in enumerate(words[1:], start=1):
+        if word.lower() in SURNAME_PARTICLES:
+            return ' '.join(words[:index]), ' '.join(words[index:])
+    return ' '.join(words[:-1]), words[-1]
+
+
+def author_key(nombre, apellido):
+    """Clave de deduplicación de autores"""
+    return ' '.join(normalize_text(f"{nombre or ''} {apellido or ''}").split())
+
+
+def _clean_record(raw):
+    """Normalizar un registro o lanzar ValueError"""
+    if raw is None:
+        raise ValueError('Registro con formato inválido')
+    titulo = _value(raw, 'titulo')
+    genero = _value(raw, 'genero')
+    asin = _value(raw, 'asin')
+    nombre, apellido = _value(raw, 'nombre_autor'), _value(raw, 'apellido_autor')
+    if not nombre and not apellido:
+        nombre, apellido = split_author_name(_value(raw, 'autor'))
+
+    missing = [name for name, value in (
+        ('titulo', titulo), ('autor', nombre or apellido), ('genero', genero), ('asin', asin)
+    ) if not value]
+    if missing:
+        raise ValueError(f"Faltan campos: {', '.join(missing)}")
+
+    return {
+        'titulo_libro': titulo,
+        'nombre_autor': nombre,
+        'apellido_autor': apellido,
+        'genero': genero,
+        'descripcion_libros': _value(raw, 'descripcion'),
+        'enlace_asin_libro': asin,
+        'enlace_portada_libro': _value(raw, 'portada')
+    }
+
+
+# ===== ESCRITURA =====
+class ImportReport:
+    def __init__(self):
+        self.read = 0
+        self.inserted = 0
+        self.updated = 0
+        self.authors_created = 0
+        self.errors = []
+        self.error_count = 0
+        self._started = time.perf_counter()
+        self.elapsed = 0.0
+
+    def add_error(self, line, message):
+        self.error_count += 1
+        if len(self.errors) < MAX_REPORTED_ERRORS:
+            self.errors.append({'line': line, 'error': message})
+
+    def finish(self):
+        self.elapsed = time.perf_counter() - self._started
+
+    def serialize(self):
+        return {
+            'read': self.read,
+            'inserted': self.inserted,
+            'updated': self.updated,
+            'authors_created': self.authors_created,
+            'errors': self.error_count,
+            'error_samples': self.errors,
+            'elapsed_seconds': round(self.elapsed, 3),
+            'books_per_second': round((self.inserted + self.updated) / self.elapsed, 1) if self.elapsed else None
+        }
+
+
+class CatalogImporter:
+    def __init__(self, batch_size=DEFAULT_BATCH_SIZE):
+        self.batch_size = batch_size
+        self.report = ImportReport()
+        self.genre_ids = set()
+        # ASIN -> línea de su primera aparición en el archivo
+        self.asin_lines = {}
+        # Autores y géneros existentes en memoria: una consulta cada uno
+        self.authors = {
+            author_key(nombre, apellido): id_autor
+            for id_autor, nombre, apellido in db.session.execute(
+                select(Author.id_autor, Author.nombre_autor, Author.apellido_autor)
+            )
+        }
+        self.genres = {
+            slug: (id_genero, nombre)
+            for id_genero, slug, nombre in db.session.execute(
+                select(Genre.id_genero, Genre.slug, Genre.nombre_genero)
+            )
+        }
+
+    def _genre(self, nombre):
+        slug = LEGACY_SLUGS.get(nombre, slugify(nombre))
+        if slug not in self.genres:
+            genre = Genre.resolve(nombre)
+            self.genres[slug] = (genre.id_genero, genre.nombre_genero)
+        return self.genres[slug]
+
+    def _create_authors(self, records):
+        new_authors = {}
+        for record in records:
+            key = author_key(record['nombre_autor'], record['apellido_autor'])
+            if key not in self.authors and key not in new_authors:
+                new_authors[key] = {
+                    'nombre_autor': record['nombre_autor'],
+                    'apellido_autor': record['apellido_autor']
+                }
+        if not new_authors:
+            return
+        rows = db.session.execute(
+            insert(Author.__table__).returning(Author.id_autor, sort_by_parameter_order=True),
+            list(new_authors.values())
+        )
+        for key, id_autor in zip(new_authors, rows.scalars()):
+            self.authors[key] = id_autor
+        self.report.authors_created += len(new_authors)
+
+    def _write_batch(self, records):
+        self._create_authors(records)
+
+        existing = {}
+        for id_libros, asin, id_genero in db.session.execute(
+            select(Book.id_libros, Book.enlace_asin_libro, Book.id_genero)
+            .where(Book.enlace_asin_libro.in_([record['enlace_asin_libro'] for record in records]))
+        ):
+            existing[asin] = id_libros
+            self.genre_ids.add(id_genero)
+
+        inserts, updates, batch_ids = [], [], []
+        for record in records:
+            id_genero, nombre_genero = self._genre(record['genero'])
+            self.genre_ids.add(id_genero)
+            row = {
+                'titulo_libro': record['titulo_libro'],
+                'id_autor': self.authors[author_key(record['nombre_autor'], record['apellido_autor'])],
+                'id_genero': id_genero,
+                'genero_libro': nombre_genero,
+                'descripcion_libros': record['descripcion_libros'],
+                'enlace_asin_libro': record['enlace_asin_libro'],
+                'enlace_portada_libro': record['enlace_portada_libro']
+            }
+            if record['enlace_asin_libro'] in existing:
+                row['id_libros'] = existing[record['enlace_asin_libro']]
+                updates.append(row)
+            else:
+                inserts.append(row)
+
+        if inserts:
+            rows = db.session.execute(
+                insert(Book.__table__).returning(Book.id_libros, sort_by_parameter_order=True),
+                inserts
+            )
+            batch_ids.extend(rows.scalars())
+        if updates:
+            # UPDATE por clave primaria en executemany
+            db.session.execute(update(Book), updates)
+            batch_ids.extend(row['id_libros'] for row in updates)
+
+        search.index_books(batch_ids)
+        self.report.inserted += len(inserts)
+        self.report.updated += len(updates)
+
+    def run(self, numbered_records):
+        iterator = iter(numbered_records)
+        while True:
+            chunk = list(islice(iterator, self.batch_size))
+            if not chunk:
+                break
+            batch = []
+            for line, raw in chunk:
+                self.report.read += 1
+                try:
+                    record = _clean_record(raw)
+                except ValueError as e:
+                    self.report.add_error(line, str(e))
+                    continue
+                # Un ASIN repetido en el archivo se rechaza: se conserva la primera aparición
+                asin = record['enlace_asin_libro']
+                if asin in self.asin_lines:
+                    self.report.add_error(line, f"ASIN {asin} duplicado (ya aparece en la línea {self.asin_lines[asin]})")
+                    continue
+                self.asin_lines[asin] = line
+                batch.append(record)
+            if batch:
+                self._write_batch(batch)
+
+        genre_stats.refresh_genres(self.genre_ids)
+        return self.report
+
+
+def import_catalog(lines, fmt, batch_size=DEFAULT_BATCH_SIZE):
+    """
+    Importar desde un iterable de líneas de texto y confirmar la transacción.
+    Devuelve un ImportReport; si algo falla se deshace todo el import.
+    """
+    from app.autocomplete import author_index
+    from app.cache import cache
+    from app.conditional import bump_catalog_version
+
+    if fmt not in READERS:
+        raise ValueError(f"Formato no soportado: {fmt} (use {', '.join(FORMATS)})")
+
+    importer = CatalogImporter(batch_size)
+    try:
+        report = importer.run(READERS[fmt](lines))
+        if report.inserted or report.updated:
+            bump_catalog_version()
+        db.session.commit()
+    except Exception:
+        db.session.rollback()
+        raise
+
+    if report.inserted or report.updated:
+        cache.invalidate('catalog')
+        author_index.build()
+    report.finish()
+    return report
+
+
+def register_import_commands(app):
+    @app.cli.command('catalog-import')
+    @click.argument('path', type=click.Path(exists=True, dir_okay=False))
+    @click.option('--format', 'fmt', type=click.Choice(FORMATS), default=None,
+                  help='Formato de entrada (por defecto se deduce de la extensión)')
+    @click.option('--batch-size', default=DEFAULT_BATCH_SIZE, show_default=True)
+    def catalog_import(path, fmt, batch_size):
+        """Importar libros y autores desde NDJSON, CSV o el markdown de libros"""
+        fmt = fmt or detect_format(path)
+        if fmt is None:
+            raise click.UsageError('No se pudo deducir el formato; use --format')
+        with open(path, encoding='utf-8-sig', newline='') as handle:
+            report = import_catalog(handle, fmt, batch_size)
+        data = report.serialize()
+        print(f"✅ Importados {data['inserted']} libros nuevos y {data['updated']} actualizados "
+              f"({data['authors_created']} autores nuevos) en {data['elapsed_seconds']}s "
+              f"- {data['books_per_second']} libros/s")
+        if data['errors']:
+            print(f"⚠️ {data['errors']} registros con errores:")
+            for error in data['error_samples']:
+                print(f"   línea {error['line']}: {error['error']}")
@@ -0,0 +1,113 @@
+# app/conditional.py
+"""
+Respuestas condicionales (ETag / Last-Modified) para los endpoints del catálogo.
+
+La versión del catálogo vive en la tabla version_catalogo y la incrementan las
+escrituras de admin sobre libros y autores. Cada proceso la guarda en memoria
+durante CATALOG_VERSION_TTL segundos, así que un If-None-Match válido se
+responde con 304 sin ejecutar la vista ni consultar el ORM.
+
+El ETag combina la versión con el instante exacto de su última escritura:
+si la tabla se vacía o se vuelve a sembrar la versión empieza otra vez en 1,
+pero el ETag no coincide con ninguno emitido antes.
+"""
+import threading
+import time
+from datetime import datetime, timezone
+from functools import wraps
+from flask import current_app, request, make_response
+from sqlalchemy import select, update, insert
+from app.database import db
+from app.models import CatalogVersion
+
+DEFAULT_VERSION_TTL = 2
+DEFAULT_CACHE_CONTROL = 'public, max-age=60'
+
+_lock = threading.Lock()
+_cached = {'version': None, 'updated_at': None, 'etag': None, 'expires': 0.0}
+
+
+def _table():
+    return CatalogVersion.__table__
+
+
+def init_catalog_version(app):
+    """Crear la fila de versión si todavía no existe"""
+    app.config.setdefault('CATALOG_VERSION_TTL', DEFAULT_VERSION_TTL)
+    app.config.setdefault('CATALOG_CACHE_CONTROL', DEFAULT_CACHE_CONTROL)
+    table = _table()
+    if db.session.execute(select(table.c.id).where(table.c.id == 1)).first() is None:
+        db.session.execute(insert(table).values(id=1, version=1, updated_at=datetime.utcnow()))
+        db.session.commit()
+
+
+def bump_catalog_version():
+    """Incrementar la versión dentro de la transacción del llamador"""
+    table = _table()
+    db.session.execute(
+        update(table)
+        .where(table.c.id == 1)
+        .values(version=table.c.version + 1, updated_at=datetime.utcnow())
+    )
+    # Forzar relectura en este proceso en la próxima petición
+    _cached['expires'] = 0.0
+
+
+def get_catalog_version():
+    """Devolver (version, updated_at) usando la copia en memoria si no ha expirado"""
+    version, updated_at, _ = _catalog_validators()
+    return version, updated_at
+
+
+def _catalog_validators():
+    """(version, updated_at sin microsegundos, etag)"""
+    now = time.monotonic()
+    if _cached['version'] is not None and now < _cached['expires']:
+        return _cached['version'], _cached['updated_at'], _cached['etag']
+
+    with _lock:
+        table = _table()
+        row = db.session.execute(
+            select(table.c.version, table.c.updated_at).where(table.c.id == 1)
+        ).first()
+        version, updated_at = row if row else (0, datetime.utcnow())
+        if updated_at.tzinfo is None:
+            updated_at = updated_at.replace(tzinfo=timezone.utc)
+        _cached.update(
+            version=version,
+            updated_at=updated_at.replace(microsecond=0),
+            etag=f'catalog-{version}-{int(updated_at.timestamp() * 1000000):x}',
+            expires=now + current_app.config.get('CATALOG_VERSION_TTL', DEFAULT_VERSION_TTL)
+        )
+        return _cached['version'], _cached['updated_at'], _cached['etag']
+
+
+def _not_modified(etag, last_modified):
+    if request.if_none_match:
+        return request.if_none_match.contains(etag)
+    if request.if_modified_since:
+        return last_modified <= request.if_modified_since
+    return False
+
+
+def _set_validators(response, etag, last_modified):
+    response.set_etag(etag)
+    response.last_modified = last_modified
+    response.headers['Cache-Control'] = current_app.config.get('CATALOG_CACHE_CONTROL', DEFAULT_CACHE_CONTROL)
+    return response
+
+
+def catalog_conditional(view):
+    """Decorador para rutas GET cuyo contenido solo depende del catálogo"""
+    @wraps(view)
+    def wrapper(*args, **kwargs):
+        version, last_modified, etag = _catalog_validators()
+
+        if _not_modified(etag, last_modified):
+            return _set_validators(make_response('', 304), etag, last_modified)
+
+        response = make_response(view(*args, **kwargs))
+        if response.status_code == 200:
+            _set_validators(response, etag, last_modified)
+        return response
+    return wrapper
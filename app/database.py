@@ -1,5 +1,27 @@
 from flask_sqlalchemy import SQLAlchemy
 from flask_migrate import Migrate
+from app.db_routing import RoutingSession
 
-db = SQLAlchemy()
+# RoutingSession envía las lecturas de peticiones GET a las réplicas si las hay
+db = SQLAlchemy(session_options={'class_': RoutingSession})
 migrate = Migrate()
+
+
+def upsert_increment(table, key, delta):
+    """
+    Sumar `delta` (columna -> incremento) a la fila `key` (columna -> valor)
+    o crearla con esos valores, en una sola sentencia INSERT ... ON CONFLICT
+    para que dos transacciones concurrentes no choquen con la clave primaria.
+    """
+    dialect = db.engine.dialect.name
+    if dialect == 'postgresql':
+        from sqlalchemy.dialects.postgresql import insert
+    elif dialect == 'sqlite':
+        from sqlalchemy.dialects.sqlite import insert
+    else:
+        raise NotImplementedError(f'upsert no soportado en {dialect}')
+    statement = insert(table).values(**key, **delta)
+    return db.session.execute(statement.on_conflict_do_update(
+        index_elements=[table.c[column] for column in key],
+        set_={column: table.c[column] + statement.excluded[column] for column in delta}
+    ))
@@ -0,0 +1,154 @@
+# app/db_routing.py
+"""
+Enrutado de lecturas a réplicas.
+
+Con DATABASE_REPLICA_URLS (URLs separadas por comas) cada réplica se registra
+como bind 'replica_<n>' y db.session envía a una de ellas las consultas de las
+peticiones GET/HEAD. El resto de peticiones, los flush, las sentencias
+INSERT/UPDATE/DELETE y todo lo que se ejecuta fuera de una petición (CLI,
+seed, arranque) va al primario.
+
+Read-your-writes: tras una petición que modifica datos (método no seguro con
+respuesta < 400) las lecturas de ese cliente van al primario durante
+DB_READ_YOUR_WRITES_SECONDS. El cliente se identifica por el JWT (o la IP si
+no hay token) en memoria del proceso y, para que también valga en otros
+procesos, con la cabecera X-DB-Primary-Until de la respuesta y una cookie de la
+misma duración. El frontend está en otro origen, así que la cookie se envía con
+SameSite=None; Secure en las peticiones cross-origin; si el navegador no la
+guarda, el cliente puede reenviar la cabecera tal cual en sus siguientes peticiones.
+
+    @books_bp.route('/books/<int:book_id>/fresh', methods=['GET'])
+    @use_primary
+    def ...: ...   # GET que necesita leer del primario siempre
+"""
+import itertools
+import threading
+import time
+from functools import wraps
+from flask import g, has_request_context, request
+from flask_jwt_extended import get_jwt, verify_jwt_in_request
+from flask_sqlalchemy.session import Session
+
+DEFAULT_STICKY_SECONDS = 5
+STICKY_COOKIE = 'db_primary_until'
+STICKY_HEADER = 'X-DB-Primary-Until'
+SAFE_METHODS = ('GET', 'HEAD', 'OPTIONS')
+MAX_STICKY_CLIENTS = 100000
+
+
+class RoutingSession(Session):
+    """Session de Flask-SQLAlchemy que cambia el bind por defecto por una réplica"""
+
+    def get_bind(self, mapper=None, clause=None, bind=None, **kwargs):
+        engine = super().get_bind(mapper=mapper, clause=clause, bind=bind, **kwargs)
+        if bind is not None or not has_request_context():
+            return engine
+        replica = g.get('db_replica')
+        if replica is None or self._flushing or getattr(clause, 'is_dml', False):
+            return engine
+        engines = self._db.engines
+        if engine is not engines.get(None):
+            return engine
+        return engines[replica]
+
+
+def _is_cross_origin():
+    """La petición viene de otro origen (frontend en otro dominio)"""
+    origin = request.headers.get('Origin')
+    return bool(origin) and origin.rstrip('/') != request.host_url.rstrip('/')
+
+
+class ReadRouter:
+    def __init__(self):
+        self.replicas = []
+        self.sticky_seconds = DEFAULT_STICKY_SECONDS
+        self._next_replica = itertools.cycle([None])
+        self._sticky = {}
+        self._lock = threading.Lock()
+
+    def configure(self, app):
+        """Registrar las réplicas como binds (llamar antes de db.init_app)"""
+        from app.engine_config import engine_options
+        urls = app.config.get('DATABASE_REPLICA_URLS') or []
+        if isinstance(urls, str):
+            urls = [url.strip() for url in urls.split(',') if url.strip()]
+        binds = dict(app.config.get('SQLALCHEMY_BINDS') or {})
+        self.replicas = []
+        for index, url in enumerate(urls):
+            key = f'replica_{index}'
+            binds[key] = {'url': url, **engine_options(app, url)}
+            self.replicas.append(key)
+        app.config['SQLALCHEMY_BINDS'] = binds
+
+    def init_app(self, app):
+        self.sticky_seconds = float(app.config.get('DB_READ_YOUR_WRITES_SECONDS', DEFAULT_STICKY_SECONDS))
+        self._next_replica = itertools.cycle(self.replicas or [None])
+        with self._lock:
+            self._sticky.clear()
+        if not self.replicas:
+            return
+        app.before_request(self._choose_bind)
+        app.after_request(self._remember_writes)
+
+    def _client_key(self):
+        try:
+            verify_jwt_in_request(optional=True)
+            claims = get_jwt()
+        except Exception:
+            claims = {}
+        if claims.get('sub') is not None:
+            kind = 'admin' if claims.get('is_admin') else 'user'
+            return f"{kind}:{claims['sub']}"
+        return f'ip:{request.remote_addr}'
+
+    def _is_sticky(self, key):
+        now = time.time()
+        for value in (request.headers.get(STICKY_HEADER), request.cookies.get(STICKY_COOKIE)):
+            try:
+                until = float(value or 0)
+            except ValueError:
+                continue
+            # Se ignoran valores más lejanos que la ventana configurada
+            if now < until <= now + self.sticky_seconds + 1:
+                return True
+        with self._lock:
+            return self._sticky.get(key, 0) > now
+
+    def _choose_bind(self):
+        g.db_replica = None
+        if request.method not in SAFE_METHODS:
+            return
+        if self._is_sticky(self._client_key()):
+            return
+        with self._lock:
+            g.db_replica = next(self._next_replica)
+
+    def _remember_writes(self, response):
+        if request.method in SAFE_METHODS or response.status_code >= 400 or self.sticky_seconds <= 0:
+            return response
+        until = time.time() + self.sticky_seconds
+        with self._lock:
+            self._sticky[self._client_key()] = until
+            if len(self._sticky) > MAX_STICKY_CLIENTS:
+                now = time.time()
+                self._sticky = {key: value for key, value in self._sticky.items() if value > now}
+        response.headers[STICKY_HEADER] = f'{until:.3f}'
+        cross_origin = _is_cross_origin()
+        response.set_cookie(
+            STICKY_COOKIE, f'{until:.3f}',
+            max_age=max(1, int(self.sticky_seconds)), httponly=True,
+            samesite='None' if cross_origin else 'Lax', secure=cross_origin or request.is_secure
+        )
+        return response
+
+
+read_router = ReadRouter()
+
+
+def use_primary(view):
+    """Forzar el primario en una ruta GET que necesita datos recién escritos"""
+    @wraps(view)
+    def wrapper(*args, **kwargs):
+        g.db_replica = None
+        return view(*args, **kwargs)
+    return wrapper
@@ -0,0 +1,192 @@
+# app/engine_config.py
+"""
+Configuración del engine y del pool de conexiones según el dialecto.
+
+configure_engine(app) rellena SQLALCHEMY_ENGINE_OPTIONS antes de
+db.init_app (las réplicas de app/db_routing.py usan engine_options para sus
+binds); init_engine(app) registra después los eventos de conexión y del pool
+de cada engine. Todos los valores se leen de app.config o, si no están, del entorno:
+
+PostgreSQL
+- DB_POOL_SIZE (5), DB_MAX_OVERFLOW (10), DB_POOL_TIMEOUT (30 s),
+  DB_POOL_RECYCLE (1800 s), DB_POOL_PRE_PING (true)
+- DB_STATEMENT_TIMEOUT_MS (30000; 0 lo desactiva, p. ej. para comandos de
+  mantenimiento largos)
+
+SQLite (archivo)
+- DB_SQLITE_BUSY_TIMEOUT_MS (5000): espera al lock en lugar de fallar con
+  "database is locked"
+- DB_SQLITE_JOURNAL_MODE (WAL): lectores y un escritor en paralelo
+- DB_SQLITE_SYNCHRONOUS (NORMAL): seguro con WAL y sin fsync por commit
+- DB_SQLITE_MMAP_SIZE (268435456 bytes)
+- DB_POOL_SIZE / DB_MAX_OVERFLOW / DB_POOL_TIMEOUT como en PostgreSQL
+
+pool_stats.snapshot() devuelve el estado del pool y los contadores de
+checkouts, conexiones nuevas e invalidaciones de este proceso.
+"""
+import os
+import threading
+from sqlalchemy import event
+from sqlalchemy.engine import make_url
+from app.database import db
+
+DEFAULTS = {
+    'DB_POOL_SIZE': 5,
+    'DB_MAX_OVERFLOW': 10,
+    'DB_POOL_TIMEOUT': 30,
+    'DB_POOL_RECYCLE': 1800,
+    'DB_POOL_PRE_PING': True,
+    'DB_STATEMENT_TIMEOUT_MS': 30000,
+    'DB_SQLITE_BUSY_TIMEOUT_MS': 5000,
+    'DB_SQLITE_JOURNAL_MODE': 'WAL',
+    'DB_SQLITE_SYNCHRONOUS': 'NORMAL',
+    'DB_SQLITE_MMAP_SIZE': 268435456
+}
+SQLITE_JOURNAL_MODES = ('DELETE', 'TRUNCATE', 'PERSIST', 'MEMORY', 'WAL', 'OFF')
+SQLITE_SYNCHRONOUS = ('OFF', 'NORMAL', 'FULL', 'EXTRA')
+
+
+def _setting(app, name):
+    value = app.config.get(name, os.getenv(name))
+    default = DEFAULTS[name]
+    if value is None or value == '':
+        return default
+    if isinstance(default, bool):
+        return value if isinstance(value, bool) else str(value).lower() in ('1', 'true', 'yes', 'on')
+    if isinstance(default, int):
+        return int(value)
+    return str(value).upper()
+
+
+def _is_sqlite_file(url):
+    return url.get_backend_name() == 'sqlite' and url.database not in (None, '', ':memory:')
+
+
+def engine_options(app, uri):
+    """Opciones de create_engine para la URI indicada"""
+    url = make_url(uri)
+    backend = url.get_backend_name()
+
+    if backend in ('postgresql', 'postgres'):
+        options = {
+            'pool_size': _setting(app, 'DB_POOL_SIZE'),
+            'max_overflow': _setting(app, 'DB_MAX_OVERFLOW'),
+            'pool_timeout': _setting(app, 'DB_POOL_TIMEOUT'),
+            'pool_recycle': _setting(app, 'DB_POOL_RECYCLE'),
+            'pool_pre_ping': _setting(app, 'DB_POOL_PRE_PING')
+        }
+        statement_timeout = _setting(app, 'DB_STATEMENT_TIMEOUT_MS')
+        if statement_timeout > 0:
+            options['connect_args'] = {'options': f'-c statement_timeout={statement_timeout}'}
+        return options
+
+    if _is_sqlite_file(url):
+        return {
+            'pool_size': _setting(app, 'DB_POOL_SIZE'),
+            'max_overflow': _setting(app, 'DB_MAX_OVERFLOW'),
+            'pool_timeout': _setting(app, 'DB_POOL_TIMEOUT'),
+            # timeout de sqlite3 = busy_timeout en segundos
+            'connect_args': {'timeout': _setting(app, 'DB_SQLITE_BUSY_TIMEOUT_MS') / 1000}
+        }
+
+    # SQLite en memoria u otros dialectos: valores por defecto de SQLAlchemy
+    return {}
+
+
+def configure_engine(app):
+    """Rellenar SQLALCHEMY_ENGINE_OPTIONS (llamar antes de db.init_app)"""
+    options = engine_options(app, app.config['SQLALCHEMY_DATABASE_URI'])
+    options.update(app.config.get('SQLALCHEMY_ENGINE_OPTIONS', {}))
+    app.config['SQLALCHEMY_ENGINE_OPTIONS'] = options
+
+
+def _sqlite_pragmas(app):
+    journal_mode = _setting(app, 'DB_SQLITE_JOURNAL_MODE')
+    synchronous = _setting(app, 'DB_SQLITE_SYNCHRONOUS')
+    if journal_mode not in SQLITE_JOURNAL_MODES:
+        raise ValueError(f'DB_SQLITE_JOURNAL_MODE no válido: {journal_mode}')
+    if synchronous not in SQLITE_SYNCHRONOUS:
+        raise ValueError(f'DB_SQLITE_SYNCHRONOUS no válido: {synchronous}')
+    return [
+        f'PRAGMA journal_mode={journal_mode}',
+        f'PRAGMA synchronous={synchronous}',
+        f'PRAGMA busy_timeout={_setting(app, "DB_SQLITE_BUSY_TIMEOUT_MS")}',
+        f'PRAGMA mmap_size={_setting(app, "DB_SQLITE_MMAP_SIZE")}',
+        'PRAGMA temp_store=MEMORY'
+    ]
+
+
+def _sqlite_pragma_listener(pragmas):
+    def set_sqlite_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        for pragma in pragmas:
+            cursor.execute(pragma)
+        cursor.close()
+    return set_sqlite_pragmas
+
+
+class PoolStats:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counters = {}
+        self._engines = {}
+
+    def _increment(self, name, counter):
+        with self._lock:
+            counters = self._counters[name]
+            counters[counter] += 1
+            if counter == 'checkouts':
+                counters['checked_out'] += 1
+                counters['max_checked_out'] = max(counters['max_checked_out'], counters['checked_out'])
+            elif counter == 'checkins':
+                counters['checked_out'] -= 1
+
+    def attach(self, engine, name='default'):
+        """Contar los eventos del pool de engine"""
+        with self._lock:
+            self._engines[name] = engine
+            self._counters[name] = {
+                'connects': 0, 'checkouts': 0, 'checkins': 0, 'invalidations': 0,
+                'checked_out': 0, 'max_checked_out': 0
+            }
+        event.listen(engine, 'connect', lambda *args: self._increment(name, 'connects'))
+        event.listen(engine, 'checkout', lambda *args: self._increment(name, 'checkouts'))
+        event.listen(engine, 'checkin', lambda *args: self._increment(name, 'checkins'))
+        event.listen(engine, 'invalidate', lambda *args: self._increment(name, 'invalidations'))
+
+    def snapshot(self):
+        """Estado actual de cada pool y contadores acumulados de este proceso"""
+        result = {}
+        with self._lock:
+            engines = dict(self._engines)
+            counters = {name: dict(values) for name, values in self._counters.items()}
+        for name, engine in engines.items():
+            pool = engine.pool
+            stats = {
+                'dialect': engine.dialect.name,
+                'pool_class': type(pool).__name__,
+                'status': pool.status()
+            }
+            # Solo QueuePool expone tamaño y overflow
+            for method in ('size', 'checkedin', 'checkedout', 'overflow'):
+                if hasattr(pool, method):
+                    stats[method] = getattr(pool, method)()
+            if hasattr(pool, '_max_overflow'):
+                stats['max_overflow'] = pool._max_overflow
+            stats.update(counters[name])
+            stats.pop('checked_out')
+            result[name] = stats
+        return result
+
+
+pool_stats = PoolStats()
+
+
+def init_engine(app):
+    """Registrar los PRAGMA de SQLite y las estadísticas del pool (después de db.init_app)"""
+    with app.app_context():
+        engines = dict(db.engines)
+    for key, engine in engines.items():
+        if _is_sqlite_file(engine.url):
+            event.listen(engine, 'connect', _sqlite_pragma_listener(_sqlite_pragmas(app)))
+        pool_stats.attach(engine, key or 'default')
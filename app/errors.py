@@ -25,9 +25,19 @@ def not_found(message):
 def conflict(message):
     return error_response(409, message)
 
+def too_many_requests(message, retry_after=1):
+    response = error_response(429, message)
+    response.headers['Retry-After'] = str(retry_after)
+    return response
+
 def internal_error(message):
     return error_response(500, message)
 
+def service_unavailable(message, retry_after=1):
+    response = error_response(503, message)
+    response.headers['Retry-After'] = str(retry_after)
+    return response
+
 def register_error_handlers(app):
     @app.errorhandler(400)
     def bad_request_error(error):
@@ -0,0 +1,107 @@
+# app/genre_stats.py
+"""
+Mantenimiento de la tabla estadisticas_genero.
+
+Crear, editar o borrar un libro ajusta los contadores de su género de forma
+incremental (el índice ix_libros_genero_autor sobre (id_genero, id_autor)
+resuelve si el autor sigue teniendo libros en ese género). Los cambios masivos recalculan los géneros
+afectados con un INSERT ... SELECT agrupado. Llamar siempre después de que
+el cambio del libro esté en la sesión (flush) y antes del commit.
+"""
+from sqlalchemy import select, insert, delete, func
+from app.database import db, upsert_increment
+from sqlalchemy.orm import joinedload
+from app.models import Book, Genre, GenreStats
+
+
+def _author_books_in_genre(genre_id, author_id):
+    return db.session.query(func.count(Book.id_libros))\
+        .filter(Book.id_genero == genre_id, Book.id_autor == author_id)\
+        .scalar()
+
+
+def _apply(genre_id, books_delta, authors_delta):
+    table = GenreStats.__table__
+    upsert_increment(table, {'id_genero': genre_id}, {
+        'total_libros': books_delta, 'total_autores': authors_delta
+    })
+    db.session.execute(delete(table).where(
+        table.c.id_genero == genre_id, table.c.total_libros <= 0
+    ))
+
+
+def book_added(genre_id, author_id):
+    """El libro ya está en la sesión: si es el único del autor en el género, suma un autor"""
+    db.session.flush()
+    is_new_author = _author_books_in_genre(genre_id, author_id) == 1
+    _apply(genre_id, 1, 1 if is_new_author else 0)
+
+
+def book_removed(genre_id, author_id):
+    """El libro ya se borró en la sesión: si el autor no tiene más en el género, resta un autor"""
+    db.session.flush()
+    author_gone = _author_books_in_genre(genre_id, author_id) == 0
+    _apply(genre_id, -1, -1 if author_gone else 0)
+
+
+def book_genre_changed(old_genre_id, new_genre_id, author_id):
+    if old_genre_id == new_genre_id:
+        return
+    book_removed(old_genre_id, author_id)
+    book_added(new_genre_id, author_id)
+
+
+def _aggregate_query():
+    return select(
+        Book.id_genero,
+        func.count(Book.id_libros),
+        func.count(func.distinct(Book.id_autor))
+    ).group_by(Book.id_genero)
+
+
+def refresh_genres(genre_ids):
+    """Recalcular los géneros indicados (p. ej. tras borrar todos los libros de un autor)"""
+    genre_ids = list(set(genre_ids))
+    if not genre_ids:
+        return
+    table = GenreStats.__table__
+    db.session.flush()
+    db.session.execute(delete(table).where(table.c.id_genero.in_(genre_ids)))
+    db.session.execute(insert(table).from_select(
+        ['id_genero', 'total_libros', 'total_autores'],
+        _aggregate_query().where(Book.id_genero.in_(genre_ids))
+    ))
+
+
+def rebuild_genre_stats():
+    """Recalcular toda la tabla desde libros"""
+    table = GenreStats.__table__
+    db.session.execute(delete(table))
+    db.session.execute(insert(table).from_select(
+        ['id_genero', 'total_libros', 'total_autores'], _aggregate_query()
+    ))
+    db.session.commit()
+    return db.session.query(GenreStats).count()
+
+
+def get_genre_stats():
+    """Filas de estadisticas_genero ordenadas por nombre y el total de libros del catálogo"""
+    genres = GenreStats.query.join(Genre)\
+        .options(joinedload(GenreStats.genero))\
+        .order_by(Genre.nombre_genero)\
+        .all()
+    return genres, sum(genre.total_libros for genre in genres)
+
+
+def init_genre_stats(app):
+    """Poblar la tabla al arrancar si está vacía y ya hay libros"""
+    if db.session.query(GenreStats).first() is None and db.session.query(Book).first() is not None:
+        rebuild_genre_stats()
+
+
+def register_genre_stats_commands(app):
+    @app.cli.command('genre-stats-rebuild')
+    def genre_stats_rebuild():
+        """Recalcular estadisticas_genero desde cero"""
+        total = rebuild_genre_stats()
+        print(f"✅ Estadísticas recalculadas para {total} géneros")
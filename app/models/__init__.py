@@ -1,8 +1,12 @@
 from app.models.user import User
 from app.models.book import Book
 from app.models.author import Author
+from app.models.genre import Genre
 from app.models.rating import Rating
 from app.models.user_library import UserLibrary
 from app.models.admin import Admin
+from app.models.book_rating_stats import BookRatingStats
+from app.models.catalog_version import CatalogVersion
+from app.models.genre_stats import GenreStats
 
-__all__ = ['User', 'Book', 'Author', 'Rating', 'UserLibrary','Admin']
\ No newline at end of file
+__all__ = ['User', 'Book', 'Author', 'Genre', 'Rating', 'UserLibrary','Admin', 'BookRatingStats', 'CatalogVersion', 'GenreStats']
\ No newline at end of file
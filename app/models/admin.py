@@ -2,8 +2,8 @@ from datetime import datetime
 from typing import Optional
 from sqlalchemy import String, Boolean, DateTime, func
 from sqlalchemy.orm import Mapped, mapped_column
-from werkzeug.security import generate_password_hash, check_password_hash
 from app import db
+from app.passwords import passwords
 
 class Admin(db.Model):
     __tablename__ = 'admins'
@@ -26,14 +26,18 @@ class Admin(db.Model):
     def __init__(self, nombre_admin: str, email_admin: str, password_admin: str, is_active: bool=True):
         self.nombre_admin = nombre_admin
         self.email_admin = email_admin
-        self.password_admin = generate_password_hash(password_admin)
+        self.password_admin = passwords.hash(password_admin)
         self.is_active = is_active
 
     def set_password(self, password: str) -> None:
-        self.password_admin = generate_password_hash(password)
+        self.password_admin = passwords.hash(password)
 
     def check_password(self, password: str) -> bool:
-        return check_password_hash(self.password_admin, password)
+        """Verificar la contraseña y actualizar el hash si cambió el método o el coste"""
+        ok, new_hash = passwords.verify_and_update(self.password_admin, password)
+        if new_hash:
+            self.password_admin = new_hash
+        return ok
     
     def serialize(self) -> dict:
         return {
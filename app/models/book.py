@@ -1,15 +1,22 @@
 from app import db
 from datetime import datetime
 from typing import List, Dict, Any, Optional
-from sqlalchemy import String, DateTime, ForeignKey, Text, func
+from sqlalchemy import String, DateTime, ForeignKey, Index, Text, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 class Book(db.Model):
     __tablename__ = 'libros'
+    __table_args__ = (
+        Index('ix_libros_id_autor', 'id_autor'),
+        # Cubre los filtros y agregados por género (conteo de autores distintos)
+        Index('ix_libros_genero_autor', 'id_genero', 'id_autor'),
+    )
 
     id_libros: Mapped[int] = mapped_column(primary_key=True)
     titulo_libro: Mapped[str] = mapped_column(String(200), nullable=False)
-    id_autor: Mapped[int] = mapped_column(ForeignKey('autores.id_autor'), nullable=False)
+    id_autor: Mapped[int] = mapped_column(ForeignKey('autores.id_autor', ondelete='CASCADE'), nullable=False)
+    id_genero: Mapped[int] = mapped_column(ForeignKey('generos.id_genero'), nullable=False)
+    # Copia del nombre del género para mantener la forma de la API; filtrar siempre por id_genero
     genero_libro: Mapped[str] = mapped_column(String(50), nullable=False)
     descripcion_libros: Mapped[str] = mapped_column(Text, nullable=False)
     enlace_asin_libro: Mapped[str] = mapped_column(String(100), nullable=False)
@@ -31,6 +38,15 @@ class Book(db.Model):
     calificaciones: Mapped[List["Rating"]] = relationship(back_populates="libro")
     biblioteca: Mapped[List["UserLibrary"]] = relationship(back_populates="libro")
     autor: Mapped["Author"] = relationship(back_populates="libros")
+    genero: Mapped["Genre"] = relationship(back_populates="libros")
+
+    def set_genre(self, nombre: str) -> None:
+        """Asignar el género por nombre (lo crea en generos si no existe)"""
+        from app.models.genre import Genre
+        genre = Genre.resolve(nombre)
+        self.genero = genre
+        self.id_genero = genre.id_genero
+        self.genero_libro = genre.nombre_genero
 
     def serialize(self) -> Dict[str, Any]:
         return {
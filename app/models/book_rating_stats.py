@@ -0,0 +1,38 @@
+from app import db
+from typing import Dict, Any
+from sqlalchemy import Integer, ForeignKey
+from sqlalchemy.orm import Mapped, mapped_column
+
+class BookRatingStats(db.Model):
+    """
+    Agregados de calificaciones por libro (solo usuarios activos)
+    Se mantienen de forma incremental desde app/rating_stats.py
+    """
+    __tablename__ = 'estadisticas_calificacion'
+
+    id_libro: Mapped[int] = mapped_column(ForeignKey('libros.id_libros', ondelete='CASCADE'), primary_key=True)
+    total_resenas: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    total_calificadas: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    suma_calificaciones: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    estrellas_1: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    estrellas_2: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    estrellas_3: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    estrellas_4: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    estrellas_5: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    total_con_texto: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+
+    def serialize(self) -> Dict[str, Any]:
+        average = self.suma_calificaciones / self.total_calificadas if self.total_calificadas else 0
+        return {
+            "total_reviews": self.total_resenas,
+            "average_rating": round(float(average), 2),
+            "rated_count": self.total_calificadas,
+            "text_reviews": self.total_con_texto,
+            "histogram": {
+                "1": self.estrellas_1,
+                "2": self.estrellas_2,
+                "3": self.estrellas_3,
+                "4": self.estrellas_4,
+                "5": self.estrellas_5
+            }
+        }
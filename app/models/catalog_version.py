@@ -0,0 +1,19 @@
+from app import db
+from datetime import datetime
+from sqlalchemy import Integer, DateTime
+from sqlalchemy.orm import Mapped, mapped_column
+
+class CatalogVersion(db.Model):
+    """
+    Fila única con la versión del catálogo (libros y autores)
+    Se incrementa en cada escritura de admin y alimenta ETag/Last-Modified
+    """
+    __tablename__ = 'version_catalogo'
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    version: Mapped[int] = mapped_column(Integer, default=1, nullable=False)
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime,
+        default=datetime.utcnow,
+        nullable=False
+    )
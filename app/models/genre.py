@@ -0,0 +1,57 @@
+import re
+from app import db
+from datetime import datetime
+from typing import List, Dict, Any
+from sqlalchemy import String, DateTime
+from sqlalchemy.orm import Mapped, mapped_column, relationship
+from app.search import normalize_text
+
+# Slugs que ya usaba el frontend y no coinciden con slugify(nombre)
+LEGACY_SLUGS = {
+    'Latinoamericano': 'latinoamericanos'
+}
+
+def slugify(value: str) -> str:
+    """'Ciencia Ficción' -> 'ciencia-ficcion'"""
+    return re.sub(r'[^a-z0-9]+', '-', normalize_text(value)).strip('-')
+
+class Genre(db.Model):
+    __tablename__ = 'generos'
+
+    id_genero: Mapped[int] = mapped_column(primary_key=True)
+    slug: Mapped[str] = mapped_column(String(60), unique=True, nullable=False)
+    nombre_genero: Mapped[str] = mapped_column(String(50), unique=True, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime,
+        default=datetime.utcnow,
+        nullable=False
+    )
+
+    libros: Mapped[List["Book"]] = relationship(back_populates="genero")
+
+    @classmethod
+    def by_slug(cls, slug: str):
+        """Buscar por slug; acepta también el nombre tal cual ('Ciencia Ficción')"""
+        genre = cls.query.filter_by(slug=slug).first()
+        if genre is None and slugify(slug) != slug:
+            genre = cls.query.filter_by(slug=slugify(slug)).first()
+        return genre
+
+    @classmethod
+    def resolve(cls, nombre: str) -> "Genre":
+        """Obtener el género por nombre (sin distinguir acentos/mayúsculas) o crearlo"""
+        nombre = nombre.strip()
+        slug = LEGACY_SLUGS.get(nombre, slugify(nombre))
+        genre = cls.query.filter_by(slug=slug).first()
+        if genre is None:
+            genre = cls(slug=slug, nombre_genero=nombre)
+            db.session.add(genre)
+            db.session.flush()
+        return genre
+
+    def serialize(self) -> Dict[str, Any]:
+        return {
+            "id_genero": self.id_genero,
+            "slug": self.slug,
+            "nombre_genero": self.nombre_genero
+        }
@@ -0,0 +1,26 @@
+from app import db
+from typing import Dict, Any
+from sqlalchemy import Integer, ForeignKey
+from sqlalchemy.orm import Mapped, mapped_column, relationship
+
+class GenreStats(db.Model):
+    """
+    Agregados del catálogo por género (libros y autores distintos)
+    Se mantienen de forma incremental desde app/genre_stats.py
+    """
+    __tablename__ = 'estadisticas_genero'
+
+    id_genero: Mapped[int] = mapped_column(ForeignKey('generos.id_genero'), primary_key=True)
+    total_libros: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    total_autores: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+
+    genero: Mapped["Genre"] = relationship()
+
+    def serialize(self, total_books: int) -> Dict[str, Any]:
+        return {
+            "genre": self.genero.nombre_genero,
+            "slug": self.genero.slug,
+            "total_books": self.total_libros,
+            "unique_authors": self.total_autores,
+            "percentage": round((self.total_libros / total_books) * 100, 2) if total_books > 0 else 0
+        }
@@ -1,15 +1,21 @@
 from app import db
 from datetime import datetime
 from typing import Dict, Any
-from sqlalchemy import Integer, DateTime, ForeignKey, Text, func
+from sqlalchemy import Integer, DateTime, ForeignKey, Index, Text, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 class Rating(db.Model):
     __tablename__ = 'calificacion'
+    __table_args__ = (
+        # Respaldan el feed de reseñas paginado por (created_at, id_calificacion)
+        Index('ix_calificacion_libro_created', 'id_libro', 'created_at', 'id_calificacion'),
+        # Una sola calificación por usuario y libro
+        Index('ix_calificacion_usuario_libro', 'id_usuario', 'id_libro', unique=True),
+    )
     
     id_calificacion: Mapped[int] = mapped_column(primary_key=True)
     id_usuario: Mapped[int] = mapped_column(ForeignKey('usuarios.id_usuario'), nullable=False)
-    id_libro: Mapped[int] = mapped_column(ForeignKey('libros.id_libros'), nullable=False)
+    id_libro: Mapped[int] = mapped_column(ForeignKey('libros.id_libros', ondelete='CASCADE'), nullable=False)
     calificacion: Mapped[int] = mapped_column(Integer, nullable=True)  # ✅ CHANGED: Now nullable
     resena: Mapped[str] = mapped_column(Text, nullable=True)
     created_at: Mapped[datetime] = mapped_column(
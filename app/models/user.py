@@ -1,11 +1,17 @@
 from app import db
 from datetime import datetime, timezone
 from typing import List, Dict, Any
-from sqlalchemy import String, DateTime, Boolean, func
+from sqlalchemy import String, DateTime, Boolean, Index, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
+from app.passwords import passwords
 
 class User(db.Model):
     __tablename__ = 'usuarios'  
+    __table_args__ = (
+        # Listado de admin: orden por fecha de alta, con y sin filtro de estado
+        Index('ix_usuarios_created_at', 'created_at', 'id_usuario'),
+        Index('ix_usuarios_activo_created_at', 'is_active', 'created_at', 'id_usuario'),
+    )
     
     id_usuario: Mapped[int] = mapped_column(primary_key=True)
     nombre_usuario: Mapped[str] = mapped_column(String(100), nullable=False)
@@ -27,6 +33,16 @@ class User(db.Model):
     calificaciones: Mapped[List["Rating"]] = relationship(back_populates="usuario")
     biblioteca: Mapped[List["UserLibrary"]] = relationship(back_populates="usuario")
     
+    def set_password(self, password: str) -> None:
+        self.password_usuario = passwords.hash(password)
+    
+    def check_password(self, password: str) -> bool:
+        """Verificar la contraseña y actualizar el hash si cambió el método o el coste"""
+        ok, new_hash = passwords.verify_and_update(self.password_usuario, password)
+        if new_hash:
+            self.password_usuario = new_hash
+        return ok
+    
     def serialize(self) -> Dict[str, Any]:
         return {
             "id_usuario": self.id_usuario,
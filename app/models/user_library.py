@@ -1,14 +1,18 @@
 from app import db
 from datetime import datetime
-from sqlalchemy import String, DateTime, Integer, ForeignKey, func
+from sqlalchemy import String, DateTime, Integer, ForeignKey, Index, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 class UserLibrary(db.Model):
     __tablename__ = 'biblioteca_usuario'
+    __table_args__ = (
+        # Un libro solo puede estar una vez en la biblioteca de cada usuario
+        Index('ix_biblioteca_usuario_usuario_libro', 'id_usuario', 'id_libro', unique=True),
+    )
     
     id_biblioteca: Mapped[int] = mapped_column(primary_key=True)
     id_usuario: Mapped[int] = mapped_column(Integer, ForeignKey('usuarios.id_usuario'), nullable=False)
-    id_libro: Mapped[int] = mapped_column(Integer, ForeignKey('libros.id_libros'), nullable=False)
+    id_libro: Mapped[int] = mapped_column(Integer, ForeignKey('libros.id_libros', ondelete='CASCADE'), nullable=False)
     
     # Campo para estado de lectura
     # ✅ CHANGED: Only two valid states now (leido is handled by Rating table)
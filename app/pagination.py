@@ -0,0 +1,93 @@
+# app/pagination.py
+import base64
+import json
+from datetime import datetime
+from flask import jsonify, request
+from sqlalchemy import String, literal
+from app.database import db
+
+DEFAULT_PAGE_SIZE = 20
+MAX_PAGE_SIZE = 100
+NEXT_CURSOR_HEADER = 'X-Next-Cursor'
+
+
+def get_limit(default=DEFAULT_PAGE_SIZE, maximum=MAX_PAGE_SIZE):
+    """Leer el parámetro ?limit= acotado a [1, maximum]"""
+    raw = request.args.get('limit')
+    if raw is None or raw == '':
+        return default
+    try:
+        limit = int(raw)
+    except ValueError:
+        raise ValueError('El parámetro limit debe ser un número entero')
+    if limit < 1:
+        raise ValueError('El parámetro limit debe ser mayor que 0')
+    return min(limit, maximum)
+
+
+def encode_cursor(*values):
+    """Codificar los valores de la última fila como un cursor opaco"""
+    payload = [
+        {'dt': value.isoformat()} if isinstance(value, datetime) else value
+        for value in values
+    ]
+    raw = json.dumps(payload, separators=(',', ':')).encode('utf-8')
+    return base64.urlsafe_b64encode(raw).decode('ascii').rstrip('=')
+
+
+def decode_cursor(cursor, size):
+    """Decodificar un cursor generado por encode_cursor con `size` valores"""
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode('ascii')))
+    except (ValueError, TypeError):
+        raise ValueError('Cursor inválido')
+    if not isinstance(payload, list) or len(payload) != size:
+        raise ValueError('Cursor inválido')
+    values = []
+    for value in payload:
+        if isinstance(value, dict) and 'dt' in value:
+            try:
+                value = datetime.fromisoformat(value['dt'])
+            except (TypeError, ValueError):
+                raise ValueError('Cursor inválido')
+        values.append(value)
+    return values
+
+
+def get_cursor(size=1):
+    """Leer y decodificar el parámetro ?cursor= (None si no viene)"""
+    cursor = request.args.get('cursor')
+    if not cursor:
+        return None
+    return decode_cursor(cursor, size)
+
+
+def stored_timestamp(value):
+    """
+    Valor del cursor para comparar con una columna server_default=func.now().
+    En SQLite CURRENT_TIMESTAMP guarda 'YYYY-MM-DD HH:MM:SS' y SQLAlchemy enlaza
+    'YYYY-MM-DD HH:MM:SS.ffffff', así que se compara como texto en el formato almacenado
+    """
+    if db.engine.dialect.name != 'sqlite':
+        return value
+    stored = value.strftime('%Y-%m-%d %H:%M:%S')
+    if value.microsecond:
+        stored += f'.{value.microsecond:06d}'
+    return literal(stored, String)
+
+
+def split_page(rows, limit):
+    """Separar la fila extra pedida para saber si existe otra página"""
+    return rows[:limit], len(rows) > limit
+
+
+def page_response(items, next_cursor):
+    """
+    Lista JSON, igual que antes de paginar, con el cursor de la siguiente
+    página en la cabecera X-Next-Cursor (ausente en la última página)
+    """
+    response = jsonify(items)
+    if next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
+    return response
@@ -0,0 +1,196 @@
+# app/passwords.py
+"""
+Hash y verificación de contraseñas en un pool acotado.
+
+    new_hash = passwords.hash(password)
+    ok, new_hash = passwords.verify_and_update(user.password_usuario, password)
+
+scrypt/pbkdf2 cuestan decenas o cientos de ms de CPU por llamada. Las
+llamadas se ejecutan en un ThreadPoolExecutor propio de PASSWORD_HASH_WORKERS
+hilos (hashlib libera el GIL mientras calcula), así que una ráfaga de logins
+usa como mucho esos núcleos y el resto de hilos del worker sigue sirviendo
+lecturas del catálogo. Si ya hay PASSWORD_HASH_QUEUE_SIZE peticiones
+esperando, se lanza HasherBusy en lugar de encolar más (la ruta responde 503).
+También se lanza HasherBusy si la operación no termina en PASSWORD_HASH_TIMEOUT
+segundos; la tarea sigue en el pool y libera su hueco al terminar.
+
+PASSWORD_HASH_METHOD es cualquier método de werkzeug ('scrypt:32768:8:1',
+'pbkdf2:sha256:600000', ...). Los hashes guardados con otro método o coste se
+siguen verificando y verify_and_update devuelve el hash nuevo para guardarlo.
+"""
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeout
+import click
+from werkzeug.security import generate_password_hash, check_password_hash
+
+DEFAULT_METHOD = 'scrypt:32768:8:1'
+DEFAULT_WORKERS = 2
+DEFAULT_QUEUE_SIZE = 16
+DEFAULT_TIMEOUT = 10
+
+
+class HasherBusy(Exception):
+    """Demasiadas operaciones de hash pendientes; reintentar más tarde"""
+
+
+def _method_of(password_hash):
+    return password_hash.split('$', 1)[0]
+
+
+class PasswordHasher:
+    def __init__(self):
+        self.method = DEFAULT_METHOD
+        self.workers = DEFAULT_WORKERS
+        self.queue_size = DEFAULT_QUEUE_SIZE
+        self.timeout = DEFAULT_TIMEOUT
+        self._executor = None
+        self._slots = threading.BoundedSemaphore(DEFAULT_WORKERS + DEFAULT_QUEUE_SIZE)
+        self._lock = threading.Lock()
+        self._reset_stats()
+
+    def init_app(self, app):
+        self.method = app.config.get('PASSWORD_HASH_METHOD', DEFAULT_METHOD)
+        self.workers = int(app.config.get('PASSWORD_HASH_WORKERS', DEFAULT_WORKERS))
+        self.queue_size = int(app.config.get('PASSWORD_HASH_QUEUE_SIZE', DEFAULT_QUEUE_SIZE))
+        self.timeout = float(app.config.get('PASSWORD_HASH_TIMEOUT', DEFAULT_TIMEOUT))
+        # Normalizar el método ('scrypt' -> 'scrypt:32768:8:1') y validarlo al arrancar
+        self.method = _method_of(generate_password_hash('', self.method))
+
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+        self._executor = None
+        self._slots = threading.BoundedSemaphore(self.workers + self.queue_size)
+        self._reset_stats()
+
+    def _reset_stats(self):
+        self._stats = {
+            'in_flight': 0,
+            'running': 0,
+            'max_queued': 0,
+            'completed': 0,
+            'rejected': 0,
+            'timeouts': 0,
+            'wait_seconds': 0.0,
+            'hash_seconds': 0.0
+        }
+
+    def _get_executor(self):
+        # Se crea en el primer uso para no arrancar hilos antes del fork de gunicorn
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.workers, thread_name_prefix='password-hash'
+                )
+            return self._executor
+
+    def _run(self, function, *args):
+        if not self._slots.acquire(blocking=False):
+            with self._lock:
+                self._stats['rejected'] += 1
+            raise HasherBusy('Demasiadas solicitudes de autenticación, intenta de nuevo')
+
+        enqueued = time.monotonic()
+        with self._lock:
+            self._stats['in_flight'] += 1
+            queued = self._stats['in_flight'] - self._stats['running']
+            self._stats['max_queued'] = max(self._stats['max_queued'], queued)
+
+        def task():
+            started = time.monotonic()
+            with self._lock:
+                self._stats['running'] += 1
+                self._stats['wait_seconds'] += started - enqueued
+            try:
+                return function(*args)
+            finally:
+                with self._lock:
+                    self._stats['running'] -= 1
+                    self._stats['in_flight'] -= 1
+                    self._stats['completed'] += 1
+                    self._stats['hash_seconds'] += time.monotonic() - started
+                self._slots.release()
+
+        try:
+            future = self._get_executor().submit(task)
+        except Exception:
+            with self._lock:
+                self._stats['in_flight'] -= 1
+            self._slots.release()
+            raise
+        try:
+            return future.result(timeout=self.timeout)
+        except FutureTimeout as e:
+            # Si todavía estaba en cola no llegará a ejecutarse: se libera aquí su hueco;
+            # si ya se está ejecutando, lo libera la propia tarea al terminar
+            cancelled = future.cancel()
+            with self._lock:
+                self._stats['timeouts'] += 1
+                if cancelled:
+                    self._stats['in_flight'] -= 1
+            if cancelled:
+                self._slots.release()
+            raise HasherBusy('El servicio de autenticación está saturado, intenta de nuevo') from e
+
+    def hash(self, password):
+        """Hash con el método configurado"""
+        return self._run(generate_password_hash, password, self.method)
+
+    def verify(self, password_hash, password):
+        return self._run(check_password_hash, password_hash, password)
+
+    def needs_rehash(self, password_hash):
+        """True si el hash se generó con otro método o coste"""
+        return _method_of(password_hash) != self.method
+
+    def verify_and_update(self, password_hash, password):
+        """
+        Verificar la contraseña y, si el hash está desactualizado, generar el nuevo
+        en la misma tarea. Devuelve (ok, hash_nuevo o None).
+        """
+        def check():
+            if not check_password_hash(password_hash, password):
+                return False, None
+            if self.needs_rehash(password_hash):
+                return True, generate_password_hash(password, self.method)
+            return True, None
+        return self._run(check)
+
+    def stats(self):
+        """Métricas del proceso actual"""
+        with self._lock:
+            stats = dict(self._stats)
+        completed = stats.pop('completed')
+        wait_seconds = stats.pop('wait_seconds')
+        hash_seconds = stats.pop('hash_seconds')
+        return {
+            'method': self.method,
+            'workers': self.workers,
+            'queue_size': self.queue_size,
+            'in_flight': stats['in_flight'],
+            'running': stats['running'],
+            'queued': stats['in_flight'] - stats['running'],
+            'max_queued': stats['max_queued'],
+            'completed': completed,
+            'rejected': stats['rejected'],
+            'timeouts': stats['timeouts'],
+            'avg_wait_ms': round(wait_seconds * 1000 / completed, 2) if completed else 0,
+            'avg_hash_ms': round(hash_seconds * 1000 / completed, 2) if completed else 0
+        }
+
+
+passwords = PasswordHasher()
+
+
+def register_password_commands(app):
+    @app.cli.command('password-hash-benchmark')
+    @click.option('--method', default=None, help='Método de werkzeug a medir (por defecto PASSWORD_HASH_METHOD)')
+    @click.option('--rounds', default=5, show_default=True)
+    def password_hash_benchmark(method, rounds):
+        """Medir cuánto tarda un hash para ajustar PASSWORD_HASH_METHOD"""
+        method = method or passwords.method
+        started = time.perf_counter()
+        for _ in range(rounds):
+            generate_password_hash('benchmark', method)
+        elapsed = (time.perf_counter() - started) / rounds
+        print(f"⏱️ {_method_of(generate_password_hash('', method))}: {elapsed * 1000:.1f} ms por hash")
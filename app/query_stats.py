@@ -0,0 +1,96 @@
+# app/query_stats.py
+"""
+Métricas de SQL por petición.
+
+Los eventos before/after_cursor_execute de cada engine acumulan en g el
+número de consultas, el tiempo total en la base de datos y la consulta más
+lenta de la petición en curso. Al terminar:
+
+- con QUERY_STATS_HEADERS (por defecto solo en debug) se añade
+  Server-Timing: db;desc="12 queries";dur=8.4, db-slowest;dur=2.1, app;dur=15.0
+  (visible en la pestaña de red del navegador)
+- si la petición supera QUERY_BUDGET_COUNT consultas o QUERY_BUDGET_MS
+  milisegundos se registra un warning con la ruta y la consulta más lenta
+
+Las consultas que se ejecutan mientras se envía una respuesta en streaming
+ocurren después de after_request y no se cuentan.
+"""
+import time
+from flask import current_app, g, has_request_context, request
+from sqlalchemy import event
+from app.database import db
+
+DEFAULT_BUDGET_COUNT = 20
+DEFAULT_BUDGET_MS = 500
+MAX_LOGGED_STATEMENT = 300
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if context is not None:
+        context._query_started = time.perf_counter()
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    started = getattr(context, '_query_started', None)
+    if started is None or not has_request_context():
+        return
+    stats = g.get('query_stats')
+    if stats is None:
+        return
+    elapsed = time.perf_counter() - started
+    stats['count'] += 1
+    stats['seconds'] += elapsed
+    if elapsed > stats['slowest_seconds']:
+        stats['slowest_seconds'] = elapsed
+        stats['slowest_statement'] = statement
+
+
+def _start_request():
+    g.query_stats = {
+        'started': time.perf_counter(),
+        'count': 0,
+        'seconds': 0.0,
+        'slowest_seconds': 0.0,
+        'slowest_statement': None
+    }
+
+
+def _finish_request(response):
+    stats = g.get('query_stats')
+    if stats is None:
+        return response
+    config = current_app.config
+    total_ms = (time.perf_counter() - stats['started']) * 1000
+    db_ms = stats['seconds'] * 1000
+    slowest_ms = stats['slowest_seconds'] * 1000
+
+    if config.get('QUERY_STATS_HEADERS', current_app.debug):
+        response.headers.add(
+            'Server-Timing',
+            f'db;desc="{stats["count"]} queries";dur={db_ms:.1f}, '
+            f'db-slowest;dur={slowest_ms:.1f}, app;dur={total_ms:.1f}'
+        )
+
+    budget_count = int(config.get('QUERY_BUDGET_COUNT', DEFAULT_BUDGET_COUNT))
+    budget_ms = float(config.get('QUERY_BUDGET_MS', DEFAULT_BUDGET_MS))
+    if stats['count'] > budget_count or total_ms > budget_ms:
+        statement = ' '.join((stats['slowest_statement'] or '').split())[:MAX_LOGGED_STATEMENT]
+        current_app.logger.warning(
+            f"Petición fuera de presupuesto {request.method} {request.endpoint} ({request.path}): "
+            f"{stats['count']} consultas, db {db_ms:.1f} ms, total {total_ms:.1f} ms, "
+            f"bind {g.get('db_replica') or 'primary'}; más lenta {slowest_ms:.1f} ms: {statement}"
+        )
+    return response
+
+
+def init_query_stats(app):
+    """Registrar los eventos en todos los engines (después de db.init_app)"""
+    if not app.config.get('QUERY_STATS_ENABLED', True):
+        return
+    with app.app_context():
+        engines = list(db.engines.values())
+    for engine in engines:
+        event.listen(engine, 'before_cursor_execute', _before_cursor_execute)
+        event.listen(engine, 'after_cursor_execute', _after_cursor_execute)
+    app.before_request(_start_request)
+    app.after_request(_finish_request)
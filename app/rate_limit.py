@@ -0,0 +1,232 @@
+# app/rate_limit.py
+"""
+Limitación de peticiones para login y registro (token bucket).
+
+    @auth_bp.route('/login', methods=['POST'])
+    @rate_limited('login', email_field='email_usuario')
+    def login(): ...
+
+Cada regla tiene un bucket por IP y otro por email; ambos se comprueban antes
+de ejecutar la vista, así que una petición rechazada no llega a la base de
+datos ni al hash de la contraseña. Se responde 429 con Retry-After. Si un
+bucket rechaza, se devuelven los tokens ya consumidos en los anteriores.
+
+Los límites tienen la forma 'capacidad/periodo' ('5/minute', '20/hour') y se
+configuran por regla y ámbito con RATE_LIMIT_<REGLA>_<IP|EMAIL>, por ejemplo
+RATE_LIMIT_LOGIN_EMAIL='10/minute'. 'off' desactiva ese bucket.
+
+Backends (RATE_LIMIT_BACKEND):
+- 'memory': buckets en memoria del proceso (por defecto)
+- 'redis': compartido entre procesos mediante un script Lua; se crea desde
+  RATE_LIMIT_REDIS_URL o se pasa cualquier objeto con take() y refund() a init_app
+- 'null': sin límites
+Si el backend falla se deja pasar la petición (fail open), como la caché.
+"""
+import math
+import threading
+import time
+from collections import OrderedDict
+from functools import wraps
+from flask import current_app, request
+from app.errors import too_many_requests
+
+DEFAULT_LIMITS = {
+    'login': {'ip': '20/minute', 'email': '5/minute'},
+    'register': {'ip': '5/minute', 'email': '3/hour'},
+    'admin_login': {'ip': '10/minute', 'email': '5/minute'},
+    'admin_register': {'ip': '5/minute', 'email': '3/hour'}
+}
+DEFAULT_MAX_KEYS = 100000
+PERIODS = {'second': 1, 'minute': 60, 'hour': 3600, 'day': 86400}
+
+
+def parse_limit(value):
+    """'5/minute' -> (capacidad, tokens por segundo); 'off' -> None"""
+    if value is None or str(value).strip().lower() in ('', 'off', 'none'):
+        return None
+    try:
+        amount, period = str(value).split('/')
+        capacity = int(amount)
+        seconds = PERIODS.get(period.strip().lower().rstrip('s'))
+        if seconds is None:
+            seconds = float(period)
+    except ValueError:
+        raise ValueError(f"Límite no válido: {value!r} (use p. ej. '5/minute')")
+    if capacity <= 0 or seconds <= 0:
+        raise ValueError(f"Límite no válido: {value!r}")
+    return capacity, capacity / seconds
+
+
+class MemoryBackend:
+    def __init__(self, max_keys=DEFAULT_MAX_KEYS):
+        self.max_keys = max_keys
+        self._buckets = OrderedDict()
+        self._lock = threading.Lock()
+
+    def take(self, key, capacity, rate):
+        """Consumir un token; devuelve (permitido, segundos hasta el próximo token)"""
+        now = time.monotonic()
+        with self._lock:
+            tokens, updated = self._buckets.get(key, (capacity, now))
+            tokens = min(capacity, tokens + (now - updated) * rate)
+            allowed = tokens >= 1
+            if allowed:
+                tokens -= 1
+            self._buckets[key] = (tokens, now)
+            self._buckets.move_to_end(key)
+            while len(self._buckets) > self.max_keys:
+                self._buckets.popitem(last=False)
+        return allowed, 0.0 if allowed else (1 - tokens) / rate
+
+    def refund(self, key, capacity):
+        """Devolver un token consumido por take()"""
+        with self._lock:
+            if key in self._buckets:
+                tokens, updated = self._buckets[key]
+                self._buckets[key] = (min(capacity, tokens + 1), updated)
+
+    def clear(self):
+        with self._lock:
+            self._buckets.clear()
+
+
+TAKE_SCRIPT = """
+local capacity = tonumber(ARGV[1])
+local rate = tonumber(ARGV[2])
+local now = tonumber(ARGV[3])
+local bucket = redis.call('HMGET', KEYS[1], 'tokens', 'updated')
+local tokens = tonumber(bucket[1]) or capacity
+local updated = tonumber(bucket[2]) or now
+tokens = math.min(capacity, tokens + math.max(0, now - updated) * rate)
+local allowed = 0
+if tokens >= 1 then
+    tokens = tokens - 1
+    allowed = 1
+end
+redis.call('HSET', KEYS[1], 'tokens', tokens, 'updated', now)
+redis.call('EXPIRE', KEYS[1], math.ceil(capacity / rate) + 1)
+return {allowed, tostring(tokens)}
+"""
+
+REFUND_SCRIPT = """
+local tokens = tonumber(redis.call('HGET', KEYS[1], 'tokens'))
+if tokens then
+    redis.call('HSET', KEYS[1], 'tokens', math.min(tonumber(ARGV[1]), tokens + 1))
+end
+return 1
+"""
+
+
+class RedisBackend:
+    def __init__(self, client, prefix='booketlist:ratelimit:'):
+        self.client = client
+        self.prefix = prefix
+        self._take = client.register_script(TAKE_SCRIPT)
+        self._refund = client.register_script(REFUND_SCRIPT)
+
+    def take(self, key, capacity, rate):
+        allowed, tokens = self._take(keys=[self.prefix + key], args=[capacity, rate, time.time()])
+        allowed = bool(int(allowed))
+        return allowed, 0.0 if allowed else (1 - float(tokens)) / rate
+
+    def refund(self, key, capacity):
+        self._refund(keys=[self.prefix + key], args=[capacity])
+
+    def clear(self):
+        for key in self.client.scan_iter(f'{self.prefix}*'):
+            self.client.delete(key)
+
+
+class RateLimiter:
+    def __init__(self):
+        self.backend = None
+        self.limits = {}
+        self.proxy_hops = 0
+
+    def init_app(self, app, backend=None):
+        self.proxy_hops = int(app.config.get('RATE_LIMIT_PROXY_HOPS', 0))
+        self.limits = {
+            name: {
+                scope: parse_limit(app.config.get(f'RATE_LIMIT_{name.upper()}_{scope.upper()}', default))
+                for scope, default in scopes.items()
+            }
+            for name, scopes in DEFAULT_LIMITS.items()
+        }
+        if backend is not None:
+            self.backend = backend
+            return
+
+        kind = app.config.get('RATE_LIMIT_BACKEND', 'memory')
+        if kind == 'memory':
+            self.backend = MemoryBackend(int(app.config.get('RATE_LIMIT_MAX_KEYS', DEFAULT_MAX_KEYS)))
+        elif kind == 'redis':
+            try:
+                import redis
+            except ImportError:
+                raise RuntimeError('RATE_LIMIT_BACKEND=redis requiere el paquete "redis"')
+            self.backend = RedisBackend(redis.Redis.from_url(app.config['RATE_LIMIT_REDIS_URL']))
+        else:
+            self.backend = None
+
+    def client_ip(self):
+        """IP del cliente; con RATE_LIMIT_PROXY_HOPS=n se toma de X-Forwarded-For"""
+        route = request.access_route
+        if self.proxy_hops and len(route) >= self.proxy_hops:
+            return route[-self.proxy_hops]
+        return request.remote_addr or 'unknown'
+
+    def check(self, name, email=None):
+        """Devolver None si la petición puede seguir o los segundos de espera si no"""
+        if self.backend is None:
+            return None
+        limits = self.limits.get(name, {})
+        keys = [('ip', self.client_ip())]
+        if email:
+            keys.append(('email', email.strip().lower()))
+
+        taken = []
+        for scope, value in keys:
+            limit = limits.get(scope)
+            if limit is None:
+                continue
+            key = f'{name}:{scope}:{value}'
+            try:
+                allowed, retry_after = self.backend.take(key, *limit)
+                if not allowed:
+                    # Un rechazo por email no debe gastar el bucket de la IP
+                    for taken_key, capacity in taken:
+                        self.backend.refund(taken_key, capacity)
+                    return retry_after
+            except Exception as e:
+                current_app.logger.warning(f"Rate limit no disponible: {e}")
+                return None
+            taken.append((key, limit[0]))
+        return None
+
+    def clear(self):
+        if self.backend is not None:
+            self.backend.clear()
+
+
+rate_limiter = RateLimiter()
+
+
+def rate_limited(name, email_field=None):
+    """Aplicar la regla name (por IP y, si se indica email_field, por el email del JSON)"""
+    def decorator(view):
+        @wraps(view)
+        def wrapper(*args, **kwargs):
+            email = None
+            if email_field:
+                data = request.get_json(silent=True)
+                if isinstance(data, dict) and isinstance(data.get(email_field), str):
+                    email = data[email_field]
+            retry_after = rate_limiter.check(name, email)
+            if retry_after is not None:
+                return too_many_requests(
+                    'Demasiados intentos, espera un momento e inténtalo de nuevo',
+                    max(1, math.ceil(retry_after))
+                )
+            return view(*args, **kwargs)
+        return wrapper
+    return decorator
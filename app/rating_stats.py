@@ -0,0 +1,120 @@
+# app/rating_stats.py
+"""
+Mantenimiento de la tabla estadisticas_calificacion (agregados por libro).
+
+Los cambios de una calificación se aplican como incrementos dentro de la
+transacción del llamador (INSERT ... ON CONFLICT DO UPDATE, seguro con
+calificaciones simultáneas del mismo libro); los cambios masivos (bloquear/desbloquear un
+usuario) recalculan los libros afectados con un INSERT ... SELECT agrupado.
+Solo cuentan las calificaciones de usuarios activos.
+"""
+from sqlalchemy import select, insert, delete, func, case
+from app.database import db, upsert_increment
+from app.models import BookRatingStats, Rating, User
+
+COUNTER_COLUMNS = [
+    'total_resenas', 'total_calificadas', 'suma_calificaciones',
+    'estrellas_1', 'estrellas_2', 'estrellas_3', 'estrellas_4', 'estrellas_5',
+    'total_con_texto'
+]
+
+
+def _contribution(calificacion, resena, sign=1):
+    """Incrementos que aporta una calificación a los contadores de su libro"""
+    delta = {'total_resenas': sign}
+    if calificacion is not None:
+        stars = min(max(int(calificacion), 1), 5)
+        delta['total_calificadas'] = sign
+        delta['suma_calificaciones'] = sign * stars
+        delta[f'estrellas_{stars}'] = sign
+    if resena:
+        delta['total_con_texto'] = sign
+    return delta
+
+
+def _apply(book_id, delta):
+    delta = {column: value for column, value in delta.items() if value}
+    if not delta:
+        return
+    upsert_increment(BookRatingStats.__table__, {'id_libro': book_id}, delta)
+
+
+def _is_active(user_id):
+    return bool(db.session.query(User.is_active).filter(User.id_usuario == user_id).scalar())
+
+
+def rating_added(user_id, book_id, calificacion, resena):
+    if _is_active(user_id):
+        _apply(book_id, _contribution(calificacion, resena))
+
+
+def rating_removed(user_id, book_id, calificacion, resena):
+    if _is_active(user_id):
+        _apply(book_id, _contribution(calificacion, resena, sign=-1))
+
+
+def rating_changed(user_id, book_id, old, new):
+    """`old` y `new` son tuplas (calificacion, resena)"""
+    if not _is_active(user_id):
+        return
+    delta = _contribution(*old, sign=-1)
+    for column, value in _contribution(*new).items():
+        delta[column] = delta.get(column, 0) + value
+    _apply(book_id, delta)
+
+
+def _aggregate_query():
+    """SELECT agrupado por libro con los mismos contadores de la tabla"""
+    calificacion = Rating.calificacion
+    return select(
+        Rating.id_libro,
+        func.count(Rating.id_calificacion),
+        func.count(calificacion),
+        func.coalesce(func.sum(calificacion), 0),
+        *[func.sum(case((calificacion == stars, 1), else_=0)) for stars in range(1, 6)],
+        func.sum(case((func.coalesce(Rating.resena, '') != '', 1), else_=0))
+    ).join(User, User.id_usuario == Rating.id_usuario)\
+        .where(User.is_active == True)\
+        .group_by(Rating.id_libro)
+
+
+def _insert_from(query):
+    table = BookRatingStats.__table__
+    db.session.execute(
+        insert(table).from_select(['id_libro'] + COUNTER_COLUMNS, query)
+    )
+
+
+def remove_books(book_ids):
+    """Borrar los agregados de libros eliminados (llamar antes de borrar el libro)"""
+    table = BookRatingStats.__table__
+    db.session.execute(delete(table).where(table.c.id_libro.in_(book_ids)))
+
+
+def refresh_user_books(user_id):
+    """Recalcular los libros calificados por un usuario (p. ej. tras bloquearlo)"""
+    book_ids = select(Rating.id_libro).where(Rating.id_usuario == user_id)
+    remove_books(book_ids)
+    _insert_from(_aggregate_query().where(Rating.id_libro.in_(book_ids)))
+
+
+def rebuild_rating_stats():
+    """Recalcular todos los agregados desde calificacion"""
+    db.session.execute(delete(BookRatingStats.__table__))
+    _insert_from(_aggregate_query())
+    db.session.commit()
+    return db.session.query(BookRatingStats).count()
+
+
+def init_rating_stats(app):
+    """Poblar la tabla al arrancar si está vacía y ya hay calificaciones"""
+    if db.session.query(BookRatingStats).first() is None and db.session.query(Rating).first() is not None:
+        rebuild_rating_stats()
+
+
+def register_rating_stats_commands(app):
+    @app.cli.command('rating-stats-rebuild')
+    def rating_stats_rebuild():
+        """Recalcular estadisticas_calificacion desde cero"""
+        total = rebuild_rating_stats()
+        print(f"✅ Estadísticas recalculadas para {total} libros")
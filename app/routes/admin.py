@@ -1,14 +1,27 @@
-from flask import Blueprint, request, jsonify
+import io
+from datetime import datetime, timezone
+from flask import Blueprint, Response, request, jsonify, stream_with_context
 from app.models import Admin, Author, Book, User, Rating, UserLibrary
-from app import db
-from app.errors import bad_request, unauthorized, conflict, internal_error, not_found
-from flask_jwt_extended import create_access_token, jwt_required, get_jwt_identity
-from sqlalchemy import func
+from app import db, search, rating_stats, genre_stats
+from app.admin_auth import admin_required, admin_status
+from app.autocomplete import author_index
+from app.catalog_export import export_chunks, export_filename, CONTENT_TYPES as EXPORT_CONTENT_TYPES
+from app.catalog_import import import_catalog, detect_format, FORMATS as IMPORT_FORMATS, DEFAULT_BATCH_SIZE as DEFAULT_IMPORT_BATCH_SIZE
+from app.cache import cache
+from app.conditional import bump_catalog_version
+from app.errors import bad_request, unauthorized, conflict, internal_error, not_found, service_unavailable
+from app.passwords import passwords, HasherBusy
+from app.engine_config import pool_stats
+from app.rate_limit import rate_limited
+from app.pagination import get_limit, get_cursor, encode_cursor, page_response, split_page
+from flask_jwt_extended import create_access_token, get_jwt_identity
+from sqlalchemy import func, select, delete, union_all, literal
 
 admin_bp = Blueprint('admin', __name__)
 
 # ===== AUTHENTICATION =====
 @admin_bp.route('/admin/auth/register', methods=['POST'])
+@rate_limited('admin_register', email_field='email_admin')
 def admin_register_user():
     """Registrar un nuevo administrador"""
     try:
@@ -49,11 +62,15 @@ def admin_register_user():
             'admin': admin.serialize()
         }), 201
 
+    except HasherBusy as e:
+        db.session.rollback()
+        return service_unavailable(str(e))
     except Exception as e:
         db.session.rollback()
         return internal_error(str(e))
 
 @admin_bp.route('/admin/login', methods=['POST'])
+@rate_limited('admin_login', email_field='email_admin')
 def admin_login_user():
     """Login para administradores"""
     try:
@@ -74,7 +91,11 @@ def admin_login_user():
         
         if not admin.check_password(password):
             return unauthorized('Credenciales inválidas')
-        
+
+        # Guardar el hash nuevo si check_password lo regeneró con el método actual
+        if db.session.is_modified(admin):
+            db.session.commit()
+
         access_token = create_access_token(
             identity=str(admin.id_admin),
             additional_claims={'is_admin': True}
@@ -85,17 +106,20 @@ def admin_login_user():
             'access_token': access_token,
             'admin': admin.serialize()
         }), 200
-    
+
+    except HasherBusy as e:
+        return service_unavailable(str(e))
     except Exception as e:
+        db.session.rollback()
         return internal_error(str(e))
 
 @admin_bp.route('/admin/profile', methods=['GET'])
-@jwt_required()
+@admin_required('No tiene permiso para ver el perfil')
 def admin_get_profile():
     """Obtener perfil del administrador"""
     try:
-        current_admin_id = get_jwt_identity()
-        admin = Admin.query.get(current_admin_id)
+        current_admin_id = int(get_jwt_identity())
+        admin = db.session.get(Admin, current_admin_id)
 
         if not admin:
             return not_found('Administrador no encontrado')
@@ -106,12 +130,12 @@ def admin_get_profile():
         return internal_error(str(e))
 
 @admin_bp.route('/admin/auth/profile', methods=['PUT'])
-@jwt_required()
+@admin_required('No tiene permiso para actualizar el perfil')
 def admin_update_profile():
     """Actualizar perfil del administrador"""
     try:
-        current_admin_id = get_jwt_identity()
-        admin = Admin.query.get(current_admin_id)
+        current_admin_id = int(get_jwt_identity())
+        admin = db.session.get(Admin, current_admin_id)
 
         if not admin:
             return not_found('Administrador no encontrado')
@@ -134,46 +158,156 @@ def admin_update_profile():
             admin.set_password(data['password_admin'])
         
         db.session.commit()
+        admin_status.invalidate(admin.id_admin)
 
         return jsonify({
             'message': 'Perfil actualizado exitosamente',
             'admin': admin.serialize()
         }), 200
-    
+
+    except HasherBusy as e:
+        db.session.rollback()
+        return service_unavailable(str(e))
     except Exception as e:
         db.session.rollback()
         return internal_error(str(e))
 
 # ===== USER MANAGEMENT =====
+USER_SORT_COLUMNS = {
+    'id': User.id_usuario,
+    'created_at': User.created_at,
+    'email': User.email_usuario
+}
+USER_SORT_TYPES = {'id': int, 'created_at': datetime, 'email': str}
+
+def _users_cursor(user, sort):
+    """Cursor con los valores de la última fila: no depende de que siga existiendo"""
+    if sort == 'id':
+        return encode_cursor(user.id_usuario)
+    return encode_cursor(getattr(user, USER_SORT_COLUMNS[sort].key), user.id_usuario)
+
+def _parse_datetime_arg(name):
+    """Leer un parámetro de fecha ISO 8601 (sin zona horaria se asume UTC)"""
+    raw = request.args.get(name)
+    if not raw:
+        return None
+    try:
+        value = datetime.fromisoformat(raw)
+    except ValueError:
+        raise ValueError(f'El parámetro {name} debe ser una fecha ISO 8601')
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value
+
+def _email_prefix_range(prefix):
+    """Prefijo como rango [prefix, siguiente) para que lo resuelva el índice único de email"""
+    upper = prefix[:-1] + chr(ord(prefix[-1]) + 1)
+    return db.and_(User.email_usuario >= prefix, User.email_usuario < upper)
+
+def _user_counts(user_ids):
+    """total_libros y total_resenas de una página de usuarios en una consulta agrupada"""
+    if not user_ids:
+        return {}
+    activity = union_all(
+        select(UserLibrary.id_usuario.label('id_usuario'), literal(1).label('libros'), literal(0).label('resenas'))
+            .where(UserLibrary.id_usuario.in_(user_ids)),
+        select(Rating.id_usuario.label('id_usuario'), literal(0).label('libros'), literal(1).label('resenas'))
+            .where(Rating.id_usuario.in_(user_ids))
+    ).subquery()
+    rows = db.session.execute(
+        select(activity.c.id_usuario, func.sum(activity.c.libros), func.sum(activity.c.resenas))
+            .group_by(activity.c.id_usuario)
+    )
+    return {user_id: (int(libros), int(resenas)) for user_id, libros, resenas in rows}
+
 @admin_bp.route('/admin/users/all', methods=['GET'])
-@jwt_required()
+@admin_required('No tiene permiso para ver usuarios')
 def admin_get_all_users():
-    """Obtener todos los usuarios"""
+    """
+    Usuarios paginados por cursor
+    Parámetros: limit, cursor, is_active (true/false), email (prefijo),
+    created_from, created_to (ISO 8601), sort (id|created_at|email), order (asc|desc)
+    El cursor siguiente va en la cabecera X-Next-Cursor
+    """
     try:
-        current_admin_id = get_jwt_identity()
-        current_admin = Admin.query.get(current_admin_id)
-
-        if not current_admin:
-            return unauthorized('No tiene permiso para ver usuarios')
-        
-        users = User.query.all()
-        # ✅ CORREGIR: Usar serialize() en lugar de serialize_admin()
-        return jsonify([user.serialize() for user in users]), 200
+        try:
+            limit = get_limit(default=50, maximum=200)
+            created_from = _parse_datetime_arg('created_from')
+            created_to = _parse_datetime_arg('created_to')
+            sort = request.args.get('sort', 'id')
+            if sort not in USER_SORT_COLUMNS:
+                raise ValueError(f"sort debe ser uno de: {', '.join(USER_SORT_COLUMNS)}")
+            # Cursor: (id) ordenando por id, (valor de ordenación, id) en otro caso
+            cursor = get_cursor(1 if sort == 'id' else 2)
+            if cursor and not (isinstance(cursor[-1], int)
+                               and isinstance(cursor[0], USER_SORT_TYPES[sort])):
+                raise ValueError('Cursor inválido')
+            order = request.args.get('order', 'asc').lower()
+            if order not in ('asc', 'desc'):
+                raise ValueError('order debe ser asc o desc')
+        except ValueError as e:
+            return bad_request(str(e))
+        
+        query = User.query
+        is_active = request.args.get('is_active')
+        if is_active is not None and is_active != '':
+            query = query.filter(User.is_active == (is_active.lower() in ('1', 'true', 'yes')))
+        email_prefix = request.args.get('email', '').strip()
+        if email_prefix:
+            query = query.filter(_email_prefix_range(email_prefix))
+        if created_from:
+            query = query.filter(User.created_at >= created_from)
+        if created_to:
+            query = query.filter(User.created_at < created_to)
+        
+        sort_column = USER_SORT_COLUMNS[sort]
+        descending = order == 'desc'
+        if cursor:
+            last_id = cursor[-1]
+            if sort == 'id':
+                query = query.filter(User.id_usuario < last_id if descending else User.id_usuario > last_id)
+            else:
+                last_value = cursor[0]
+                if descending:
+                    query = query.filter(db.or_(
+                        sort_column < last_value,
+                        db.and_(sort_column == last_value, User.id_usuario < last_id)
+                    ))
+                else:
+                    query = query.filter(db.or_(
+                        sort_column > last_value,
+                        db.and_(sort_column == last_value, User.id_usuario > last_id)
+                    ))
+        
+        if descending:
+            ordering = [sort_column.desc(), User.id_usuario.desc()]
+        else:
+            ordering = [sort_column.asc(), User.id_usuario.asc()]
+        if sort == 'id':
+            ordering = ordering[1:]
+        
+        users = query.order_by(*ordering).limit(limit + 1).all()
+        users, has_more = split_page(users, limit)
+        counts = _user_counts([user.id_usuario for user in users])
+        
+        users_data = []
+        for user in users:
+            data = user.serialize()
+            total_libros, total_resenas = counts.get(user.id_usuario, (0, 0))
+            data['total_libros'] = total_libros
+            data['total_resenas'] = total_resenas
+            users_data.append(data)
+        
+        return page_response(users_data, _users_cursor(users[-1], sort) if has_more else None), 200
     
     except Exception as e:
         return internal_error(str(e))
 
 @admin_bp.route('/admin/users/<int:user_id>', methods=['GET'])
-@jwt_required()
+@admin_required('No tiene permiso para ver usuarios')
 def admin_get_user_detail(user_id):  # <- Agregar user_id aquí
     """Obtener detalles de un usuario específico"""
     try:
-        current_admin_id = get_jwt_identity()
-        current_admin = Admin.query.get(current_admin_id)
-
-        if not current_admin:
-            return unauthorized('No tiene permiso para ver usuarios')
-        
         user = User.query.get_or_404(user_id)
         return jsonify(user.serialize()), 200
     
@@ -181,18 +315,14 @@ def admin_get_user_detail(user_id):  # <- Agregar user_id aquí
         return not_found(str(e))
 
 @admin_bp.route('/admin/users/<int:user_id>/status', methods=['PUT'])
-@jwt_required()
+@admin_required('No tiene permiso para gestionar usuarios')
 def admin_toggle_user_status(user_id):  # <- Agregar user_id aquí
     """Cambiar estado de usuario (bloquear/desbloquear)"""
     try:
-        current_admin_id = get_jwt_identity()
-        current_admin = Admin.query.get(current_admin_id)
-
-        if not current_admin:
-            return unauthorized('No tiene permiso para gestionar usuarios')
-        
         user = User.query.get_or_404(user_id)
         user.is_active = not user.is_active
+        db.session.flush()
+        rating_stats.refresh_user_books(user_id)
         db.session.commit()
         
         action = "desbloqueado" if user.is_active else "bloqueado"
@@ -210,16 +340,10 @@ def admin_toggle_user_status(user_id):  # <- Agregar user_id aquí
         return internal_error(str(e))
 
 @admin_bp.route('/admin/users/<int:user_id>/reviews', methods=['GET'])
-@jwt_required()
+@admin_required('No tiene permiso para ver reseñas de usuarios')
 def admin_get_user_reviews(user_id):
     """Obtener todas las reseñas de un usuario específico"""
     try:
-        current_admin_id = get_jwt_identity()
-        current_admin = Admin.query.get(current_admin_id)
-
-        if not current_admin:
-            return unauthorized('No tiene permiso para ver reseñas de usuarios')
-        
         user = User.query.get_or_404(user_id)
         
         reviews = Rating.query.filter_by(id_usuario=user_id).all()
@@ -252,16 +376,10 @@ def admin_get_user_reviews(user_id):
         return internal_error(str(e))
 
 @admin_bp.route('/admin/users/<int:user_id>/library', methods=['GET'])
-@jwt_required()
+@admin_required('No tiene permiso para ver bibliotecas de usuarios')
 def admin_get_user_library(user_id):
     """Obtener toda la biblioteca de un usuario específico (incluyendo libros leídos)"""
     try:
-        current_admin_id = get_jwt_identity()
-        current_admin = Admin.query.get(current_admin_id)
-
-        if not current_admin:
-            return unauthorized('No tiene permiso para ver bibliotecas de usuarios')
-        
         user = User.query.get_or_404(user_id)
         
         # ✅ Obtener libros de UserLibrary (quiero_leer y leyendo)
@@ -329,16 +447,10 @@ def admin_get_user_library(user_id):
         return internal_error(str(e))
 
 @admin_bp.route('/admin/users/<int:user_id>/stats', methods=['GET'])
-@jwt_required()
+@admin_required('No tiene permiso para ver estadísticas de usuarios')
 def admin_get_user_stats(user_id):
     """Obtener estadísticas completas de un usuario (incluyendo libros leídos)"""
     try:
-        current_admin_id = get_jwt_identity()
-        current_admin = Admin.query.get(current_admin_id)
-
-        if not current_admin:
-            return unauthorized('No tiene permiso para ver estadísticas de usuarios')
-        
         user = User.query.get_or_404(user_id)
         
         # Contar reseñas
@@ -393,16 +505,10 @@ def admin_get_user_stats(user_id):
 
 # ===== AUTHOR MANAGEMENT =====
 @admin_bp.route('/admin/authors/create', methods=['POST'])
-@jwt_required()
+@admin_required('No tiene permiso para agregar autores')
 def admin_create_author():
     """Crear un nuevo autor"""
     try:
-        current_admin_id = get_jwt_identity()
-        current_admin = Admin.query.get(current_admin_id)
-
-        if not current_admin:
-            return unauthorized('No tiene permiso para agregar autores')
-        
         data = request.get_json()
 
         if not data.get('nombre_autor') or not data.get('apellido_autor'):
@@ -425,7 +531,10 @@ def admin_create_author():
         )
 
         db.session.add(author)
+        bump_catalog_version()
         db.session.commit()
+        cache.invalidate('catalog')
+        author_index.refresh_author(author.id_autor)
 
         return jsonify({
             'message': 'Autor agregado exitosamente',
@@ -444,16 +553,10 @@ def admin_create_author():
         return internal_error(str(e))
 
 @admin_bp.route('/admin/authors/list', methods=['GET'])
-@jwt_required()
+@admin_required('No tiene permiso para ver autores')
 def admin_get_all_authors():
     """Obtener lista de todos los autores"""
     try:
-        current_admin_id = get_jwt_identity()
-        current_admin = Admin.query.get(current_admin_id)
-
-        if not current_admin:
-            return unauthorized('No tiene permiso para ver autores')
-        
         # Usar consulta específica para evitar el campo problemático
         authors = db.session.query(
             Author.id_autor,
@@ -482,16 +585,10 @@ def admin_get_all_authors():
         return internal_error(str(e))
 
 @admin_bp.route('/admin/authors/<int:author_id>/update', methods=['PUT'])
-@jwt_required()
+@admin_required('No tiene permiso para actualizar autores')
 def admin_update_author(author_id):
     """Actualizar información de un autor"""
     try:
-        current_admin_id = get_jwt_identity()
-        current_admin = Admin.query.get(current_admin_id)
-
-        if not current_admin:
-            return unauthorized('No tiene permiso para actualizar autores')
-        
         author = Author.query.get_or_404(author_id)
         data = request.get_json()
 
@@ -503,7 +600,13 @@ def admin_update_author(author_id):
             author.biografia_autor = data['biografia_autor']
         # No actualizar imagen_autor por ahora
         
+        # Mantener sincronizado el índice de búsqueda con el nombre del autor
+        db.session.flush()
+        search.index_author_books(author_id)
+        bump_catalog_version()
         db.session.commit()
+        cache.invalidate('catalog')
+        author_index.refresh_author(author_id)
 
         return jsonify({
             'message': 'Autor actualizado exitosamente',
@@ -523,34 +626,47 @@ def admin_update_author(author_id):
         return internal_error(str(e))
 
 @admin_bp.route('/admin/authors/<int:author_id>/delete', methods=['DELETE'])
-@jwt_required()
+@admin_required('No tiene permiso para eliminar autores')
 def admin_delete_author(author_id):
-    """Eliminar un autor y todos sus libros relacionados"""
+    """Eliminar un autor y todos sus libros relacionados con sentencias por conjunto"""
     try:
-        current_admin_id = get_jwt_identity()
-        current_admin = Admin.query.get(current_admin_id)
-
-        if not current_admin:
-            return unauthorized('No tiene permiso para eliminar autores')
-        
-        author = Author.query.get_or_404(author_id)
+        author = db.session.get(Author, author_id)
+        if author is None:
+            return not_found('Autor no encontrado')
+
+        # Número de sentencias constante sin importar cuántos libros tenga el autor
+        book_ids = select(Book.id_libros).where(Book.id_autor == author_id)
+        genre_ids = db.session.scalars(
+            select(Book.id_genero).where(Book.id_autor == author_id).distinct()
+        ).all()
 
-        # Eliminar en cascada manualmente
-        # Primero eliminar todos los libros del autor y sus dependencias
-        for libro in author.libros:
-            # Eliminar calificaciones/reseñas de este libro
-            Rating.query.filter_by(id_libro=libro.id_libros).delete()
-            # Eliminar de bibliotecas de usuarios
-            UserLibrary.query.filter_by(id_libro=libro.id_libros).delete()
-            # Finalmente eliminar el libro
-            db.session.delete(libro)
-        
-        # Ahora eliminar el autor
-        db.session.delete(author)
+        rating_stats.remove_books(book_ids)
+        search.remove_author_books(author_id)
+        ratings_deleted = db.session.execute(
+            delete(Rating).where(Rating.id_libro.in_(book_ids))
+        ).rowcount
+        library_deleted = db.session.execute(
+            delete(UserLibrary).where(UserLibrary.id_libro.in_(book_ids))
+        ).rowcount
+        books_deleted = db.session.execute(
+            delete(Book).where(Book.id_autor == author_id)
+        ).rowcount
+        db.session.execute(delete(Author).where(Author.id_autor == author_id))
+
+        genre_stats.refresh_genres(genre_ids)
+        bump_catalog_version()
         db.session.commit()
+        cache.invalidate('catalog')
+        author_index.refresh_author(author_id)
 
         return jsonify({
-            'message': 'Autor y todos sus libros eliminados exitosamente'
+            'message': 'Autor y todos sus libros eliminados exitosamente',
+            'deleted': {
+                'autores': 1,
+                'libros': books_deleted,
+                'calificaciones': ratings_deleted,
+                'bibliotecas': library_deleted
+            }
         }), 200
     
     except Exception as e:
@@ -559,15 +675,9 @@ def admin_delete_author(author_id):
 
 # ===== BOOK MANAGEMENT =====
 @admin_bp.route('/admin/books/create', methods=['POST'])
-@jwt_required()
+@admin_required('No tiene permiso para crear libros')
 def admin_create_book():
     try:
-        current_admin_id = get_jwt_identity()
-        current_admin = Admin.query.get(current_admin_id)
-
-        if not current_admin:
-            return unauthorized('No tiene permiso para crear libros')
-        
         data = request.get_json()
         
         # Validar campos requeridos
@@ -580,15 +690,21 @@ def admin_create_book():
         nuevo_libro = Book(
             titulo_libro=data['titulo_libro'],
             id_autor=data['id_autor'],
-            genero_libro=data['genero_libro'],
             descripcion_libros=data.get('descripcion_libros', ''),
             enlace_asin_libro=data.get('enlace_asin_libro', ''),
             enlace_portada_libro=data.get('enlace_portada_libro', '')
             
         )
+        nuevo_libro.set_genre(data['genero_libro'])
         
         db.session.add(nuevo_libro)
+        db.session.flush()
+        search.index_book(nuevo_libro.id_libros)
+        genre_stats.book_added(nuevo_libro.id_genero, nuevo_libro.id_autor)
+        bump_catalog_version()
         db.session.commit()
+        cache.invalidate('catalog')
+        author_index.refresh_author(nuevo_libro.id_autor)
         
         return jsonify({
             'message': 'Libro creado exitosamente',
@@ -605,16 +721,10 @@ def admin_create_book():
         return internal_error(str(e))
     
 @admin_bp.route('/admin/books/list', methods=['GET'])
-@jwt_required()
+@admin_required('No tiene permiso para ver libros')
 def admin_get_all_books():
     """Obtener lista de todos los libros"""
     try:
-        current_admin_id = get_jwt_identity()
-        current_admin = Admin.query.get(current_admin_id)
-
-        if not current_admin:
-            return unauthorized('No tiene permiso para ver libros')
-        
         books = Book.query.all()
         return jsonify([book.serialize() for book in books]), 200
     
@@ -622,23 +732,18 @@ def admin_get_all_books():
         return internal_error(str(e))
 
 @admin_bp.route('/admin/books/<int:book_id>/update', methods=['PUT'])
-@jwt_required()
+@admin_required('No tiene permiso para actualizar libros')
 def admin_update_book(book_id):
     """Actualizar información de un libro"""
     try:
-        current_admin_id = get_jwt_identity()
-        current_admin = Admin.query.get(current_admin_id)
-
-        if not current_admin:
-            return unauthorized('No tiene permiso para actualizar libros')
-        
         book = Book.query.get_or_404(book_id)
         data = request.get_json()
+        previous_genre = book.id_genero
 
         if 'titulo_libro' in data:
             book.titulo_libro = data['titulo_libro']
         if 'genero_libro' in data:
-            book.genero_libro = data['genero_libro']
+            book.set_genre(data['genero_libro'])
         if 'descripcion_libros' in data:
             book.descripcion_libros = data['descripcion_libros']
         if 'enlace_portada_libro' in data:
@@ -646,7 +751,13 @@ def admin_update_book(book_id):
         if 'enlace_asin_libro' in data:
             book.enlace_asin_libro = data['enlace_asin_libro']
 
+        db.session.flush()
+        search.index_book(book_id)
+        genre_stats.book_genre_changed(previous_genre, book.id_genero, book.id_autor)
+        bump_catalog_version()
         db.session.commit()
+        cache.invalidate('catalog')
+        author_index.refresh_author(book.id_autor)
 
         return jsonify({
             'message': 'Libro actualizado exitosamente',
@@ -658,30 +769,43 @@ def admin_update_book(book_id):
         return internal_error(str(e))
 
 @admin_bp.route('/admin/books/<int:book_id>/delete', methods=['DELETE'])
-@jwt_required()
+@admin_required('No tiene permiso para eliminar libros')
 def admin_delete_book(book_id):
     """Eliminar un libro y todas sus dependencias"""
     try:
-        current_admin_id = get_jwt_identity()
-        current_admin = Admin.query.get(current_admin_id)
-
-        if not current_admin:
-            return unauthorized('No tiene permiso para eliminar libros')
-        
-        book = Book.query.get_or_404(book_id)
-
-        # Eliminar todas las calificaciones/reseñas del libro
-        Rating.query.filter_by(id_libro=book_id).delete()
+        book = db.session.get(Book, book_id)
+        if book is None:
+            return not_found('Libro no encontrado')
+        author_id = book.id_autor
+        genre_id = book.id_genero
+
+        # Eliminar las calificaciones/reseñas del libro y sus agregados
+        rating_stats.remove_books([book_id])
+        ratings_deleted = db.session.execute(
+            delete(Rating).where(Rating.id_libro == book_id)
+        ).rowcount
         
         # Eliminar de todas las bibliotecas de usuarios
-        UserLibrary.query.filter_by(id_libro=book_id).delete()
+        library_deleted = db.session.execute(
+            delete(UserLibrary).where(UserLibrary.id_libro == book_id)
+        ).rowcount
         
         # Finalmente eliminar el libro
-        db.session.delete(book)
+        search.remove_books([book_id])
+        db.session.execute(delete(Book).where(Book.id_libros == book_id))
+        genre_stats.book_removed(genre_id, author_id)
+        bump_catalog_version()
         db.session.commit()
+        cache.invalidate('catalog')
+        author_index.refresh_author(author_id)
 
         return jsonify({
-            'message': 'Libro y todas sus dependencias eliminados exitosamente'
+            'message': 'Libro y todas sus dependencias eliminados exitosamente',
+            'deleted': {
+                'libros': 1,
+                'calificaciones': ratings_deleted,
+                'bibliotecas': library_deleted
+            }
         }), 200
     
     except Exception as e:
@@ -689,18 +813,74 @@ def admin_delete_book(book_id):
         return internal_error(str(e))
 
 
+@admin_bp.route('/admin/books/import', methods=['POST'])
+@admin_required('No tiene permiso para importar libros')
+def admin_import_books():
+    """
+    Importación masiva de libros (inserta o actualiza por ASIN)
+    El cuerpo es el archivo en bruto o un multipart con el campo 'file'.
+    Parámetros: format (ndjson|csv|markdown, por defecto según la extensión), batch_size
+    """
+    try:
+        upload = request.files.get('file')
+        fmt = request.args.get('format') or (detect_format(upload.filename) if upload else None)
+        if fmt not in IMPORT_FORMATS:
+            return bad_request(f"El parámetro format debe ser uno de: {', '.join(IMPORT_FORMATS)}")
+        try:
+            batch_size = int(request.args.get('batch_size', DEFAULT_IMPORT_BATCH_SIZE))
+            if batch_size < 1:
+                raise ValueError
+        except ValueError:
+            return bad_request('batch_size debe ser un entero positivo')
+
+        stream = upload.stream if upload else request.stream
+        lines = io.TextIOWrapper(stream, encoding='utf-8-sig', newline='')
+        report = import_catalog(lines, fmt, batch_size)
+
+        return jsonify({
+            'message': 'Importación completada',
+            'report': report.serialize()
+        }), 200
+
+    except UnicodeDecodeError:
+        db.session.rollback()
+        return bad_request('El archivo debe estar codificado en UTF-8')
+    except Exception as e:
+        db.session.rollback()
+        return internal_error(str(e))
+
+
+@admin_bp.route('/admin/export/<string:dataset>', methods=['GET'])
+@admin_required('No tiene permiso para exportar datos')
+def admin_export(dataset):
+    """
+    Exportar books, library o ratings en streaming
+    Parámetros: format (ndjson|csv), gzip (true/false)
+    """
+    try:
+        fmt = request.args.get('format', 'ndjson')
+        use_gzip = request.args.get('gzip', 'false').lower() in ('1', 'true', 'yes')
+        try:
+            chunks = export_chunks(dataset, fmt, use_gzip)
+        except ValueError as e:
+            return bad_request(str(e))
+
+        # Con gzip se descarga el archivo .gz tal cual (sin Content-Encoding)
+        mimetype = 'application/gzip' if use_gzip else EXPORT_CONTENT_TYPES[fmt]
+        response = Response(stream_with_context(chunks), status=200, mimetype=mimetype)
+        response.headers['Content-Disposition'] = f'attachment; filename="{export_filename(dataset, fmt, use_gzip)}"'
+        return response
+
+    except Exception as e:
+        return internal_error(str(e))
+
+
 # ===== DASHBOARD & STATISTICS =====
 @admin_bp.route('/admin/dashboard/overview', methods=['GET'])
-@jwt_required()
+@admin_required('No tiene permiso para ver el dashboard')
 def admin_dashboard_overview():
     """Obtener estadísticas generales del dashboard"""
     try:
-        current_admin_id = get_jwt_identity()
-        current_admin = Admin.query.get(current_admin_id)
-
-        if not current_admin:
-            return unauthorized('No tiene permiso para ver el dashboard')
-        
         total_users = User.query.count()
         total_books = Book.query.count()
         total_authors = Author.query.count()
@@ -724,16 +904,10 @@ def admin_dashboard_overview():
         return internal_error(str(e))
 
 @admin_bp.route('/admin/dashboard/users/stats', methods=['GET'])
-@jwt_required()
+@admin_required('No tiene permiso para ver estadísticas')
 def admin_users_statistics():
     """Obtener estadísticas de usuarios"""
     try:
-        current_admin_id = get_jwt_identity()
-        current_admin = Admin.query.get(current_admin_id)
-
-        if not current_admin:
-            return unauthorized('No tiene permiso para ver estadísticas')
-        
         total_users = User.query.count()
         active_users = User.query.filter_by(is_active=True).count()
         blocked_users = User.query.filter_by(is_active=False).count()
@@ -754,16 +928,10 @@ def admin_users_statistics():
         return internal_error(str(e))
 
 @admin_bp.route('/admin/dashboard/authors/stats', methods=['GET'])
-@jwt_required()
+@admin_required('No tiene permiso para ver estadísticas')
 def admin_authors_statistics():
     """Obtener estadísticas de autores"""
     try:
-        current_admin_id = get_jwt_identity()
-        current_admin = Admin.query.get(current_admin_id)
-
-        if not current_admin:
-            return unauthorized('No tiene permiso para ver estadísticas')
-        
         total_authors = Author.query.count()
         authors_with_books = db.session.query(func.count(func.distinct(Book.id_autor))).scalar()
         
@@ -786,16 +954,10 @@ def admin_authors_statistics():
         return internal_error(str(e))
 
 @admin_bp.route('/admin/dashboard/books/stats', methods=['GET'])
-@jwt_required()
+@admin_required('No tiene permiso para ver estadísticas')
 def admin_books_statistics():
     """Obtener estadísticas de libros"""
     try:
-        current_admin_id = get_jwt_identity()
-        current_admin = Admin.query.get(current_admin_id)
-
-        if not current_admin:
-            return unauthorized('No tiene permiso para ver estadísticas')
-        
         total_books = Book.query.count()
         books_with_reviews = db.session.query(func.count(func.distinct(Rating.id_libro))).scalar()
         books_in_libraries = db.session.query(func.count(func.distinct(UserLibrary.id_libro))).scalar()
@@ -808,22 +970,28 @@ def admin_books_statistics():
             "average_rating": round(float(average_rating), 2),
             "books_without_reviews": total_books - books_with_reviews
         }), 200
-    
+
     except Exception as e:
         return internal_error(str(e))
+
+@admin_bp.route('/admin/dashboard/password-hashing', methods=['GET'])
+@admin_required('No tiene permiso para ver estadísticas')
+def admin_password_hashing_statistics():
+    """Métricas del pool de hashing de contraseñas (solo de este proceso)"""
+    return jsonify(passwords.stats()), 200
+
+@admin_bp.route('/admin/dashboard/db-pool', methods=['GET'])
+@admin_required('No tiene permiso para ver estadísticas')
+def admin_db_pool_statistics():
+    """Estado del pool de conexiones a la base de datos (solo de este proceso)"""
+    return jsonify(pool_stats.snapshot()), 200
     # Agregar a admin.py
 
 @admin_bp.route('/admin/authors/<int:author_id>', methods=['GET'])
-@jwt_required()
+@admin_required('No tiene permiso para ver autores')
 def admin_get_author_detail(author_id):
     """Obtener detalles de un autor específico con sus libros"""
     try:
-        current_admin_id = get_jwt_identity()
-        current_admin = Admin.query.get(current_admin_id)
-
-        if not current_admin:
-            return unauthorized('No tiene permiso para ver autores')
-        
         author = Author.query.get_or_404(author_id)
         books = Book.query.filter_by(id_autor=author_id).all()
         
@@ -843,16 +1011,10 @@ def admin_get_author_detail(author_id):
         return not_found(str(e))
 
 @admin_bp.route('/admin/books/<int:book_id>', methods=['GET'])
-@jwt_required()
+@admin_required('No tiene permiso para ver libros')
 def admin_get_book_detail(book_id):
     """Obtener detalles de un libro específico"""
     try:
-        current_admin_id = get_jwt_identity()
-        current_admin = Admin.query.get(current_admin_id)
-
-        if not current_admin:
-            return unauthorized('No tiene permiso para ver libros')
-        
         book = Book.query.get_or_404(book_id)
         return jsonify(book.serialize()), 200
     
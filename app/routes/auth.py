@@ -2,12 +2,14 @@ from flask import Blueprint, request, jsonify
 from app.models.user import User
 from app import db
 from flask_jwt_extended import create_access_token
-from werkzeug.security import generate_password_hash, check_password_hash
-from app.errors import bad_request, unauthorized, conflict, internal_error
+from app.errors import bad_request, unauthorized, conflict, internal_error, service_unavailable
+from app.passwords import HasherBusy
+from app.rate_limit import rate_limited
 
 auth_bp = Blueprint('auth', __name__)
 
 @auth_bp.route('/register', methods=['POST'])
+@rate_limited('register', email_field='email')
 def register():
     try:
         data = request.get_json()
@@ -29,9 +31,9 @@ def register():
             nombre_usuario=data['username'],
             apellido_usuario=data.get('last_name', ''),
             email_usuario=data['email'],
-            password_usuario=generate_password_hash(data['password']),
             is_active=True
         )
+        usuario.set_password(data['password'])
 
         db.session.add(usuario)
         db.session.commit()
@@ -45,11 +47,15 @@ def register():
             'user': usuario.serialize_public()
         }), 201
     
+    except HasherBusy as e:
+        db.session.rollback()
+        return service_unavailable(str(e))
     except Exception as e:
         db.session.rollback()
         return internal_error(str(e))
 
 @auth_bp.route('/login', methods=['POST'])
+@rate_limited('login', email_field='email_usuario')
 def login():
     try:
         data = request.get_json()
@@ -68,10 +74,14 @@ def login():
         if not user.is_active:
             return jsonify({'error': 'Tu cuenta ha sido bloqueada. Por favor, contacta al administrador.'}), 401
         
-        # ✅ Verificar contraseña con check_password_hash
-        if not check_password_hash(user.password_usuario, password):
+        # ✅ Verificar contraseña (fuera del hilo de la petición, ver app/passwords.py)
+        if not user.check_password(password):
             return jsonify({'error': 'Credenciales inválidas'}), 401
         
+        # Guardar el hash nuevo si check_password lo regeneró con el método actual
+        if db.session.is_modified(user):
+            db.session.commit()
+        
         # ✅ Crear token
         access_token = create_access_token(identity=str(user.id_usuario))
         
@@ -81,5 +91,8 @@ def login():
             'user': user.serialize_public()
         }), 200
         
+    except HasherBusy as e:
+        return service_unavailable(str(e))
     except Exception as e:
+        db.session.rollback()
         return jsonify({'error': 'Error interno del servidor'}), 500
\ No newline at end of file
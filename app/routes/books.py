@@ -1,23 +1,112 @@
 from flask import Blueprint, request, jsonify
+from datetime import datetime
 from app.models import Book
-from app.models import Author
-from app import db
+from app.models import Author, BookRatingStats, Genre, Rating, User
+from app.rating_stats import COUNTER_COLUMNS
+from app.genre_stats import get_genre_stats
+from app import db, search
 from app.errors import bad_request, not_found, internal_error
+from app.autocomplete import author_index
+from app.cache import cached
+from app.conditional import catalog_conditional
+from app.pagination import get_limit, get_cursor, encode_cursor, page_response, split_page, stored_timestamp
 from flask_jwt_extended import jwt_required, get_jwt_identity
 from sqlalchemy import func
+from sqlalchemy.orm import joinedload
 
 books_bp = Blueprint('books', __name__)
 
+# Columnas que se pueden pedir con ?fields= en el catálogo
+BOOK_FIELDS = {
+    'id_libros': Book.id_libros,
+    'titulo_libro': Book.titulo_libro,
+    'id_autor': Book.id_autor,
+    'genero_libro': Book.genero_libro,
+    'descripcion_libros': Book.descripcion_libros,
+    'enlace_asin_libro': Book.enlace_asin_libro,
+    'enlace_portada_libro': Book.enlace_portada_libro,
+    'created_at': Book.created_at,
+    'updated_at': Book.updated_at
+}
+
+AUTHOR_FIELDS = {
+    'id_autor': Author.id_autor,
+    'nombre_autor': Author.nombre_autor,
+    'apellido_autor': Author.apellido_autor,
+    'biografia_autor': Author.biografia_autor,
+    'created_at': Author.created_at,
+    'updated_at': Author.updated_at
+}
+
+def _parse_book_fields():
+    """Leer ?fields=a,b,c; sin parámetro se devuelven todos los campos"""
+    raw = request.args.get('fields')
+    if not raw:
+        return list(BOOK_FIELDS) + ['autor']
+
+    fields = [field.strip() for field in raw.split(',') if field.strip()]
+    invalid = [field for field in fields if field not in BOOK_FIELDS and field != 'autor']
+    if invalid:
+        raise ValueError(f'Campos inválidos: {", ".join(invalid)}')
+
+    # El id siempre se incluye porque es la clave del cursor
+    if 'id_libros' not in fields:
+        fields.insert(0, 'id_libros')
+    return fields
+
+def _json_value(value):
+    return value.isoformat() if hasattr(value, 'isoformat') else value
+
 @books_bp.route('/books', methods=['GET'])
+@catalog_conditional
 def get_books():
+    """
+    Catálogo paginado por cursor (keyset sobre id_libros)
+    Parámetros: limit, cursor, fields (lista separada por comas, 'autor' incluye el autor)
+    Devuelve la lista de libros; el cursor siguiente va en la cabecera X-Next-Cursor
+    """
     try:
-        books = Book.query.all()
-        return jsonify([libro.serialize() for libro in books]), 200
+        try:
+            limit = get_limit()
+            cursor = get_cursor()
+            fields = _parse_book_fields()
+            if cursor and not isinstance(cursor[0], int):
+                raise ValueError('Cursor inválido')
+        except ValueError as e:
+            return bad_request(str(e))
+
+        book_fields = [field for field in fields if field != 'autor']
+        include_author = 'autor' in fields
+
+        columns = [BOOK_FIELDS[field].label(field) for field in book_fields]
+        if include_author:
+            columns += [column.label(f'autor__{name}') for name, column in AUTHOR_FIELDS.items()]
+
+        query = db.session.query(*columns)
+        if include_author:
+            query = query.select_from(Book).outerjoin(Author, Book.id_autor == Author.id_autor)
+        if cursor:
+            query = query.filter(Book.id_libros > cursor[0])
+
+        rows = query.order_by(Book.id_libros.asc()).limit(limit + 1).all()
+        rows, has_more = split_page(rows, limit)
+
+        books = []
+        for row in rows:
+            data = row._asdict()
+            book = {field: _json_value(data[field]) for field in book_fields}
+            if include_author:
+                author = {name: _json_value(data[f'autor__{name}']) for name in AUTHOR_FIELDS}
+                book['autor'] = author if author['id_autor'] is not None else None
+            books.append(book)
+
+        return page_response(books, encode_cursor(rows[-1].id_libros) if has_more else None), 200
     
     except Exception as e:
         return internal_error(str(e))
 
 @books_bp.route('/books/<int:book_id>', methods=['GET'])
+@catalog_conditional
 def get_book(book_id):
     try:
         libro = Book.query.get_or_404(book_id)
@@ -36,19 +125,19 @@ def get_book(book_id):
         return not_found(str(e))
 
 @books_bp.route('/books/genre/<string:genre>', methods=['GET'])
+@catalog_conditional
+@cached(tags=['catalog'])
 def get_books_by_genre(genre):
     try:
-        genre_map = {
-            'clasicos': 'Clásicos',
-            'ficcion': 'Ficción',
-            'no-ficcion': 'No-Ficción',
-            'ciencia-ficcion': 'Ciencia Ficción',
-            'latinoamericanos': 'Latinoamericano',
-            'historia': 'Historia'
-        }
-
-        genre_normalized = genre_map.get(genre, genre.title())
-        books = Book.query.filter_by(genero_libro=genre_normalized).all()
+        # El slug se resuelve con el índice único de generos y se filtra por id_genero
+        genero = Genre.by_slug(genre)
+        if genero is None:
+            return jsonify([]), 200
+        
+        books = Book.query.filter_by(id_genero=genero.id_genero)\
+            .options(joinedload(Book.autor))\
+            .order_by(Book.id_libros)\
+            .all()
 
         return jsonify([{
             'id': libro.id_libros,
@@ -65,20 +154,50 @@ def get_books_by_genre(genre):
 
 @books_bp.route('/books/search', methods=['GET'])
 def search_books():
+    """
+    Búsqueda de libros por título o autor ordenada por relevancia
+    Parámetros: q (requerido), limit, cursor; el cursor siguiente va en X-Next-Cursor
+    Solo se sirven las primeras SEARCH_MAX_RESULTS posiciones (paginación por OFFSET)
+    """
     try:
         query = request.args.get('q', '')
         if not query:
             return bad_request('Parámetro de búsqueda requerido')
-        
-        books = Book.query.join(Author).filter(
-            db.or_(
-                Book.titulo_libro.ilike(f'%{query}%'),
-                Author.nombre_autor.ilike(f'%{query}%'),
-                Author.apellido_autor.ilike(f'%{query}%')
-            )
-        ).all()
 
-        return jsonify([{
+        try:
+            limit = get_limit()
+            cursor = get_cursor()
+            offset = cursor[0] if cursor else 0
+            if not isinstance(offset, int) or offset < 0:
+                raise ValueError('Cursor inválido')
+            max_results = search.max_results()
+            if offset >= max_results:
+                raise ValueError(f'Solo se pueden recorrer los primeros {max_results} resultados; afina la búsqueda')
+        except ValueError as e:
+            return bad_request(str(e))
+
+        limit = min(limit, max_results - offset)
+        book_ids = search.search_book_ids(query, limit + 1, offset)
+        if book_ids is not None:
+            book_ids, has_more = split_page(book_ids, limit)
+            books_by_id = {
+                libro.id_libros: libro
+                for libro in Book.query.options(joinedload(Book.autor))
+                    .filter(Book.id_libros.in_(book_ids)).all()
+            } if book_ids else {}
+            books = [books_by_id[book_id] for book_id in book_ids if book_id in books_by_id]
+        else:
+            # Sin índice de texto completo (motor no soportado)
+            books = Book.query.join(Author).options(joinedload(Book.autor)).filter(
+                db.or_(
+                    Book.titulo_libro.ilike(f'%{query}%'),
+                    Author.nombre_autor.ilike(f'%{query}%'),
+                    Author.apellido_autor.ilike(f'%{query}%')
+                )
+            ).order_by(Book.id_libros).offset(offset).limit(limit + 1).all()
+            books, has_more = split_page(books, limit)
+
+        return page_response([{
             'id': libro.id_libros,
             'title': libro.titulo_libro,
             'author': f"{libro.autor.nombre_autor} {libro.autor.apellido_autor}",
@@ -86,74 +205,67 @@ def search_books():
             'description': libro.descripcion_libros,
             'cover_url': libro.enlace_portada_libro,
             'amazon_asin': libro.enlace_asin_libro
-        } for libro in books]), 200
+        } for libro in books], encode_cursor(offset + limit) if has_more and offset + limit < max_results else None), 200
     
     except Exception as e:
         return internal_error(str(e))
 
 # NUEVAS RUTAS PARA GÉNEROS
 @books_bp.route('/books/genres/count', methods=['GET'])
+@catalog_conditional
+@cached(tags=['catalog'])
 def get_genres_count():
     try:
-        # Obtener conteo de libros por género
-        genres_count = db.session.query(
-            Book.genero_libro, 
-            func.count(Book.id_libros).label('count')
-        ).group_by(Book.genero_libro).all()
+        # Conteo de libros por género desde estadisticas_genero
+        genres, _ = get_genre_stats()
         
         return jsonify([{
-            'genre': genre,
-            'count': count
-        } for genre, count in genres_count]), 200
+            'genre': genre.genero.nombre_genero,
+            'slug': genre.genero.slug,
+            'count': genre.total_libros
+        } for genre in genres]), 200
     
     except Exception as e:
         return internal_error(str(e))
 
 @books_bp.route('/books/genres/stats', methods=['GET'])
+@catalog_conditional
+@cached(tags=['catalog'])
 def get_genres_stats():
     try:
-        # Obtener estadísticas completas por género
-        genres_stats = db.session.query(
-            Book.genero_libro, 
-            func.count(Book.id_libros).label('total_books'),
-            func.count(func.distinct(Book.id_autor)).label('unique_authors')
-        ).group_by(Book.genero_libro).all()
-        
-        # Obtener total general
-        total_books = db.session.query(func.count(Book.id_libros)).scalar()
-        total_genres = db.session.query(func.count(func.distinct(Book.genero_libro))).scalar()
+        # Estadísticas completas por género desde estadisticas_genero
+        genres, total_books = get_genre_stats()
         
         return jsonify({
             'summary': {
                 'total_books': total_books,
-                'total_genres': total_genres
+                'total_genres': len(genres)
             },
-            'genres': [{
-                'genre': genre,
-                'total_books': total_books,
-                'unique_authors': unique_authors,
-                'percentage': round((total_books / total_books) * 100, 2) if total_books > 0 else 0
-            } for genre, total_books, unique_authors in genres_stats]
+            'genres': [genre.serialize(total_books) for genre in genres]
         }), 200
     
     except Exception as e:
         return internal_error(str(e))
 
 @books_bp.route('/books/genres', methods=['GET'])
+@catalog_conditional
+@cached(tags=['catalog'])
 def get_all_genres():
     try:
-        # Obtener lista única de géneros
-        genres = db.session.query(Book.genero_libro).distinct().all()
+        # Lista única de géneros desde estadisticas_genero
+        genres, _ = get_genre_stats()
         
         return jsonify({
             'total_genres': len(genres),
-            'genres': [genre[0] for genre in genres]
+            'genres': [genre.genero.nombre_genero for genre in genres]
         }), 200
     
     except Exception as e:
         return internal_error(str(e))
     
 @books_bp.route('/authors/<int:author_id>/profile', methods=['GET'])
+@catalog_conditional
+@cached(tags=['catalog'])
 def get_author_profile(author_id):
     """
     Obtener perfil completo del autor para la página de autor en React
@@ -208,26 +320,16 @@ def search_authors_simple():
         if not query or len(query) < 2:
             return jsonify([]), 200  # Devuelve array vacío si query es muy corta
         
-        authors = Author.query.filter(
-            db.or_(
-                Author.nombre_autor.ilike(f'%{query}%'),
-                Author.apellido_autor.ilike(f'%{query}%'),
-                db.func.concat(Author.nombre_autor, ' ', Author.apellido_autor).ilike(f'%{query}%')
-            )
-        ).limit(10).all()  # Limitar a 10 resultados para el autocomplete
-
-        return jsonify([{
-            'id_autor': autor.id_autor,
-            'nombre_completo': f"{autor.nombre_autor} {autor.apellido_autor}",
-            'total_libros': len(autor.libros) if autor.libros else 0,
-            'primer_genero': autor.libros[0].genero_libro if autor.libros else 'Sin género'
-        } for autor in authors]), 200
+        # Respondido desde el índice en memoria (sin consultar la base de datos)
+        return jsonify(author_index.search(query, limit=10)), 200
     
     except Exception as e:
         return internal_error(str(e))
 
 
 @books_bp.route('/authors', methods=['GET'])
+@catalog_conditional
+@cached(tags=['catalog'])
 def get_authors():
     try:
        
@@ -244,36 +346,65 @@ def get_authors():
 @books_bp.route('/books/<int:book_id>/reviews', methods=['GET'])
 def get_book_reviews(book_id):
     """
-    Obtener todas las reseñas de un libro específico
+    Reseñas de un libro paginadas por cursor (created_at, id_calificacion), más recientes primero
     EXCLUYE reseñas de usuarios bloqueados (is_active = False)
+    Parámetros: limit, cursor, only_with_text (true/false); el cursor siguiente va en X-Next-Cursor
     """
     try:
+        try:
+            limit = get_limit()
+            cursor = get_cursor(2)
+            if cursor and not (isinstance(cursor[0], datetime) and isinstance(cursor[1], int)):
+                raise ValueError('Cursor inválido')
+        except ValueError as e:
+            return bad_request(str(e))
+        only_with_text = request.args.get('only_with_text', 'false').lower() in ('1', 'true', 'yes')
+        
         # Verificar que el libro existe
-        book = Book.query.get_or_404(book_id)
+        if db.session.get(Book, book_id) is None:
+            return not_found('Libro no encontrado')
         
-        # Obtener solo reseñas de usuarios activos
-        from app.models import Rating, User
-        reviews = Rating.query.filter_by(id_libro=book_id)\
-            .join(User)\
-            .filter(User.is_active == True)\
-            .order_by(Rating.created_at.desc())\
+        # Reseñas de usuarios activos con el nombre del usuario en la misma consulta
+        query = db.session.query(
+            Rating.id_calificacion,
+            Rating.calificacion,
+            Rating.resena,
+            Rating.created_at,
+            User.id_usuario,
+            User.nombre_usuario,
+            User.apellido_usuario
+        ).join(User, User.id_usuario == Rating.id_usuario)\
+            .filter(Rating.id_libro == book_id)\
+            .filter(User.is_active == True)
+        
+        if only_with_text:
+            query = query.filter(Rating.resena.isnot(None), Rating.resena != '')
+        
+        if cursor:
+            # El cursor lleva los valores de la última fila: sigue funcionando
+            # aunque esa reseña se borre entre una página y la siguiente
+            last_created_at, last_id = stored_timestamp(cursor[0]), cursor[1]
+            query = query.filter(db.or_(
+                Rating.created_at < last_created_at,
+                db.and_(Rating.created_at == last_created_at, Rating.id_calificacion < last_id)
+            ))
+        
+        rows = query.order_by(Rating.created_at.desc(), Rating.id_calificacion.desc())\
+            .limit(limit + 1)\
             .all()
+        rows, has_more = split_page(rows, limit)
         
-        reviews_data = []
-        for review in reviews:
-            # Obtener nombre completo del usuario
-            nombre_completo = f"{review.usuario.nombre_usuario} {review.usuario.apellido_usuario}"
-            
-            reviews_data.append({
-                'id_calificacion': review.id_calificacion,
-                'calificacion': review.calificacion,
-                'resena': review.resena,
-                'created_at': review.created_at.isoformat() if review.created_at else None,
-                'usuario_nombre_completo': nombre_completo,  # ✅ Campo directo
-                'usuario_id': review.usuario.id_usuario
-            })
+        reviews_data = [{
+            'id_calificacion': row.id_calificacion,
+            'calificacion': row.calificacion,
+            'resena': row.resena,
+            'created_at': row.created_at.isoformat() if row.created_at else None,
+            'usuario_nombre_completo': f"{row.nombre_usuario} {row.apellido_usuario}",
+            'usuario_id': row.id_usuario
+        } for row in rows]
         
-        return jsonify(reviews_data), 200
+        next_cursor = encode_cursor(rows[-1].created_at, rows[-1].id_calificacion) if has_more else None
+        return page_response(reviews_data, next_cursor), 200
     
     except Exception as e:
         return internal_error(str(e))
@@ -285,27 +416,12 @@ def get_book_reviews_stats(book_id):
     EXCLUYE reseñas de usuarios bloqueados
     """
     try:
-        from app.models import Rating, User
-        
-        # Solo estadísticas básicas
-        total_reviews = db.session.query(Rating)\
-            .join(User)\
-            .filter(Rating.id_libro == book_id)\
-            .filter(User.is_active == True)\
-            .count()
-        
-        # Calificación promedio solo de usuarios activos
-        avg_rating = db.session.query(func.avg(Rating.calificacion))\
-            .join(User)\
-            .filter(Rating.id_libro == book_id)\
-            .filter(User.is_active == True)\
-            .filter(Rating.calificacion.isnot(None))\
-            .scalar() or 0
+        # Lectura O(1) de los agregados mantenidos en estadisticas_calificacion
+        stats = db.session.get(BookRatingStats, book_id)
+        if stats is None:
+            stats = BookRatingStats(id_libro=book_id, **{column: 0 for column in COUNTER_COLUMNS})
         
-        return jsonify({
-            'total_reviews': total_reviews,
-            'average_rating': round(float(avg_rating), 2)
-        }), 200
+        return jsonify(stats.serialize()), 200
     
     except Exception as e:
         return internal_error(str(e))
\ No newline at end of file
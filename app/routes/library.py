@@ -1,13 +1,17 @@
 from flask import Blueprint, request, jsonify
 from app.models import UserLibrary, Book, Rating
-from app import db
+from app import db, rating_stats
 from app.errors import bad_request, not_found, internal_error
 from flask_jwt_extended import jwt_required, get_jwt_identity
+from sqlalchemy.exc import IntegrityError
+from app.cache import cache, cached
+from sqlalchemy.orm import joinedload
 
 library_bp = Blueprint('library', __name__)
 
 @library_bp.route('/my-library', methods=['GET'])
 @jwt_required()
+@cached(tags=['catalog'], per_user=True)
 def get_my_library():
     """
     Obtener la librería personal completa del usuario actual
@@ -16,11 +20,17 @@ def get_my_library():
     try:
         user_id = get_jwt_identity()
         
-        # ✅ Get books from UserLibrary (quiero_leer y leyendo)
-        user_library = UserLibrary.query.filter_by(id_usuario=user_id).all()
+        # ✅ Get books from UserLibrary (quiero_leer y leyendo) con libro y autor en la misma consulta
+        user_library = UserLibrary.query.filter_by(id_usuario=user_id)\
+            .options(joinedload(UserLibrary.libro, innerjoin=True).joinedload(Book.autor))\
+            .order_by(UserLibrary.id_biblioteca)\
+            .all()
         
-        # ✅ Get books from Rating (leido)
-        read_books = Rating.query.filter_by(id_usuario=user_id).all()
+        # ✅ Get books from Rating (leido) con libro y autor en la misma consulta
+        read_books = Rating.query.filter_by(id_usuario=user_id)\
+            .options(joinedload(Rating.libro, innerjoin=True).joinedload(Book.autor))\
+            .order_by(Rating.id_calificacion)\
+            .all()
         
         # Organize by reading state
         quiero_leer_books = []
@@ -29,7 +39,7 @@ def get_my_library():
         
         # Process UserLibrary books
         for item in user_library:
-            book = Book.query.get(item.id_libro)
+            book = item.libro
             if book:
                 book_data = {
                     'library_id': item.id_biblioteca,
@@ -44,7 +54,7 @@ def get_my_library():
         
         # ✅ Process Rating books (leido)
         for rating in read_books:
-            book = Book.query.get(rating.id_libro)
+            book = rating.libro
             if book:
                 leido_books.append({
                     'rating_id': rating.id_calificacion,
@@ -128,6 +138,7 @@ def add_book_to_my_library():
         
         db.session.add(library_item)
         db.session.commit()
+        cache.invalidate(f'user:{user_id}')
         
         return jsonify({
             'message': 'Libro agregado a tu librería personal exitosamente',
@@ -135,6 +146,11 @@ def add_book_to_my_library():
             'reading_state': reading_state
         }), 201
     
+    except IntegrityError:
+        # Dos peticiones simultáneas: el índice único rechaza la segunda
+        db.session.rollback()
+        return bad_request('El libro ya está en tu librería')
+    
     except Exception as e:
         db.session.rollback()
         return internal_error(str(e))
@@ -179,6 +195,7 @@ def update_book_in_library(book_id):
         # Actualizar estado de lectura
         library_item.estado_lectura = new_state
         db.session.commit()
+        cache.invalidate(f'user:{user_id}')
         
         return jsonify({
             'message': 'Estado de lectura actualizado exitosamente',
@@ -209,6 +226,7 @@ def remove_book_from_my_library(book_id):
         
         db.session.delete(library_item)
         db.session.commit()
+        cache.invalidate(f'user:{user_id}')
         
         return jsonify({
             'message': 'Libro removido de tu librería personal exitosamente'
@@ -306,7 +324,15 @@ def mark_book_as_read(book_id):
         )
         
         db.session.add(new_rating)
+        try:
+            # Solo un conflicto al insertar la calificación significa que ya estaba leído
+            db.session.flush()
+        except IntegrityError:
+            db.session.rollback()
+            return bad_request('Este libro ya está marcado como leído. Usa el endpoint PATCH para actualizar la calificación o reseña.')
+        rating_stats.rating_added(user_id, book_id, calificacion, resena)
         db.session.commit()
+        cache.invalidate(f'user:{user_id}')
         
         return jsonify({
             'message': 'Libro marcado como leído exitosamente',
@@ -354,6 +380,7 @@ def update_book_rating(book_id):
         
         # Track if anything was updated
         updated = False
+        previous = (rating.calificacion, rating.resena)
         
         # ✅ Update calificacion if provided and not null
         if 'calificacion' in data and calificacion is not None:
@@ -374,7 +401,9 @@ def update_book_rating(book_id):
         if not updated:
             return bad_request('No se proporcionaron campos válidos para actualizar')
         
+        rating_stats.rating_changed(user_id, book_id, previous, (rating.calificacion, rating.resena))
         db.session.commit()
+        cache.invalidate(f'user:{user_id}')
         
         return jsonify({
             'message': 'Calificación actualizada exitosamente',
@@ -426,10 +455,12 @@ def completely_remove_book_from_library(book_id):
         
         # Eliminar de Rating si existe
         if rating_item:
+            rating_stats.rating_removed(user_id, book_id, rating_item.calificacion, rating_item.resena)
             db.session.delete(rating_item)
             print(f"⭐ Reseña removida de Rating para usuario {user_id}")
         
         db.session.commit()
+        cache.invalidate(f'user:{user_id}')
         
         return jsonify({
             'message': 'Libro y reseña eliminados completamente de tu biblioteca'
@@ -3,11 +3,135 @@ from flask import Blueprint, request, jsonify
 from app.models.user import User
 from app.models import UserLibrary, Rating, Book, Author
 from app import db
-from app.errors import bad_request, not_found, internal_error, conflict
+from app.errors import bad_request, not_found, internal_error, conflict, service_unavailable
+from app.passwords import HasherBusy
 from flask_jwt_extended import jwt_required, get_jwt_identity
+from sqlalchemy import func, case
+from app.cache import cache, cached
 
 profile_bp = Blueprint('profile', __name__)
 
+def _author_name(nombre, apellido):
+    if nombre is None:
+        return "Autor desconocido"
+    return f"{nombre} {apellido}"
+
+def _profile_statistics(user_id):
+    """
+    Estadísticas del perfil calculadas con consultas agrupadas:
+    conteos por estado, leídos/reseñas desde calificacion y top 5 autores
+    """
+    library_counts = dict(
+        db.session.query(UserLibrary.estado_lectura, func.count(UserLibrary.id_biblioteca))
+        .filter(UserLibrary.id_usuario == user_id)
+        .group_by(UserLibrary.estado_lectura)
+        .all()
+    )
+
+    total_read, total_reviews = db.session.query(
+        func.count(Rating.id_calificacion),
+        func.count(case((func.coalesce(Rating.resena, '') != '', 1)))
+    ).filter(Rating.id_usuario == user_id).one()
+
+    # Autores más leídos: los libros leídos están en calificacion
+    top_authors = db.session.query(
+        Author.nombre_autor,
+        Author.apellido_autor,
+        func.count(Rating.id_calificacion).label('books_count')
+    ).join(Book, Book.id_libros == Rating.id_libro)\
+        .join(Author, Author.id_autor == Book.id_autor)\
+        .filter(Rating.id_usuario == user_id)\
+        .group_by(Author.id_autor, Author.nombre_autor, Author.apellido_autor)\
+        .order_by(func.count(Rating.id_calificacion).desc(), Author.id_autor)\
+        .limit(5)\
+        .all()
+
+    return {
+        'statistics': {
+            'totalBooksRead': total_read,
+            'totalBooksReading': library_counts.get('leyendo', 0),
+            'totalBooksToRead': library_counts.get('quiero_leer', 0),
+            'totalReviews': total_reviews
+        },
+        'topAuthors': [
+            {'name': _author_name(nombre, apellido), 'booksCount': count}
+            for nombre, apellido, count in top_authors
+        ]
+    }
+
+def _reading_lists(user_id):
+    """Listas de lectura: leídos desde calificacion, el resto desde biblioteca_usuario"""
+    books_read = []
+    books_reading = []
+    books_to_read = []
+
+    read_rows = db.session.query(
+        Book.id_libros, Book.titulo_libro, Book.enlace_portada_libro,
+        Author.nombre_autor, Author.apellido_autor, Rating.calificacion
+    ).join(Book, Book.id_libros == Rating.id_libro)\
+        .outerjoin(Author, Author.id_autor == Book.id_autor)\
+        .filter(Rating.id_usuario == user_id)\
+        .order_by(Rating.id_calificacion)\
+        .all()
+
+    for book_id, titulo, portada, nombre, apellido, calificacion in read_rows:
+        books_read.append({
+            'id': book_id,
+            'title': titulo,
+            'author': _author_name(nombre, apellido),
+            'cover_url': portada,
+            'rating': calificacion
+        })
+
+    library_rows = db.session.query(
+        Book.id_libros, Book.titulo_libro, Book.enlace_portada_libro,
+        Author.nombre_autor, Author.apellido_autor, UserLibrary.estado_lectura
+    ).join(Book, Book.id_libros == UserLibrary.id_libro)\
+        .outerjoin(Author, Author.id_autor == Book.id_autor)\
+        .filter(UserLibrary.id_usuario == user_id)\
+        .order_by(UserLibrary.id_biblioteca)\
+        .all()
+
+    for book_id, titulo, portada, nombre, apellido, estado in library_rows:
+        book_data = {
+            'id': book_id,
+            'title': titulo,
+            'author': _author_name(nombre, apellido),
+            'cover_url': portada
+        }
+        if estado == 'leyendo':
+            books_reading.append(book_data)
+        else:  # 'quiero_leer'
+            books_to_read.append(book_data)
+
+    return {
+        'read': books_read,
+        'reading': books_reading,
+        'toRead': books_to_read
+    }
+
+def _recent_reviews(user_id, limit=10):
+    """Últimas reseñas con texto, unidas a su libro en una sola consulta"""
+    rows = db.session.query(
+        Rating.id_calificacion, Rating.calificacion, Rating.resena, Rating.created_at,
+        Book.id_libros, Book.titulo_libro
+    ).join(Book, Book.id_libros == Rating.id_libro)\
+        .filter(Rating.id_usuario == user_id)\
+        .filter(Rating.resena.isnot(None), Rating.resena != '')\
+        .order_by(Rating.created_at.desc(), Rating.id_calificacion.desc())\
+        .limit(limit)\
+        .all()
+
+    return [{
+        'id': review_id,
+        'bookId': book_id,
+        'bookTitle': titulo,
+        'rating': calificacion,
+        'comment': resena,
+        'date': created_at.strftime('%Y-%m-%d') if created_at else None,
+        'likes': 0  # Sistema de likes para futuro
+    } for review_id, calificacion, resena, created_at, book_id, titulo in rows]
+
 @profile_bp.route('/profile', methods=['GET'])
 @jwt_required()
 def get_user_profile():
@@ -32,99 +156,15 @@ def get_user_profile():
             'lastLogin': usuario.updated_at.strftime('%Y-%m-%d') if usuario.updated_at else None
         }
         
-        # Obtener todos los libros en la librería del usuario
-        user_library_items = UserLibrary.query.filter_by(id_usuario=current_user_id).all()
-        
-        # Separar libros por estado de lectura
-        books_read = []
-        books_reading = []
-        books_to_read = []
-        
-        for item in user_library_items:
-            book = Book.query.get(item.id_libro)
-            if not book:
-                continue
-                
-            # Obtener la calificación/reseña si existe
-            rating = Rating.query.filter_by(
-                id_usuario=current_user_id, 
-                id_libro=item.id_libro
-            ).first()
-            
-            # Obtener nombre del autor
-            author_name = "Autor desconocido"
-            if book.id_autor:
-                author = Author.query.get(book.id_autor)
-                if author:
-                    author_name = f"{author.nombre_autor} {author.apellido_autor}"
-            
-            book_data = {
-                'id': book.id_libros,  # ✅ CORREGIDO
-                'title': book.titulo_libro,  # ✅ CORREGIDO
-                'author': author_name,  # ✅ CORREGIDO
-                'cover_url': book.enlace_portada_libro  # ✅ CORREGIDO
-            }
-            
-            # Agregar calificación si existe
-            if rating:
-                book_data['rating'] = rating.calificacion
-            
-            # Clasificar por estado de lectura
-            if item.estado_lectura == 'leido':
-                books_read.append(book_data)
-            elif item.estado_lectura == 'leyendo':
-                books_reading.append(book_data)
-            else:  # 'quiero_leer'
-                books_to_read.append(book_data)
-        
-        # Calcular autores más leídos (solo de libros leídos)
-        author_counts = {}
-        for book in books_read:
-            author = book['author']
-            if author != "Autor desconocido":
-                author_counts[author] = author_counts.get(author, 0) + 1
-        
-        top_authors = [
-            {'name': author, 'booksCount': count}
-            for author, count in sorted(author_counts.items(), key=lambda x: x[1], reverse=True)
-        ][:5]  # Top 5 autores
-        
-        # Obtener reseñas recientes
-        recent_reviews = Rating.query.filter_by(id_usuario=current_user_id)\
-            .order_by(Rating.created_at.desc())\
-            .limit(10)\
-            .all()
-        
-        reviews_data = []
-        for review in recent_reviews:
-            book = Book.query.get(review.id_libro)
-            if book and review.resena:  # Solo incluir si hay reseña escrita
-                reviews_data.append({
-                    'id': review.id_calificacion,
-                    'bookId': book.id_libros,  # ✅ CORREGIDO
-                    'bookTitle': book.titulo_libro,  # ✅ CORREGIDO
-                    'rating': review.calificacion,
-                    'comment': review.resena,
-                    'date': review.created_at.strftime('%Y-%m-%d') if review.created_at else None,
-                    'likes': 0  # Sistema de likes para futuro
-                })
+        stats = _profile_statistics(usuario.id_usuario)
         
         # Respuesta completa
         profile_data = {
             'user': user_basic,
-            'statistics': {
-                'totalBooksRead': len(books_read),
-                'totalBooksReading': len(books_reading),
-                'totalBooksToRead': len(books_to_read),
-                'totalReviews': len(reviews_data)
-            },
-            'readingLists': {
-                'read': books_read,
-                'reading': books_reading,
-                'toRead': books_to_read
-            },
-            'topAuthors': top_authors,
-            'recentReviews': reviews_data
+            'statistics': stats['statistics'],
+            'readingLists': _reading_lists(usuario.id_usuario),
+            'topAuthors': stats['topAuthors'],
+            'recentReviews': _recent_reviews(usuario.id_usuario)
         }
         
         return jsonify(profile_data), 200
@@ -134,6 +174,27 @@ def get_user_profile():
         return internal_error(str(e))
 
 
+@profile_bp.route('/profile/statistics', methods=['GET'])
+@jwt_required()
+@cached(tags=['catalog'], per_user=True)
+def get_user_profile_statistics():
+    """
+    Solo el bloque de estadísticas y top autores del perfil
+    (se puede cachear por separado de las listas de lectura)
+    """
+    try:
+        current_user_id = get_jwt_identity()
+        
+        usuario = User.query.get(current_user_id)
+        if not usuario:
+            return not_found('Usuario no encontrado')
+        
+        return jsonify(_profile_statistics(usuario.id_usuario)), 200
+        
+    except Exception as e:
+        return internal_error(str(e))
+
+
 @profile_bp.route('/profile', methods=['PUT'])
 @jwt_required()
 def update_user_profile():
@@ -173,6 +234,7 @@ def update_user_profile():
             usuario.set_password(data['password'])
         
         db.session.commit()
+        cache.invalidate(f'user:{current_user_id}')
         
         return jsonify({
             'message': 'Perfil actualizado exitosamente',
@@ -184,6 +246,9 @@ def update_user_profile():
             }
         }), 200
         
+    except HasherBusy as e:
+        db.session.rollback()
+        return service_unavailable(str(e))
     except Exception as e:
         db.session.rollback()
         return internal_error(str(e))
\ No newline at end of file
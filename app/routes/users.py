@@ -1,28 +1,114 @@
-from flask import Blueprint, request, jsonify
-from app.models import User
+import json
+from flask import Blueprint, Response, current_app, request, jsonify, stream_with_context
+from app.models import User, UserLibrary, Rating
 from app import db
 from app.errors import bad_request, not_found, internal_error
+from app.pagination import NEXT_CURSOR_HEADER, get_limit, get_cursor, encode_cursor
+from sqlalchemy import select, func
 from flask_jwt_extended import jwt_required, get_jwt_identity
 
 users_bp = Blueprint('users', __name__)
 
+STREAM_BATCH_SIZE = 100
+
+def _public_users_query(limit, after_id=None):
+    """
+    Página de usuarios activos con sus totales.
+    Los conteos se agrupan solo sobre los ids de la página (LEFT JOIN a subconsultas
+    agrupadas), en lugar de cargar las colecciones biblioteca/calificaciones de cada usuario.
+    """
+    page = select(User.id_usuario).where(User.is_active == True)
+    if after_id is not None:
+        page = page.where(User.id_usuario > after_id)
+    page = page.order_by(User.id_usuario).limit(limit).subquery()
+
+    library_counts = select(UserLibrary.id_usuario, func.count().label('total'))\
+        .where(UserLibrary.id_usuario.in_(select(page.c.id_usuario)))\
+        .group_by(UserLibrary.id_usuario).subquery()
+    rating_counts = select(Rating.id_usuario, func.count().label('total'))\
+        .where(Rating.id_usuario.in_(select(page.c.id_usuario)))\
+        .group_by(Rating.id_usuario).subquery()
+
+    return select(
+        User.id_usuario,
+        User.nombre_usuario,
+        User.apellido_usuario,
+        User.created_at,
+        func.coalesce(library_counts.c.total, 0).label('total_libros_biblioteca'),
+        func.coalesce(rating_counts.c.total, 0).label('total_resenas')
+    ).join(page, page.c.id_usuario == User.id_usuario)\
+        .outerjoin(library_counts, library_counts.c.id_usuario == User.id_usuario)\
+        .outerjoin(rating_counts, rating_counts.c.id_usuario == User.id_usuario)\
+        .order_by(User.id_usuario)
+
+def _last_id_if_more(limit, after_id=None):
+    """Último id de la página si hay otra después (solo lee ids de usuarios activos)"""
+    ids = select(User.id_usuario).where(User.is_active == True)
+    if after_id is not None:
+        ids = ids.where(User.id_usuario > after_id)
+    ids = db.session.execute(ids.order_by(User.id_usuario).offset(limit - 1).limit(2)).scalars().all()
+    return ids[0] if len(ids) == 2 else None
+
 @users_bp.route('/users/public', methods=['GET'])
 def get_public_users():
     """
     Obtener lista pública de usuarios (sin necesidad de token)
     Solo información básica para mostrar en la interfaz
+    Parámetros: limit, cursor. La respuesta (una lista) se envía en streaming fila
+    a fila; el cursor de la siguiente página va en la cabecera X-Next-Cursor
     """
     try:
-        users = User.query.filter_by(is_active=True).all()
+        try:
+            limit = get_limit(default=50, maximum=500)
+            cursor = get_cursor()
+            if cursor and not isinstance(cursor[0], int):
+                raise ValueError('Cursor inválido')
+        except ValueError as e:
+            return bad_request(str(e))
+        
+        # Las cabeceras salen antes que el cuerpo: el cursor se calcula primero
+        # recorriendo solo ids, y la página se corta en ese id
+        after_id = cursor[0] if cursor else None
+        last_id = _last_id_if_more(limit, after_id)
+        
+        # La consulta y el primer bloque de filas se ejecutan antes de crear la
+        # respuesta: un error aquí todavía puede devolverse como 500
+        statement = _public_users_query(limit, after_id)
+        result = db.session.execute(statement.execution_options(yield_per=STREAM_BATCH_SIZE))
+        first_batch = result.fetchmany(STREAM_BATCH_SIZE)
+        
+        def rows():
+            yield from first_batch
+            yield from result
+        
+        def generate():
+            yield '['
+            sent = 0
+            try:
+                for row in rows():
+                    if last_id is not None and row.id_usuario > last_id:
+                        break
+                    yield (',' if sent else '') + json.dumps({
+                        "id_usuario": row.id_usuario,
+                        "nombre_usuario": row.nombre_usuario,
+                        "apellido_usuario": row.apellido_usuario,
+                        "miembro_desde": row.created_at.strftime('%Y-%m-%d') if row.created_at else None,
+                        "total_libros_biblioteca": row.total_libros_biblioteca,
+                        "total_resenas": row.total_resenas
+                    }, ensure_ascii=False)
+                    sent += 1
+                yield ']'
+            except Exception as e:
+                # El estado 200 ya se envió: se corta el JSON sin cerrar la lista
+                # para que el cliente no tome la página incompleta por válida
+                current_app.logger.exception(f"Error enviando /users/public: {e}")
+            finally:
+                result.close()
         
-        return jsonify([{
-            "id_usuario": user.id_usuario,
-            "nombre_usuario": user.nombre_usuario,
-            "apellido_usuario": user.apellido_usuario,
-            "miembro_desde": user.created_at.strftime('%Y-%m-%d') if user.created_at else None,
-            "total_libros_biblioteca": len(user.biblioteca) if user.biblioteca else 0,
-            "total_resenas": len(user.calificaciones) if user.calificaciones else 0
-        } for user in users]), 200
+        response = Response(stream_with_context(generate()), status=200, mimetype='application/json')
+        if last_id is not None:
+            response.headers[NEXT_CURSOR_HEADER] = encode_cursor(last_id)
+        return response
     
     except Exception as e:
         return internal_error(str(e))
@@ -0,0 +1,234 @@
+# app/search.py
+"""
+Índice de búsqueda de texto completo para el catálogo de libros.
+
+- SQLite: tabla virtual FTS5 `libros_fts` (rowid = id_libros)
+- PostgreSQL: tabla `libros_busqueda` con columna tsvector e índice GIN
+- Otros motores: se usa la búsqueda ILIKE original
+
+El texto se normaliza (minúsculas y sin acentos) antes de indexarlo, así que
+"garcia" encuentra "García" en ambos motores.
+
+Las tablas del índice las crea la migración 1c8f6e2b4d90 (o `flask
+search-reindex` si la base se creó con create_all). El arranque no ejecuta DDL
+ni recuentos: el motor se detecta en el primer uso comprobando si existe la
+tabla del índice, y si falta se usa ILIKE.
+
+La paginación es por desplazamiento (OFFSET), así que cada página recorre todas
+las coincidencias anteriores; por eso solo se sirven las primeras
+SEARCH_MAX_RESULTS posiciones (1000 por defecto).
+"""
+import re
+import unicodedata
+from flask import current_app
+from sqlalchemy import inspect, text
+from app.database import db
+
+EXTENSION_KEY = 'search_backend'
+DEFAULT_MAX_RESULTS = 1000
+INDEX_TABLES = {'sqlite': ('fts5', 'libros_fts'), 'postgresql': ('postgres', 'libros_busqueda')}
+
+
+def normalize_text(value):
+    """Pasar a minúsculas y quitar acentos/diacríticos"""
+    if not value:
+        return ''
+    decomposed = unicodedata.normalize('NFKD', value)
+    return ''.join(c for c in decomposed if not unicodedata.combining(c)).lower()
+
+
+def tokenize(value):
+    """Dividir un texto normalizado en palabras"""
+    return re.findall(r'\w+', normalize_text(value))
+
+
+def get_backend():
+    """'fts5', 'postgres' o None; se detecta una vez por proceso"""
+    if EXTENSION_KEY not in current_app.extensions:
+        current_app.extensions[EXTENSION_KEY] = _detect_backend()
+    return current_app.extensions[EXTENSION_KEY]
+
+
+def _detect_backend():
+    backend, table = INDEX_TABLES.get(db.engine.dialect.name, (None, None))
+    if backend and inspect(db.engine).has_table(table):
+        return backend
+    return None
+
+
+def max_results():
+    return int(current_app.config.get('SEARCH_MAX_RESULTS', DEFAULT_MAX_RESULTS))
+
+
+def create_index():
+    """Crear las tablas del índice si no existen (bases creadas con create_all)"""
+    dialect = db.engine.dialect.name
+    try:
+        if dialect == 'sqlite':
+            db.session.execute(text(
+                "CREATE VIRTUAL TABLE IF NOT EXISTS libros_fts "
+                "USING fts5(titulo, autor, tokenize='unicode61 remove_diacritics 2')"
+            ))
+        elif dialect == 'postgresql':
+            db.session.execute(text(
+                "CREATE TABLE IF NOT EXISTS libros_busqueda ("
+                "id_libros INTEGER PRIMARY KEY REFERENCES libros (id_libros) ON DELETE CASCADE, "
+                "documento TSVECTOR NOT NULL)"
+            ))
+            db.session.execute(text(
+                "CREATE INDEX IF NOT EXISTS ix_libros_busqueda_documento "
+                "ON libros_busqueda USING GIN (documento)"
+            ))
+        db.session.commit()
+    except Exception as e:
+        db.session.rollback()
+        print(f"⚠️ Índice de búsqueda no disponible, se usará ILIKE: {e}")
+    current_app.extensions[EXTENSION_KEY] = _detect_backend()
+    return get_backend()
+
+
+def _index_table():
+    return 'libros_fts' if get_backend() == 'fts5' else 'libros_busqueda'
+
+
+def _index_rows(book_rows):
+    """Insertar/actualizar filas (id_libros, titulo, nombre, apellido) en el índice"""
+    backend = get_backend()
+    params = [{
+        'id': book_id,
+        'titulo': normalize_text(titulo),
+        'autor': normalize_text(f"{nombre or ''} {apellido or ''}")
+    } for book_id, titulo, nombre, apellido in book_rows]
+    if not backend or not params:
+        return
+
+    if backend == 'fts5':
+        db.session.execute(
+            text("DELETE FROM libros_fts WHERE rowid = :id"),
+            [{'id': p['id']} for p in params]
+        )
+        db.session.execute(
+            text("INSERT INTO libros_fts (rowid, titulo, autor) VALUES (:id, :titulo, :autor)"),
+            params
+        )
+    else:
+        db.session.execute(text(
+            "INSERT INTO libros_busqueda (id_libros, documento) VALUES ("
+            ":id, setweight(to_tsvector('simple', :titulo), 'A') || "
+            "setweight(to_tsvector('simple', :autor), 'B')) "
+            "ON CONFLICT (id_libros) DO UPDATE SET documento = EXCLUDED.documento"
+        ), params)
+
+
+def _book_rows_query():
+    from app.models import Book, Author
+    return db.session.query(
+        Book.id_libros, Book.titulo_libro, Author.nombre_autor, Author.apellido_autor
+    ).outerjoin(Author, Book.id_autor == Author.id_autor)
+
+
+def index_book(book_id):
+    """Indexar (o reindexar) un libro. Se ejecuta dentro de la transacción del llamador"""
+    from app.models import Book
+    _index_rows(_book_rows_query().filter(Book.id_libros == book_id).all())
+
+
+def index_books(book_ids):
+    """Indexar (o reindexar) varios libros en lote"""
+    from app.models import Book
+    book_ids = list(book_ids)
+    if book_ids:
+        _index_rows(_book_rows_query().filter(Book.id_libros.in_(book_ids)).all())
+
+
+def index_author_books(author_id):
+    """Reindexar todos los libros de un autor (p. ej. tras cambiar su nombre)"""
+    from app.models import Book
+    _index_rows(_book_rows_query().filter(Book.id_autor == author_id).all())
+
+
+def remove_books(book_ids):
+    """Quitar libros del índice"""
+    backend = get_backend()
+    book_ids = list(book_ids)
+    if not backend or not book_ids:
+        return
+    if backend == 'fts5':
+        statement = text("DELETE FROM libros_fts WHERE rowid = :id")
+    else:
+        statement = text("DELETE FROM libros_busqueda WHERE id_libros = :id")
+    db.session.execute(statement, [{'id': book_id} for book_id in book_ids])
+
+
+def remove_author_books(author_id):
+    """Quitar del índice todos los libros de un autor (antes de borrarlos)"""
+    backend = get_backend()
+    if backend == 'fts5':
+        db.session.execute(text(
+            "DELETE FROM libros_fts WHERE rowid IN (SELECT id_libros FROM libros WHERE id_autor = :id)"
+        ), {'id': author_id})
+    elif backend:
+        db.session.execute(text(
+            "DELETE FROM libros_busqueda WHERE id_libros IN (SELECT id_libros FROM libros WHERE id_autor = :id)"
+        ), {'id': author_id})
+
+
+def rebuild_index(batch_size=1000):
+    """Vaciar y volver a construir el índice completo"""
+    if not get_backend():
+        return 0
+    from app.models import Book
+    db.session.execute(text(f"DELETE FROM {_index_table()}"))
+
+    total = 0
+    batch = []
+    for row in _book_rows_query().order_by(Book.id_libros).yield_per(batch_size):
+        batch.append(tuple(row))
+        if len(batch) >= batch_size:
+            _index_rows(batch)
+            total += len(batch)
+            batch = []
+    _index_rows(batch)
+    total += len(batch)
+
+    db.session.commit()
+    return total
+
+
+def search_book_ids(query, limit, offset=0):
+    """
+    Buscar libros por título o autor ordenados por relevancia.
+    Devuelve una lista de id_libros, o None si no hay índice disponible.
+    El coste crece con offset: el llamador lo limita a max_results().
+    """
+    backend = get_backend()
+    tokens = tokenize(query)
+    if not backend or not tokens:
+        return None
+
+    if backend == 'fts5':
+        match = ' AND '.join(f'"{token}"*' for token in tokens)
+        rows = db.session.execute(text(
+            "SELECT rowid FROM libros_fts WHERE libros_fts MATCH :match "
+            "ORDER BY bm25(libros_fts, 2.0, 1.0), rowid LIMIT :limit OFFSET :offset"
+        ), {'match': match, 'limit': limit, 'offset': offset})
+    else:
+        tsquery = ' & '.join(f'{token}:*' for token in tokens)
+        rows = db.session.execute(text(
+            "SELECT id_libros FROM libros_busqueda, to_tsquery('simple', :tsquery) AS q "
+            "WHERE documento @@ q "
+            "ORDER BY ts_rank(documento, q) DESC, id_libros LIMIT :limit OFFSET :offset"
+        ), {'tsquery': tsquery, 'limit': limit, 'offset': offset})
+
+    return [row[0] for row in rows]
+
+
+def register_search_commands(app):
+    @app.cli.command('search-reindex')
+    def search_reindex():
+        """Crear (si falta) y reconstruir el índice de búsqueda de libros"""
+        if not create_index():
+            print("⚠️ Motor sin índice de texto completo, la búsqueda usa ILIKE")
+            return
+        total = rebuild_index()
+        print(f"✅ Índice de búsqueda reconstruido: {total} libros")
@@ -1,211 +1,328 @@
 """
-Verification Test Script
-Run this after seeding the database to verify everything works correctly
-Usage: python verify_seed.py
-"""
+Verificación de la consistencia de los datos.
 
-import sys
+    flask verify-data                      # comprobaciones de integridad
+    flask verify-data --group all --json   # también las del dataset de prueba, en JSON
+    python -m app.verify_seed              # todas, después de python -m app.seed
+
+Cada comprobación es una única sentencia SQL basada en conjuntos (INTERSECT,
+NOT EXISTS, GROUP BY) que devuelve las filas que la incumplen, así que el
+coste no depende del número de usuarios y se puede programar contra la base
+de datos en producción. Solo se hace una segunda consulta, limitada a
+SAMPLE_SIZE filas, para mostrar ejemplos cuando una comprobación falla.
+
+Grupos:
+- 'integrity': reglas que deben cumplirse siempre (overlap biblioteca/leídos,
+  estados y calificaciones válidos, claves foráneas huérfanas, duplicados y
+  contadores desnormalizados)
+- 'seed': lo que se espera del dataset por defecto de app/seed.py
+"""
 import os
+import sys
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from app import create_app
+import json
+import time
+import click
+from sqlalchemy import case, exists, func, literal, or_, select
 from app.database import db
-from app.models.user import User
-from app.models.book import Book
-from app.models.rating import Rating
-from app.models.user_library import UserLibrary
-from app.models.admin import Admin
-from sqlalchemy import func
-
-app = create_app()
-
-def test_no_overlap():
-    """Test 1: Verify no books appear in both UserLibrary and Rating for same user"""
-    print("\n🧪 Test 1: Checking for overlap between UserLibrary and Rating...")
-    
-    with app.app_context():
-        users = User.query.all()
-        total_overlaps = 0
-        
-        for user in users:
-            library_books = {ul.id_libro for ul in UserLibrary.query.filter_by(id_usuario=user.id_usuario).all()}
-            rated_books = {r.id_libro for r in Rating.query.filter_by(id_usuario=user.id_usuario).all()}
-            overlap = library_books & rated_books
-            
-            if overlap:
-                print(f"   ❌ User {user.nombre_usuario}: {len(overlap)} overlapping books!")
-                total_overlaps += len(overlap)
-        
-        if total_overlaps == 0:
-            print("   ✅ PASSED: No overlap detected!")
-            return True
-        else:
-            print(f"   ❌ FAILED: {total_overlaps} total overlapping books found")
-            return False
-
-def test_nullable_ratings():
-    """Test 2: Verify some ratings have null calificacion values"""
-    print("\n🧪 Test 2: Checking nullable ratings...")
-    
-    with app.app_context():
-        total_ratings = Rating.query.count()
-        null_ratings = Rating.query.filter(Rating.calificacion == None).count()
-        
-        if null_ratings > 0:
-            percentage = (null_ratings / total_ratings) * 100
-            print(f"   ✅ PASSED: {null_ratings}/{total_ratings} ratings without stars ({percentage:.1f}%)")
-            return True
-        else:
-            print(f"   ❌ FAILED: All {total_ratings} ratings have star values (should have some nulls)")
-            return False
-
-def test_valid_states():
-    """Test 3: Verify only valid estados in UserLibrary"""
-    print("\n🧪 Test 3: Checking valid reading states in UserLibrary...")
-    
-    with app.app_context():
-        valid_states = ['quiero_leer', 'leyendo']
-        invalid_entries = UserLibrary.query.filter(
-            ~UserLibrary.estado_lectura.in_(valid_states)
-        ).all()
-        
-        if not invalid_entries:
-            print("   ✅ PASSED: All UserLibrary entries have valid estados")
-            return True
-        else:
-            print(f"   ❌ FAILED: Found {len(invalid_entries)} entries with invalid estados:")
-            for entry in invalid_entries[:5]:  # Show first 5
-                print(f"      - estado: '{entry.estado_lectura}'")
-            return False
-
-def test_data_counts():
-    """Test 4: Verify expected data counts"""
-    print("\n🧪 Test 4: Checking data counts...")
-    
-    with app.app_context():
-        admin_count = Admin.query.count()
-        user_count = User.query.count()
-        book_count = Book.query.count()
-        rating_count = Rating.query.count()
-        library_count = UserLibrary.query.count()
-        
-        print(f"   Admins: {admin_count}")
-        print(f"   Users: {user_count}")
-        print(f"   Books: {book_count}")
-        print(f"   Ratings (leídos): {rating_count}")
-        print(f"   Library items (quiero_leer/leyendo): {library_count}")
-        
-        # Expected: 1 admin, 5 users, 112 books
-        if admin_count == 1 and user_count == 5 and book_count == 111:
-            print("   ✅ PASSED: Core counts look correct")
-            return True
-        else:
-            print("   ⚠️  WARNING: Counts don't match expected values")
-            print("      Expected: 1 admin, 5 users, 111 books")
-            return False
-
-def test_genre_distribution():
-    """Test 5: Verify genre distribution"""
-    print("\n🧪 Test 5: Checking genre distribution...")
-    
-    with app.app_context():
-        genre_counts = db.session.query(
-            Book.genero_libro,
-            func.count(Book.id_libros)
-        ).group_by(Book.genero_libro).all()
-        
-        expected = {
-            'Clásicos': 20,
-            'No-Ficción': 20,
-            'Ciencia Ficción': 20,
-            'Ficción': 17,
-            'Latinoamericano': 20,
-            'Historia': 14
-        }
-        
-        print("   Genre Distribution:")
-        all_correct = True
-        for genero, count in genre_counts:
-            expected_count = expected.get(genero, '?')
-            status = "✓" if count == expected_count else "✗"
-            print(f"      {status} {genero}: {count} books (expected: {expected_count})")
-            if count != expected_count:
-                all_correct = False
-        
-        if all_correct:
-            print("   ✅ PASSED: Genre distribution matches expected")
-            return True
-        else:
-            print("   ⚠️  WARNING: Some genre counts don't match")
-            return False
-
-def test_user_book_distribution():
-    """Test 6: Verify each user has reasonable book counts"""
-    print("\n🧪 Test 6: Checking user book distribution...")
-    
-    with app.app_context():
-        users = User.query.all()
-        all_good = True
-        
-        for user in users:
-            library_count = UserLibrary.query.filter_by(id_usuario=user.id_usuario).count()
-            rated_count = Rating.query.filter_by(id_usuario=user.id_usuario).count()
-            total = library_count + rated_count
-            
-            # Expected: 10-15 in library, 8+ in ratings
-            if 10 <= library_count <= 15 and rated_count >= 8:
-                status = "✓"
-            else:
-                status = "✗"
-                all_good = False
-            
-            print(f"   {status} {user.nombre_usuario}: {library_count} in library, {rated_count} read (total: {total})")
-        
-        if all_good:
-            print("   ✅ PASSED: All users have reasonable book distributions")
-            return True
-        else:
-            print("   ⚠️  WARNING: Some users have unusual distributions")
-            return False
+from app.models import (
+    Admin, Book, BookRatingStats, Genre, GenreStats, Rating, User, UserLibrary
+)
+
+SAMPLE_SIZE = 5
+VALID_STATES = ('quiero_leer', 'leyendo')
+SYNTHETIC_EMAIL_DOMAIN = '@seed.test'
+
+EXPECTED_COUNTS = {'admins': 1, 'users': 5, 'books': 111}
+EXPECTED_GENRES = {
+    'Clásicos': 20,
+    'No-Ficción': 20,
+    'Ciencia Ficción': 20,
+    'Ficción': 17,
+    'Latinoamericano': 20,
+    'Historia': 14
+}
+
+
+# --- Integridad -------------------------------------------------------------
+
+def library_rating_overlap():
+    """Libros que están a la vez en la biblioteca y en los leídos de un usuario"""
+    return select(UserLibrary.id_usuario, UserLibrary.id_libro).intersect(
+        select(Rating.id_usuario, Rating.id_libro)
+    )
+
+
+def invalid_reading_states():
+    """Entradas de biblioteca con un estado_lectura fuera de VALID_STATES"""
+    return select(UserLibrary.id_biblioteca, UserLibrary.estado_lectura).where(
+        or_(UserLibrary.estado_lectura.is_(None), UserLibrary.estado_lectura.not_in(VALID_STATES))
+    )
+
+
+def invalid_ratings():
+    """Calificaciones con estrellas fuera de 1-5 (NULL es válido: leído sin calificar)"""
+    return select(Rating.id_calificacion, Rating.calificacion).where(
+        Rating.calificacion.is_not(None),
+        or_(Rating.calificacion < 1, Rating.calificacion > 5)
+    )
+
+
+def _duplicates(model):
+    return select(model.id_usuario, model.id_libro, func.count().label('total'))\
+        .group_by(model.id_usuario, model.id_libro)\
+        .having(func.count() > 1)
+
+
+def duplicate_library_entries():
+    """Pares usuario/libro repetidos en biblioteca_usuario"""
+    return _duplicates(UserLibrary)
+
+
+def duplicate_ratings():
+    """Pares usuario/libro repetidos en calificacion"""
+    return _duplicates(Rating)
+
+
+def _orphans(foreign_key):
+    child, parent = foreign_key.parent, foreign_key.column
+    return select(child.table.primary_key.columns[0], child).where(
+        child.is_not(None),
+        ~exists().where(parent == child)
+    )
+
+
+def orphan_check(foreign_key):
+    """Filas cuya clave foránea apunta a una fila que no existe"""
+    def check():
+        return _orphans(foreign_key)
+    check.__name__ = f'orphan_{foreign_key.parent.table.name}_{foreign_key.parent.name}'
+    check.__doc__ = f'{foreign_key.parent} sin fila en {foreign_key.column}'
+    return check
+
+
+def _drift(stored, actual):
+    """
+    Filas de un contador desnormalizado que no cuadran con su origen.
+    stored suma los contadores guardados y actual resta la aportación de cada
+    fila de origen; tras un único GROUP BY por la clave (más barato que un
+    FULL JOIN contra un agregado) cualquier diferencia distinta de 0 es drift.
+    """
+    combined = stored.union_all(actual).subquery()
+    key, *counters = combined.c
+    differences = [func.sum(counter).label(f'diferencia_{counter.name}') for counter in counters]
+    return select(key, *differences)\
+        .group_by(key)\
+        .having(or_(*[func.sum(counter) != 0 for counter in counters]))
+
 
-def run_all_tests():
-    """Run all verification tests"""
+def rating_stats_drift():
+    """Libros cuyos contadores en estadisticas_calificacion no cuadran con calificacion"""
+    stats = BookRatingStats.__table__
+    stored = select(
+        stats.c.id_libro,
+        stats.c.total_resenas.label('resenas'),
+        stats.c.total_calificadas.label('calificadas'),
+        stats.c.suma_calificaciones.label('suma')
+    )
+    actual = select(
+        Rating.id_libro,
+        literal(-1),
+        case((Rating.calificacion.is_not(None), -1), else_=0),
+        -func.coalesce(Rating.calificacion, 0)
+    ).join(User, User.id_usuario == Rating.id_usuario)\
+        .where(User.is_active == True)
+    return _drift(stored, actual)
+
+
+def genre_stats_drift():
+    """Géneros cuyo total de libros en estadisticas_genero no cuadra con libros"""
+    stats = GenreStats.__table__
+    stored = select(stats.c.id_genero, stats.c.total_libros.label('libros'))
+    actual = select(Book.id_genero, literal(-1))
+    return _drift(stored, actual)
+
+
+def _foreign_keys():
+    for model in (Book, Rating, UserLibrary, BookRatingStats, GenreStats):
+        for foreign_key in sorted(model.__table__.foreign_keys, key=lambda fk: fk.parent.name):
+            yield foreign_key
+
+
+# --- Dataset de prueba ------------------------------------------------------
+
+def seed_unrated_ratings():
+    """Debe haber leídos sin estrellas (calificacion NULL)"""
+    return select(
+        func.count().label('total'),
+        func.count(Rating.calificacion).label('con_estrellas')
+    ).select_from(Rating).having(func.count() == func.count(Rating.calificacion))
+
+
+def seed_counts():
+    """1 admin, 5 usuarios y 111 libros"""
+    counts = select(
+        select(func.count()).select_from(Admin).scalar_subquery().label('admins'),
+        select(func.count()).select_from(User).scalar_subquery().label('users'),
+        select(func.count()).select_from(Book).scalar_subquery().label('books')
+    ).subquery()
+    return select(counts).where(or_(
+        *[counts.c[name] != expected for name, expected in EXPECTED_COUNTS.items()]
+    ))
+
+
+def seed_genre_distribution():
+    """Libros por género del catálogo real"""
+    rows = [
+        select(literal(name).label('genero'), literal(total).label('esperado'))
+        for name, total in EXPECTED_GENRES.items()
+    ]
+    expected = rows[0].union_all(*rows[1:]).subquery()
+    actual = select(
+        Genre.nombre_genero.label('genero'),
+        func.count(Book.id_libros).label('total')
+    ).join(Book, Book.id_genero == Genre.id_genero)\
+        .group_by(Genre.nombre_genero)\
+        .subquery()
+    return select(
+        func.coalesce(actual.c.genero, expected.c.genero).label('genero'),
+        func.coalesce(actual.c.total, 0).label('total'),
+        expected.c.esperado
+    ).select_from(
+        actual.outerjoin(expected, expected.c.genero == actual.c.genero, full=True)
+    ).where(or_(
+        expected.c.esperado.is_(None),
+        func.coalesce(actual.c.total, 0) != expected.c.esperado
+    ))
+
+
+def seed_user_distribution():
+    """Usuarios de prueba con 10-15 libros en la biblioteca y al menos 8 leídos"""
+    library = select(UserLibrary.id_usuario, func.count().label('total'))\
+        .group_by(UserLibrary.id_usuario).subquery()
+    ratings = select(Rating.id_usuario, func.count().label('total'))\
+        .group_by(Rating.id_usuario).subquery()
+    library_count = func.coalesce(library.c.total, 0)
+    rating_count = func.coalesce(ratings.c.total, 0)
+    return select(
+        User.id_usuario,
+        User.email_usuario,
+        library_count.label('biblioteca'),
+        rating_count.label('leidos')
+    ).outerjoin(library, library.c.id_usuario == User.id_usuario)\
+        .outerjoin(ratings, ratings.c.id_usuario == User.id_usuario)\
+        .where(
+            # Los usuarios sintéticos de --users siguen otra distribución
+            User.email_usuario.not_like(f'%{SYNTHETIC_EMAIL_DOMAIN}'),
+            or_(library_count < 10, library_count > 15, rating_count < 8)
+        )
+
+
+# --- Ejecución --------------------------------------------------------------
+
+def get_checks(group='integrity'):
+    """Lista de (grupo, comprobación) del grupo indicado ('integrity', 'seed' o 'all')"""
+    integrity = [
+        library_rating_overlap,
+        invalid_reading_states,
+        invalid_ratings,
+        duplicate_library_entries,
+        duplicate_ratings,
+        *[orphan_check(foreign_key) for foreign_key in _foreign_keys()],
+        rating_stats_drift,
+        genre_stats_drift
+    ]
+    seed = [seed_unrated_ratings, seed_counts, seed_genre_distribution, seed_user_distribution]
+    checks = []
+    if group in ('integrity', 'all'):
+        checks += [('integrity', check) for check in integrity]
+    if group in ('seed', 'all'):
+        checks += [('seed', check) for check in seed]
+    return checks
+
+
+def _json_value(value):
+    return value if value is None or isinstance(value, (int, float, str, bool)) else str(value)
+
+
+def run_check(group, check):
+    """Ejecutar una comprobación y devolver su resultado como dict"""
+    started = time.perf_counter()
+    violations = check().subquery()
+    result = {'name': check.__name__, 'group': group, 'description': check.__doc__}
+    try:
+        total = db.session.execute(select(func.count()).select_from(violations)).scalar()
+        samples = []
+        if total:
+            samples = [
+                {key: _json_value(value) for key, value in row._mapping.items()}
+                for row in db.session.execute(select(violations).limit(SAMPLE_SIZE))
+            ]
+        result.update(passed=total == 0, violations=total, samples=samples)
+    except Exception as e:
+        db.session.rollback()
+        result.update(passed=False, violations=None, samples=[], error=str(e))
+    result['elapsed_ms'] = round((time.perf_counter() - started) * 1000, 2)
+    return result
+
+
+def run_checks(group='integrity'):
+    """Ejecutar todas las comprobaciones del grupo; solo lee, no modifica nada"""
+    started = time.perf_counter()
+    results = [run_check(check_group, check) for check_group, check in get_checks(group)]
+    db.session.rollback()
+    return {
+        'passed': all(result['passed'] for result in results),
+        'total': len(results),
+        'failed': sum(1 for result in results if not result['passed']),
+        'elapsed_ms': round((time.perf_counter() - started) * 1000, 2),
+        'checks': results
+    }
+
+
+def print_report(report):
     print("=" * 60)
-    print("🔍 RUNNING SEED VERIFICATION TESTS")
+    print("🔍 VERIFICACIÓN DE DATOS")
     print("=" * 60)
-    
-    tests = [
-        test_no_overlap,
-        test_nullable_ratings,
-        test_valid_states,
-        test_data_counts,
-        test_genre_distribution,
-        test_user_book_distribution
-    ]
-    
-    results = []
-    for test in tests:
-        try:
-            results.append(test())
-        except Exception as e:
-            print(f"   ❌ ERROR: {str(e)}")
-            results.append(False)
-    
-    # Summary
-    print("\n" + "=" * 60)
-    print("📊 TEST SUMMARY")
+    for result in report['checks']:
+        status = "✅" if result['passed'] else "❌"
+        if 'error' in result:
+            detail = f"ERROR: {result['error']}"
+        else:
+            detail = f"{result['violations']} filas"
+        print(f"{status} {result['name']}: {detail} ({result['elapsed_ms']:.1f} ms)")
+        for sample in result['samples']:
+            print(f"      - {sample}")
+
     print("=" * 60)
-    passed = sum(results)
-    total = len(results)
-    
-    print(f"Tests Passed: {passed}/{total}")
-    
-    if passed == total:
-        print("\n🎉 ALL TESTS PASSED! Your seed is working correctly.")
+    passed = report['total'] - report['failed']
+    print(f"Tests Passed: {passed}/{report['total']} en {report['elapsed_ms']:.1f} ms")
+    if report['passed']:
+        print("🎉 Todas las comprobaciones pasaron")
     else:
-        print(f"\n⚠️  {total - passed} test(s) failed. Review the output above.")
-    
+        print(f"⚠️  {report['failed']} comprobación(es) fallaron. Revisa la salida.")
     print("=" * 60)
 
+
+def register_verify_commands(app):
+    @app.cli.command('verify-data')
+    @click.option('--group', type=click.Choice(['integrity', 'seed', 'all']), default='integrity', show_default=True)
+    @click.option('--json', 'as_json', is_flag=True, help='Imprimir el resultado en JSON')
+    def verify_data(group, as_json):
+        """Comprobar la consistencia de los datos (sale con código 1 si algo falla)"""
+        report = run_checks(group)
+        if as_json:
+            print(json.dumps(report, ensure_ascii=False))
+        else:
+            print_report(report)
+        if not report['passed']:
+            sys.exit(1)
+
+
 if __name__ == '__main__':
-    run_all_tests()
+    from app import create_app
+    with create_app().app_context():
+        report = run_checks('all')
+    print_report(report)
+    sys.exit(0 if report['passed'] else 1)
@@ -62,6 +62,10 @@ def run_migrations():
             print(f"⚠️  Migration error: {e}")
             print("🔄 Creating tables directly instead...")
             db.create_all()
+            # El índice de búsqueda no forma parte de los modelos
+            from app.search import create_index, rebuild_index
+            if create_index():
+                rebuild_index()
             print("✅ Tables created successfully")
         
         return True
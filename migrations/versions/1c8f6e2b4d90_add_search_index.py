@@ -0,0 +1,82 @@
+"""Add full-text search index (libros_fts on SQLite, libros_busqueda on PostgreSQL)
+
+Revision ID: 1c8f6e2b4d90
+Revises: 42803991220b
+Create Date: 2026-10-18 09:30:00.000000
+
+"""
+import unicodedata
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '1c8f6e2b4d90'
+down_revision = '42803991220b'
+branch_labels = None
+depends_on = None
+
+BATCH_SIZE = 1000
+
+
+def _normalize(value):
+    # Igual que app.search.normalize_text
+    if not value:
+        return ''
+    decomposed = unicodedata.normalize('NFKD', value)
+    return ''.join(c for c in decomposed if not unicodedata.combining(c)).lower()
+
+
+def _backfill(bind, insert_statement):
+    result = bind.execute(sa.text(
+        "SELECT l.id_libros, l.titulo_libro, a.nombre_autor, a.apellido_autor "
+        "FROM libros l LEFT JOIN autores a ON a.id_autor = l.id_autor ORDER BY l.id_libros"
+    ).execution_options(stream_results=True))
+    for rows in result.partitions(BATCH_SIZE):
+        bind.execute(insert_statement, [{
+            'id': book_id,
+            'titulo': _normalize(titulo),
+            'autor': _normalize(f"{nombre or ''} {apellido or ''}")
+        } for book_id, titulo, nombre, apellido in rows])
+
+
+def upgrade():
+    bind = op.get_bind()
+    dialect = bind.dialect.name
+    # create_index() (flask search-reindex) puede haber creado ya la tabla
+    existing = sa.inspect(bind).get_table_names()
+
+    if dialect == 'sqlite':
+        fts5 = bind.execute(sa.text("SELECT sqlite_compileoption_used('ENABLE_FTS5')")).scalar()
+        if not fts5 or 'libros_fts' in existing:
+            return
+        op.execute(
+            "CREATE VIRTUAL TABLE libros_fts "
+            "USING fts5(titulo, autor, tokenize='unicode61 remove_diacritics 2')"
+        )
+        _backfill(bind, sa.text(
+            "INSERT INTO libros_fts (rowid, titulo, autor) VALUES (:id, :titulo, :autor)"
+        ))
+    elif dialect == 'postgresql':
+        if 'libros_busqueda' in existing:
+            return
+        op.execute(
+            "CREATE TABLE libros_busqueda ("
+            "id_libros INTEGER PRIMARY KEY REFERENCES libros (id_libros) ON DELETE CASCADE, "
+            "documento TSVECTOR NOT NULL)"
+        )
+        _backfill(bind, sa.text(
+            "INSERT INTO libros_busqueda (id_libros, documento) VALUES ("
+            ":id, setweight(to_tsvector('simple', :titulo), 'A') || "
+            "setweight(to_tsvector('simple', :autor), 'B'))"
+        ))
+        # El índice GIN se crea después de cargar las filas
+        op.execute("CREATE INDEX ix_libros_busqueda_documento ON libros_busqueda USING GIN (documento)")
+
+
+def downgrade():
+    dialect = op.get_bind().dialect.name
+    if dialect == 'sqlite':
+        op.execute("DROP TABLE IF EXISTS libros_fts")
+    elif dialect == 'postgresql':
+        op.execute("DROP TABLE IF EXISTS libros_busqueda")
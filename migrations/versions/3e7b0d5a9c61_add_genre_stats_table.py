@@ -0,0 +1,37 @@
+"""Add estadisticas_genero (per-genre catalog aggregates)
+
+Revision ID: 3e7b0d5a9c61
+Revises: 9a6e4c1d8f25
+Create Date: 2026-10-18 11:15:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '3e7b0d5a9c61'
+down_revision = '9a6e4c1d8f25'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # create_all() puede haber creado ya la tabla vacía al arrancar la app
+    if 'estadisticas_genero' in sa.inspect(op.get_bind()).get_table_names():
+        return
+    op.create_table(
+        'estadisticas_genero',
+        sa.Column('genero_libro', sa.String(length=50), nullable=False),
+        sa.Column('total_libros', sa.Integer(), nullable=False),
+        sa.Column('total_autores', sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint('genero_libro')
+    )
+    op.execute(
+        "INSERT INTO estadisticas_genero (genero_libro, total_libros, total_autores) "
+        "SELECT genero_libro, COUNT(id_libros), COUNT(DISTINCT id_autor) FROM libros GROUP BY genero_libro"
+    )
+
+
+def downgrade():
+    op.drop_table('estadisticas_genero')
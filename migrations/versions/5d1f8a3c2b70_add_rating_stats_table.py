@@ -0,0 +1,48 @@
+"""Add estadisticas_calificacion (per-book rating aggregates)
+
+Revision ID: 5d1f8a3c2b70
+Revises: 1c8f6e2b4d90
+Create Date: 2026-10-18 09:50:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '5d1f8a3c2b70'
+down_revision = '1c8f6e2b4d90'
+branch_labels = None
+depends_on = None
+
+COUNTER_COLUMNS = [
+    'total_resenas', 'total_calificadas', 'suma_calificaciones',
+    'estrellas_1', 'estrellas_2', 'estrellas_3', 'estrellas_4', 'estrellas_5',
+    'total_con_texto'
+]
+
+
+def upgrade():
+    # create_all() puede haber creado ya la tabla vacía al arrancar la app
+    if 'estadisticas_calificacion' in sa.inspect(op.get_bind()).get_table_names():
+        return
+    op.create_table(
+        'estadisticas_calificacion',
+        sa.Column('id_libro', sa.Integer(), nullable=False),
+        *[sa.Column(column, sa.Integer(), nullable=False) for column in COUNTER_COLUMNS],
+        sa.ForeignKeyConstraint(['id_libro'], ['libros.id_libros']),
+        sa.PrimaryKeyConstraint('id_libro')
+    )
+    # Poblar desde calificacion (solo usuarios activos); la app lo hace también al arrancar si está vacía
+    op.execute(
+        "INSERT INTO estadisticas_calificacion (id_libro, " + ', '.join(COUNTER_COLUMNS) + ") "
+        "SELECT c.id_libro, COUNT(c.id_calificacion), COUNT(c.calificacion), COALESCE(SUM(c.calificacion), 0), "
+        + ', '.join(f'SUM(CASE WHEN c.calificacion = {stars} THEN 1 ELSE 0 END)' for stars in range(1, 6)) +
+        ", SUM(CASE WHEN COALESCE(c.resena, '') <> '' THEN 1 ELSE 0 END) "
+        "FROM calificacion c JOIN usuarios u ON u.id_usuario = c.id_usuario "
+        "WHERE u.is_active = true GROUP BY c.id_libro"
+    )
+
+
+def downgrade():
+    op.drop_table('estadisticas_calificacion')
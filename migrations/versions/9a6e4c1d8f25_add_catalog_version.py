@@ -0,0 +1,42 @@
+"""Add version_catalogo (catalog version for ETag/Last-Modified)
+
+Revision ID: 9a6e4c1d8f25
+Revises: c52d8e1a7f46
+Create Date: 2026-10-18 11:00:00.000000
+
+"""
+from datetime import datetime
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '9a6e4c1d8f25'
+down_revision = 'c52d8e1a7f46'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # create_all() puede haber creado ya la tabla vacía al arrancar la app
+    if 'version_catalogo' not in sa.inspect(op.get_bind()).get_table_names():
+        op.create_table(
+            'version_catalogo',
+            sa.Column('id', sa.Integer(), nullable=False),
+            sa.Column('version', sa.Integer(), nullable=False),
+            sa.Column('updated_at', sa.DateTime(), nullable=False),
+            sa.PrimaryKeyConstraint('id')
+        )
+    version_catalogo = sa.table(
+        'version_catalogo',
+        sa.column('id', sa.Integer),
+        sa.column('version', sa.Integer),
+        sa.column('updated_at', sa.DateTime)
+    )
+    bind = op.get_bind()
+    if bind.execute(sa.select(version_catalogo.c.id).where(version_catalogo.c.id == 1)).first() is None:
+        bind.execute(version_catalogo.insert().values(id=1, version=1, updated_at=datetime.utcnow()))
+
+
+def downgrade():
+    op.drop_table('version_catalogo')
@@ -0,0 +1,30 @@
+"""Add composite index for the paginated review feed
+
+Revision ID: a1c4e7f2b903
+Revises: 5d1f8a3c2b70
+Create Date: 2026-10-18 10:12:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'a1c4e7f2b903'
+down_revision = '5d1f8a3c2b70'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index(
+        'ix_calificacion_libro_created',
+        'calificacion',
+        ['id_libro', 'created_at', 'id_calificacion'],
+        unique=False,
+        if_not_exists=True
+    )
+
+
+def downgrade():
+    op.drop_index('ix_calificacion_libro_created', table_name='calificacion', if_exists=True)
@@ -0,0 +1,44 @@
+"""Add ON DELETE CASCADE to the foreign keys that point at libros and autores
+
+Revision ID: b7d2e5a9c314
+Revises: f3a9c2d47b18
+Create Date: 2026-10-18 15:20:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'b7d2e5a9c314'
+down_revision = 'f3a9c2d47b18'
+branch_labels = None
+depends_on = None
+
+
+# (tabla, columna, tabla referenciada, columna referenciada)
+CASCADE_FKS = [
+    ('calificacion', 'id_libro', 'libros', 'id_libros'),
+    ('biblioteca_usuario', 'id_libro', 'libros', 'id_libros'),
+    ('estadisticas_calificacion', 'id_libro', 'libros', 'id_libros'),
+    ('libros', 'id_autor', 'autores', 'id_autor'),
+]
+
+
+def _replace_foreign_keys(ondelete):
+    # SQLite no aplica las FKs sin PRAGMA foreign_keys y no permite cambiarlas sin
+    # recrear la tabla; los borrados de admin ya eliminan las dependencias explícitamente
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    for table, column, ref_table, ref_column in CASCADE_FKS:
+        name = f'{table}_{column}_fkey'
+        op.execute(f'ALTER TABLE {table} DROP CONSTRAINT IF EXISTS {name}')
+        op.create_foreign_key(name, table, ref_table, [column], [ref_column], ondelete=ondelete)
+
+
+def upgrade():
+    _replace_foreign_keys('CASCADE')
+
+
+def downgrade():
+    _replace_foreign_keys(None)
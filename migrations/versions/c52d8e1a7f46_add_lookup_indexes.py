@@ -0,0 +1,44 @@
+"""Add unique (id_usuario, id_libro) and lookup indexes
+
+Revision ID: c52d8e1a7f46
+Revises: a1c4e7f2b903
+Create Date: 2026-10-18 10:40:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c52d8e1a7f46'
+down_revision = 'a1c4e7f2b903'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Eliminar duplicados (se conserva la fila más antigua) antes de crear los índices únicos
+    op.execute(
+        "DELETE FROM biblioteca_usuario WHERE id_biblioteca NOT IN ("
+        "SELECT MIN(id_biblioteca) FROM biblioteca_usuario GROUP BY id_usuario, id_libro)"
+    )
+    op.execute(
+        "DELETE FROM calificacion WHERE id_calificacion NOT IN ("
+        "SELECT MIN(id_calificacion) FROM calificacion GROUP BY id_usuario, id_libro)"
+    )
+
+    op.create_index('ix_biblioteca_usuario_usuario_libro', 'biblioteca_usuario',
+                    ['id_usuario', 'id_libro'], unique=True, if_not_exists=True)
+    op.create_index('ix_calificacion_usuario_libro', 'calificacion',
+                    ['id_usuario', 'id_libro'], unique=True, if_not_exists=True)
+    op.create_index('ix_libros_id_autor', 'libros',
+                    ['id_autor'], unique=False, if_not_exists=True)
+    op.create_index('ix_libros_genero_autor', 'libros',
+                    ['genero_libro', 'id_autor'], unique=False, if_not_exists=True)
+
+
+def downgrade():
+    op.drop_index('ix_libros_genero_autor', table_name='libros', if_exists=True)
+    op.drop_index('ix_libros_id_autor', table_name='libros', if_exists=True)
+    op.drop_index('ix_calificacion_usuario_libro', table_name='calificacion', if_exists=True)
+    op.drop_index('ix_biblioteca_usuario_usuario_libro', table_name='biblioteca_usuario', if_exists=True)
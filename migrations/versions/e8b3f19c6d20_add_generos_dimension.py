@@ -0,0 +1,120 @@
+"""Add generos dimension table and libros.id_genero
+
+Revision ID: e8b3f19c6d20
+Revises: 3e7b0d5a9c61
+Create Date: 2026-10-18 11:30:00.000000
+
+"""
+import re
+import unicodedata
+from datetime import datetime
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'e8b3f19c6d20'
+down_revision = '3e7b0d5a9c61'
+branch_labels = None
+depends_on = None
+
+# Slugs que ya usaba el frontend (ver app/models/genre.py)
+LEGACY_SLUGS = {
+    'Latinoamericano': 'latinoamericanos'
+}
+
+
+def _slugify(value):
+    decomposed = unicodedata.normalize('NFKD', value)
+    folded = ''.join(c for c in decomposed if not unicodedata.combining(c)).lower()
+    return re.sub(r'[^a-z0-9]+', '-', folded).strip('-')
+
+
+def upgrade():
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+    tables = inspector.get_table_names()
+
+    # create_all() puede haber creado ya la tabla vacía al arrancar la app
+    if 'generos' not in tables:
+        op.create_table(
+            'generos',
+            sa.Column('id_genero', sa.Integer(), nullable=False),
+            sa.Column('slug', sa.String(length=60), nullable=False),
+            sa.Column('nombre_genero', sa.String(length=50), nullable=False),
+            sa.Column('created_at', sa.DateTime(), nullable=False),
+            sa.PrimaryKeyConstraint('id_genero'),
+            sa.UniqueConstraint('slug'),
+            sa.UniqueConstraint('nombre_genero')
+        )
+
+    # Backfill: un género por cada texto distinto de libros.genero_libro
+    generos = sa.table(
+        'generos',
+        sa.column('id_genero', sa.Integer),
+        sa.column('slug', sa.String),
+        sa.column('nombre_genero', sa.String),
+        sa.column('created_at', sa.DateTime)
+    )
+    existing = {row.slug for row in bind.execute(sa.select(generos.c.slug))}
+    names = [row[0] for row in bind.execute(sa.text("SELECT DISTINCT genero_libro FROM libros"))]
+    now = datetime.utcnow()
+    for nombre in names:
+        slug = LEGACY_SLUGS.get(nombre, _slugify(nombre))
+        if slug in existing:
+            continue
+        bind.execute(generos.insert().values(slug=slug, nombre_genero=nombre, created_at=now))
+        existing.add(slug)
+
+    libros_columns = {column['name'] for column in inspector.get_columns('libros')}
+    if 'id_genero' not in libros_columns:
+        with op.batch_alter_table('libros', schema=None) as batch_op:
+            batch_op.add_column(sa.Column('id_genero', sa.Integer(), nullable=True))
+
+    # Variantes con distinto acento/mayúsculas caen en el mismo slug
+    rows = bind.execute(sa.select(generos.c.id_genero, generos.c.slug)).fetchall()
+    slug_to_id = {slug: id_genero for id_genero, slug in rows}
+    for nombre in names:
+        slug = LEGACY_SLUGS.get(nombre, _slugify(nombre))
+        bind.execute(
+            sa.text("UPDATE libros SET id_genero = :id_genero WHERE genero_libro = :nombre"),
+            {'id_genero': slug_to_id[slug], 'nombre': nombre}
+        )
+
+    op.drop_index('ix_libros_genero_autor', table_name='libros', if_exists=True)
+    with op.batch_alter_table('libros', schema=None) as batch_op:
+        batch_op.alter_column('id_genero', existing_type=sa.Integer(), nullable=False)
+        batch_op.create_foreign_key('fk_libros_id_genero', 'generos', ['id_genero'], ['id_genero'])
+        batch_op.create_index('ix_libros_genero_autor', ['id_genero', 'id_autor'], unique=False)
+
+    # estadisticas_genero es un agregado derivado: se recrea con clave entera
+    # y la aplicación la vuelve a poblar al arrancar
+    if 'estadisticas_genero' in tables:
+        op.drop_table('estadisticas_genero')
+    op.create_table(
+        'estadisticas_genero',
+        sa.Column('id_genero', sa.Integer(), nullable=False),
+        sa.Column('total_libros', sa.Integer(), nullable=False),
+        sa.Column('total_autores', sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(['id_genero'], ['generos.id_genero']),
+        sa.PrimaryKeyConstraint('id_genero')
+    )
+
+
+def downgrade():
+    op.drop_table('estadisticas_genero')
+    op.create_table(
+        'estadisticas_genero',
+        sa.Column('genero_libro', sa.String(length=50), nullable=False),
+        sa.Column('total_libros', sa.Integer(), nullable=False),
+        sa.Column('total_autores', sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint('genero_libro')
+    )
+
+    op.drop_index('ix_libros_genero_autor', table_name='libros')
+    with op.batch_alter_table('libros', schema=None) as batch_op:
+        batch_op.create_index('ix_libros_genero_autor', ['genero_libro', 'id_autor'], unique=False)
+        batch_op.drop_constraint('fk_libros_id_genero', type_='foreignkey')
+        batch_op.drop_column('id_genero')
+
+    op.drop_table('generos')
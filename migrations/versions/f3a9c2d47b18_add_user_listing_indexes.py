@@ -0,0 +1,28 @@
+"""Add indexes for the admin user listing
+
+Revision ID: f3a9c2d47b18
+Revises: e8b3f19c6d20
+Create Date: 2026-10-18 14:10:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'f3a9c2d47b18'
+down_revision = 'e8b3f19c6d20'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index('ix_usuarios_created_at', 'usuarios',
+                    ['created_at', 'id_usuario'], unique=False, if_not_exists=True)
+    op.create_index('ix_usuarios_activo_created_at', 'usuarios',
+                    ['is_active', 'created_at', 'id_usuario'], unique=False, if_not_exists=True)
+
+
+def downgrade():
+    op.drop_index('ix_usuarios_activo_created_at', table_name='usuarios', if_exists=True)
+    op.drop_index('ix_usuarios_created_at', table_name='usuarios', if_exists=True)
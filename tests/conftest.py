@@ -0,0 +1,125 @@
+# tests/conftest.py
+"""
+Fixtures comunes: aplicación con create_app() sobre un SQLite temporal,
+sin caché y con un hash de contraseñas barato.
+"""
+from contextlib import contextmanager
+import pytest
+from flask_jwt_extended import create_access_token
+from sqlalchemy import event
+from app import create_app, db
+from app import conditional, search
+from app.models import Admin, Author, Book, Rating, User, UserLibrary
+
+TEST_PASSWORD = 'password123'
+
+
+@pytest.fixture
+def app_env():
+    """Variables de entorno extra para create_app (se redefine en cada módulo)"""
+    return {}
+
+
+@pytest.fixture
+def app(tmp_path, monkeypatch, app_env):
+    monkeypatch.setenv('DATABASE_URL', f"sqlite:///{tmp_path / 'test.db'}")
+    monkeypatch.setenv('SECRET_KEY', 'clave-de-pruebas')
+    monkeypatch.setenv('CACHE_BACKEND', 'null')
+    monkeypatch.setenv('PASSWORD_HASH_METHOD', 'pbkdf2:sha256:1000')
+    monkeypatch.setenv('QUERY_STATS_HEADERS', 'false')
+    for name, value in app_env.items():
+        monkeypatch.setenv(name, value.format(tmp_path=tmp_path))
+    # La versión del catálogo se guarda en memoria del proceso
+    conditional._cached['expires'] = 0.0
+    app = create_app()
+    app.config['TESTING'] = True
+    with app.app_context():
+        # En producción lo crea la migración 1c8f6e2b4d90
+        search.create_index()
+        yield app
+        db.session.remove()
+        for engine in db.engines.values():
+            engine.dispose()
+
+
+@pytest.fixture
+def client(app):
+    return app.test_client()
+
+
+def make_book(titulo='Libro', genero='Novela', autor=None):
+    """Crear un libro (y su autor si no se indica)"""
+    if autor is None:
+        autor = Author(nombre_autor='Autora', apellido_autor='Prueba')
+        db.session.add(autor)
+        db.session.flush()
+    book = Book(
+        titulo_libro=titulo,
+        id_autor=autor.id_autor,
+        descripcion_libros='Descripción',
+        enlace_asin_libro=f'B0{titulo[:8]}',
+        enlace_portada_libro='https://example.com/portada.jpg'
+    )
+    book.set_genre(genero)
+    db.session.add(book)
+    db.session.flush()
+    return book
+
+
+def make_user(email='lector@test.com', nombre='Lector'):
+    user = User(
+        nombre_usuario=nombre,
+        apellido_usuario='Prueba',
+        email_usuario=email,
+        is_active=True
+    )
+    user.set_password(TEST_PASSWORD)
+    db.session.add(user)
+    db.session.flush()
+    return user
+
+
+def make_admin(email='admin@test.com'):
+    admin = Admin(nombre_admin='Admin', email_admin=email, password_admin=TEST_PASSWORD)
+    db.session.add(admin)
+    db.session.flush()
+    return admin
+
+
+def user_headers(user):
+    return {'Authorization': f'Bearer {create_access_token(identity=str(user.id_usuario))}'}
+
+
+def admin_headers(admin):
+    token = create_access_token(identity=str(admin.id_admin), additional_claims={'is_admin': True})
+    return {'Authorization': f'Bearer {token}'}
+
+
+def fill_library(user, size):
+    """size libros repartidos entre biblioteca (quiero_leer/leyendo) y calificaciones"""
+    autor = Author(nombre_autor='Autora', apellido_autor='Prueba')
+    db.session.add(autor)
+    db.session.flush()
+    for index in range(size):
+        book = make_book(titulo=f'Libro {index}', autor=autor)
+        if index % 3 == 0:
+            db.session.add(Rating(id_usuario=user.id_usuario, id_libro=book.id_libros, calificacion=4))
+        else:
+            estado = 'quiero_leer' if index % 3 == 1 else 'leyendo'
+            db.session.add(UserLibrary(id_usuario=user.id_usuario, id_libro=book.id_libros, estado_lectura=estado))
+    db.session.commit()
+
+
+@contextmanager
+def count_statements():
+    """Contar las sentencias SQL ejecutadas en el engine principal"""
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(db.engine, 'before_cursor_execute', before_cursor_execute)
+    try:
+        yield statements
+    finally:
+        event.remove(db.engine, 'before_cursor_execute', before_cursor_execute)
@@ -0,0 +1,131 @@
+# tests/test_admin.py
+from datetime import datetime, timedelta
+import pytest
+from app import db, genre_stats, rating_stats
+from app.models import Author, Book, Rating, User, UserLibrary
+from app.pagination import NEXT_CURSOR_HEADER
+from app.verify_seed import run_checks
+from tests.conftest import admin_headers, count_statements, make_admin, make_book, make_user
+
+
+def add_users(count):
+    """count usuarios con emails y fechas de alta desordenados respecto al id"""
+    start = datetime(2024, 1, 1, 12, 0, 0, 250000)
+    users = []
+    for index in range(count):
+        user = make_user(email=f'{(index * 5) % count:02d}@test.com', nombre=f'Lector {index}')
+        # Dos usuarios comparten created_at para comprobar el desempate por id
+        user.created_at = start + timedelta(minutes=(index * 3) % count if index != 1 else 0)
+        users.append(user)
+    db.session.commit()
+    return users
+
+
+def walk_users(client, headers, sort, order, limit=2, on_page=None):
+    seen, cursor = [], None
+    while True:
+        url = f'/api/admin/users/all?limit={limit}&sort={sort}&order={order}'
+        if cursor:
+            url += f'&cursor={cursor}'
+        response = client.get(url, headers=headers)
+        assert response.status_code == 200, response.get_json()
+        users = response.get_json()
+        seen.extend(user['id_usuario'] for user in users)
+        cursor = response.headers.get(NEXT_CURSOR_HEADER)
+        if not cursor:
+            return seen
+        if on_page:
+            on_page(users)
+
+
+def expected_order(users, sort, order):
+    key = {
+        'id': lambda user: user.id_usuario,
+        'created_at': lambda user: (user.created_at, user.id_usuario),
+        'email': lambda user: (user.email_usuario, user.id_usuario)
+    }[sort]
+    return [user.id_usuario for user in sorted(users, key=key, reverse=order == 'desc')]
+
+
+@pytest.mark.parametrize('sort', ['id', 'created_at', 'email'])
+@pytest.mark.parametrize('order', ['asc', 'desc'])
+def test_users_cursor_walks_every_user(client, sort, order):
+    headers = admin_headers(make_admin())
+    users = add_users(7)
+
+    assert walk_users(client, headers, sort, order) == expected_order(users, sort, order)
+
+
+@pytest.mark.parametrize('sort', ['created_at', 'email'])
+def test_users_cursor_survives_deleted_boundary(client, sort):
+    headers = admin_headers(make_admin())
+    users = add_users(7)
+    expected = expected_order(users, sort, 'asc')
+    deleted = []
+
+    def delete_last(page):
+        if not deleted:
+            boundary = db.session.get(User, page[-1]['id_usuario'])
+            deleted.append(boundary.id_usuario)
+            db.session.delete(boundary)
+            db.session.commit()
+
+    assert walk_users(client, headers, sort, 'asc', on_page=delete_last) == expected
+    assert deleted
+
+
+def test_users_cursor_must_match_sort(client):
+    headers = admin_headers(make_admin())
+    add_users(3)
+    cursor = client.get('/api/admin/users/all?limit=1', headers=headers).headers[NEXT_CURSOR_HEADER]
+
+    response = client.get(f'/api/admin/users/all?sort=email&cursor={cursor}', headers=headers)
+    assert response.status_code == 400
+
+
+def add_author_with_books(count, readers):
+    author = Author(nombre_autor='Autora', apellido_autor=f'Con {count} libros')
+    db.session.add(author)
+    db.session.flush()
+    for index in range(count):
+        book = make_book(titulo=f'Libro {count}-{index}', autor=author)
+        for reader in readers:
+            if index % 2:
+                db.session.add(Rating(id_usuario=reader.id_usuario, id_libro=book.id_libros, calificacion=4))
+                rating_stats.rating_added(reader.id_usuario, book.id_libros, 4, None)
+            else:
+                db.session.add(UserLibrary(id_usuario=reader.id_usuario, id_libro=book.id_libros))
+    genre_stats.rebuild_genre_stats()
+    return author
+
+
+def test_delete_author_uses_constant_statements(client):
+    headers = admin_headers(make_admin())
+    readers = [make_user(email=f'lector{index}@test.com') for index in range(3)]
+    small, large = add_author_with_books(1, readers), add_author_with_books(20, readers)
+    # Primera petición de admin: carga su estado en admin_status
+    assert client.get('/api/admin/users/all', headers=headers).status_code == 200
+    counts = []
+
+    for author in (small, large):
+        with count_statements() as statements:
+            response = client.delete(f'/api/admin/authors/{author.id_autor}/delete', headers=headers)
+        assert response.status_code == 200
+        counts.append(len(statements))
+
+    assert counts[0] == counts[1]
+    assert Book.query.count() == Rating.query.count() == UserLibrary.query.count() == 0
+    assert run_checks('integrity')['passed']
+
+
+def test_delete_book_removes_dependents(client):
+    headers = admin_headers(make_admin())
+    reader = make_user()
+    author = add_author_with_books(2, [reader])
+    rated = Book.query.filter_by(id_autor=author.id_autor).order_by(Book.id_libros.desc()).first()
+
+    response = client.delete(f'/api/admin/books/{rated.id_libros}/delete', headers=headers)
+
+    assert response.status_code == 200
+    assert Rating.query.count() == 0 and UserLibrary.query.count() == 1
+    assert run_checks('integrity')['passed']
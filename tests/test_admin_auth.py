@@ -0,0 +1,38 @@
+# tests/test_admin_auth.py
+from app import db
+from app.admin_auth import admin_status
+from tests.conftest import admin_headers, count_statements, make_admin, make_user, user_headers
+
+ADMIN_URL = '/api/admin/users/all'
+
+
+def test_user_token_is_rejected(client):
+    user = make_user()
+    db.session.commit()
+
+    assert client.get(ADMIN_URL, headers=user_headers(user)).status_code == 401
+
+
+def test_admin_status_is_cached(client):
+    headers = admin_headers(make_admin())
+    db.session.commit()
+    assert client.get(ADMIN_URL, headers=headers).status_code == 200
+
+    with count_statements() as statements:
+        assert client.get(ADMIN_URL, headers=headers).status_code == 200
+
+    assert not [statement for statement in statements if 'admins' in statement]
+
+
+def test_deactivated_admin_is_rejected_after_invalidate(client):
+    admin = make_admin()
+    db.session.commit()
+    headers = admin_headers(admin)
+    assert client.get(ADMIN_URL, headers=headers).status_code == 200
+
+    admin.is_active = False
+    db.session.commit()
+    admin_status.invalidate(admin.id_admin)
+
+    response = client.get(ADMIN_URL, headers=headers)
+    assert response.status_code == 401
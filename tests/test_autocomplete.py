@@ -0,0 +1,104 @@
+# tests/test_autocomplete.py
+from app import db
+from app.autocomplete import author_index
+from app.conditional import bump_catalog_version
+from app.models import Author
+from tests.conftest import make_book
+
+
+def add_author(nombre, apellido):
+    author = Author(nombre_autor=nombre, apellido_autor=apellido)
+    db.session.add(author)
+    db.session.flush()
+    return author
+
+
+def names(results):
+    return [result['nombre_completo'] for result in results]
+
+
+def test_search_ranks_prefix_then_word_then_substring(app):
+    add_author('Mariana', 'Enríquez')
+    add_author('Ana', 'María Matute')
+    add_author('Gabriel', 'García Márquez')
+    db.session.commit()
+    author_index.build()
+
+    assert names(author_index.search('mar')) == ['Mariana Enríquez', 'Ana María Matute', 'Gabriel García Márquez']
+    assert names(author_index.search('MARQUEZ')) == ['Gabriel García Márquez']
+    assert author_index.search('m') == []
+
+
+def test_refresh_author_updates_counts_and_names(app):
+    author = add_author('Julio', 'Cortázar')
+    db.session.commit()
+    author_index.build()
+    assert author_index.search('cortazar')[0]['total_libros'] == 0
+
+    make_book(titulo='Rayuela', genero='Latinoamericano', autor=author)
+    author.apellido_autor = 'Cortázar Descotte'
+    db.session.commit()
+    author_index.refresh_author(author.id_autor)
+
+    result = author_index.search('descotte')[0]
+    assert result['total_libros'] == 1
+    assert result['primer_genero'] == 'Latinoamericano'
+
+
+def test_search_endpoint_uses_index(client):
+    add_author('Isabel', 'Allende')
+    db.session.commit()
+    author_index.build()
+
+    response = client.get('/api/authors/search/simple?q=allen')
+
+    assert names(response.get_json()) == ['Isabel Allende']
+
+
+def test_first_genre_comes_from_first_book(app):
+    author = add_author('Julio', 'Cortázar')
+    make_book(titulo='Bestiario', genero='Cuento', autor=author)
+    make_book(titulo='Rayuela', genero='Latinoamericano', autor=author)
+    db.session.commit()
+    author_index.build()
+
+    result = author_index.search('cortazar')[0]
+    assert result['total_libros'] == 2
+    assert result['primer_genero'] == 'Cuento'
+
+
+def wait_for_refresh():
+    thread = author_index._refresh_thread
+    if thread is not None:
+        thread.join(timeout=5)
+
+
+def test_stale_index_refreshes_in_background(app):
+    add_author('Isabel', 'Allende')
+    db.session.commit()
+    author_index.build()
+    add_author('Isabel', 'Allende Llona')
+    bump_catalog_version()
+    db.session.commit()
+    author_index.max_age = 0
+
+    first = author_index.search('allende')
+    wait_for_refresh()
+
+    # La búsqueda que detecta el índice caducado responde con la copia anterior
+    assert names(first) == ['Isabel Allende']
+    assert names(author_index.search('llona')) == ['Isabel Allende Llona']
+
+
+def test_background_refresh_skips_rebuild_when_catalog_unchanged(app, monkeypatch):
+    author_index.build()
+    built_at = author_index._built_at
+    author_index.max_age = 0
+    loads = []
+    monkeypatch.setattr(author_index, '_load', lambda author_id=None: loads.append(author_id) or {})
+
+    author_index.search('allende')
+    wait_for_refresh()
+
+    assert loads == []
+    assert author_index._built_at > built_at
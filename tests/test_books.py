@@ -0,0 +1,123 @@
+# tests/test_books.py
+from sqlalchemy import text
+from app import db
+from app.models import Rating
+from app.pagination import NEXT_CURSOR_HEADER
+from tests.conftest import make_book, make_user
+
+
+def add_reviews(book, count):
+    """count reseñas con fechas escritas como CURRENT_TIMESTAMP (dos comparten segundo)"""
+    ids = []
+    for index in range(count):
+        user = make_user(email=f'lector{index}@test.com')
+        rating = Rating(id_usuario=user.id_usuario, id_libro=book.id_libros, calificacion=4, resena=f'Reseña {index}')
+        db.session.add(rating)
+        db.session.flush()
+        seconds = 1700000000 + min(index, count - 2) * 60
+        db.session.execute(
+            text("UPDATE calificacion SET created_at = datetime(:epoch, 'unixepoch') WHERE id_calificacion = :id"),
+            {'epoch': seconds, 'id': rating.id_calificacion}
+        )
+        ids.append(rating.id_calificacion)
+    db.session.commit()
+    return ids
+
+
+def fetch_all_reviews(client, book_id, limit, on_page=None):
+    seen, cursor = [], None
+    while True:
+        url = f'/api/books/{book_id}/reviews?limit={limit}'
+        if cursor:
+            url += f'&cursor={cursor}'
+        response = client.get(url)
+        assert response.status_code == 200
+        reviews = response.get_json()
+        seen.extend(review['id_calificacion'] for review in reviews)
+        cursor = response.headers.get(NEXT_CURSOR_HEADER)
+        if not cursor:
+            return seen
+        if on_page:
+            on_page(reviews)
+
+
+def test_reviews_cursor_walks_every_review(client):
+    book = make_book()
+    ids = add_reviews(book, 7)
+
+    seen = fetch_all_reviews(client, book.id_libros, limit=2)
+
+    # Más recientes primero; con el mismo created_at, id descendente
+    assert seen == sorted(ids, reverse=True)
+
+
+def test_reviews_cursor_survives_deleted_boundary(client):
+    book = make_book()
+    ids = add_reviews(book, 7)
+    deleted = []
+
+    def delete_last(reviews):
+        if not deleted:
+            boundary = db.session.get(Rating, reviews[-1]['id_calificacion'])
+            deleted.append(boundary.id_calificacion)
+            db.session.delete(boundary)
+            db.session.commit()
+
+    seen = fetch_all_reviews(client, book.id_libros, limit=2, on_page=delete_last)
+
+    assert seen == sorted(ids, reverse=True)
+    assert len(seen) == 7 and deleted
+
+
+def test_reviews_invalid_cursor(client):
+    book = make_book()
+    db.session.commit()
+    response = client.get(f'/api/books/{book.id_libros}/reviews?cursor=abc')
+    assert response.status_code == 400
+
+
+def add_books(count):
+    return [make_book(titulo=f'Libro {index:02d}') for index in range(count)]
+
+
+def test_catalog_keyset_pages(client):
+    ids = [book.id_libros for book in add_books(5)]
+    db.session.commit()
+    seen, cursor = [], None
+    while True:
+        response = client.get('/api/books?limit=2' + (f'&cursor={cursor}' if cursor else ''))
+        assert response.status_code == 200
+        # Mismo cuerpo que antes de paginar: una lista; el cursor va en la cabecera
+        assert isinstance(response.get_json(), list)
+        seen.extend(book['id_libros'] for book in response.get_json())
+        cursor = response.headers.get(NEXT_CURSOR_HEADER)
+        if not cursor:
+            break
+    assert seen == ids
+
+
+def test_catalog_cursor_header_is_exposed_to_the_frontend(client):
+    add_books(3)
+    db.session.commit()
+
+    response = client.get('/api/books?limit=2', headers={'Origin': 'http://localhost:5173'})
+
+    assert len(response.get_json()) == 2
+    assert NEXT_CURSOR_HEADER in response.headers['Access-Control-Expose-Headers']
+
+
+def test_catalog_fields_projection(client):
+    add_books(1)
+    db.session.commit()
+
+    book = client.get('/api/books?fields=titulo_libro,autor').get_json()[0]
+
+    # El id siempre se incluye porque es la clave del cursor
+    assert set(book) == {'id_libros', 'titulo_libro', 'autor'}
+    assert book['autor']['nombre_autor'] == 'Autora'
+
+
+def test_catalog_invalid_fields(client):
+    response = client.get('/api/books?fields=titulo_libro,password')
+
+    assert response.status_code == 400
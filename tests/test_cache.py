@@ -0,0 +1,82 @@
+# tests/test_cache.py
+import fnmatch
+import pytest
+from app import db
+from app.cache import DEFAULT_MULTIWORKER_TTL, RedisBackend, cache
+from tests.conftest import make_book, make_user, user_headers
+
+
+class FakeRedis:
+    """Cliente mínimo compatible con Redis (get/set/mget/incr/scan_iter/delete), sin TTL"""
+
+    def __init__(self):
+        self.data = {}
+
+    def get(self, key):
+        return self.data.get(key)
+
+    def set(self, key, value, ex=None):
+        self.data[key] = value.encode('utf-8') if isinstance(value, str) else value
+
+    def mget(self, keys):
+        return [self.data.get(key) for key in keys]
+
+    def incr(self, key):
+        self.data[key] = str(int(self.data.get(key, 0)) + 1).encode('ascii')
+        return int(self.data[key])
+
+    def scan_iter(self, pattern):
+        return [key for key in list(self.data) if fnmatch.fnmatch(key, pattern)]
+
+    def delete(self, key):
+        self.data.pop(key, None)
+
+
+def my_library(client, headers):
+    response = client.get('/api/my-library', headers=headers)
+    assert response.status_code == 200
+    return response
+
+
+def test_redis_invalidation_reaches_other_workers(app, client):
+    user = make_user()
+    book = make_book()
+    db.session.commit()
+    headers = user_headers(user)
+    redis = FakeRedis()
+    # Dos workers: cada uno con su backend, ambos sobre el mismo Redis
+    worker_a, worker_b = RedisBackend(redis), RedisBackend(redis)
+
+    cache.init_app(app, backend=worker_a)
+    assert my_library(client, headers).headers['X-Cache'] == 'MISS'
+    assert my_library(client, headers).headers['X-Cache'] == 'HIT'
+
+    cache.init_app(app, backend=worker_b)
+    response = client.post('/api/my-library/books', json={'id_libro': book.id_libros}, headers=headers)
+    assert response.status_code == 201
+
+    cache.init_app(app, backend=worker_a)
+    response = my_library(client, headers)
+    assert response.headers['X-Cache'] == 'MISS'
+    assert response.get_json()['total_books'] == 1
+
+
+def test_redis_clear_only_touches_prefix(app):
+    redis = FakeRedis()
+    redis.set('otra-app:clave', 'x')
+    backend = RedisBackend(redis)
+    backend.set('k', {'status': 200}, 60)
+    backend.bump_tags(['catalog'])
+
+    backend.clear()
+
+    assert list(redis.data) == ['otra-app:clave']
+
+
+@pytest.mark.parametrize('workers, expected', [('1', 300), ('4', DEFAULT_MULTIWORKER_TTL)])
+def test_memory_ttl_is_capped_with_several_workers(app, workers, expected):
+    app.config.update(CACHE_BACKEND='memory', CACHE_WORKERS=workers, CACHE_DEFAULT_TTL=300)
+    cache.init_app(app)
+
+    assert cache.ttl() == expected
+    assert cache.ttl(2) == 2
@@ -0,0 +1,54 @@
+# tests/test_catalog_import.py
+import json
+from pathlib import Path
+from app import db
+from app.catalog_import import import_catalog
+from app.models import Book, Genre
+
+BOOKS_FILE = Path(__file__).resolve().parent.parent / 'BaseDatos-Libros Reales.txt'
+
+
+def ndjson(*records):
+    return [json.dumps(record) + '\n' for record in records]
+
+
+def book(asin, titulo='Libro'):
+    return {'titulo': titulo, 'autor': 'Gabriel García Márquez', 'genero': 'Novela', 'asin': asin}
+
+
+def test_duplicate_asin_in_file_is_rejected(app):
+    lines = ndjson(book('A1', 'Primero'), book('A2'), book('A1', 'Repetido'))
+
+    report = import_catalog(lines, 'ndjson', batch_size=2).serialize()
+
+    assert report['read'] == 3
+    assert report['inserted'] == 2
+    assert report['errors'] == 1
+    assert report['error_samples'][0]['line'] == 3
+    assert 'A1' in report['error_samples'][0]['error']
+    assert db.session.query(Book.titulo_libro).filter_by(enlace_asin_libro='A1').scalar() == 'Primero'
+
+
+def test_markdown_import_reports_every_record(app):
+    with open(BOOKS_FILE, encoding='utf-8-sig', newline='') as handle:
+        report = import_catalog(handle, 'markdown').serialize()
+
+    assert report['read'] == report['inserted'] + report['errors']
+
+
+def test_markdown_latinoamericanos_uses_existing_genre(app):
+    existing = Genre.resolve('Latinoamericano')
+    db.session.commit()
+    lines = [
+        '# Top 10 Libros Latinoamericanos\n',
+        '## 1. Rayuela\n',
+        '- **Autor:** Julio Cortázar\n',
+        '- **ASIN:** 8437624746\n'
+    ]
+
+    import_catalog(lines, 'markdown')
+
+    book = Book.query.filter_by(enlace_asin_libro='8437624746').one()
+    assert book.id_genero == existing.id_genero
+    assert book.genero_libro == 'Latinoamericano'
+    assert Genre.query.count() == 1
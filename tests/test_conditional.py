@@ -0,0 +1,40 @@
+# tests/test_conditional.py
+from sqlalchemy import delete
+from app import conditional, db
+from app.conditional import bump_catalog_version, init_catalog_version
+from app.models import CatalogVersion
+
+
+def get_books(client, etag=None):
+    headers = {'If-None-Match': etag} if etag else {}
+    return client.get('/api/books', headers=headers)
+
+
+def test_matching_etag_returns_304(client):
+    etag = get_books(client).headers['ETag']
+
+    assert get_books(client, etag).status_code == 304
+
+
+def test_bump_changes_etag(client):
+    etag = get_books(client).headers['ETag']
+    bump_catalog_version()
+    db.session.commit()
+
+    response = get_books(client, etag)
+    assert response.status_code == 200
+    assert response.headers['ETag'] != etag
+
+
+def test_reset_does_not_repeat_etag(app, client):
+    etag = get_books(client).headers['ETag']
+
+    # Reseed / tabla vaciada: la versión vuelve a empezar en 1
+    db.session.execute(delete(CatalogVersion.__table__))
+    db.session.commit()
+    init_catalog_version(app)
+    conditional._cached['expires'] = 0.0
+
+    response = get_books(client, etag)
+    assert response.status_code == 200
+    assert response.headers['ETag'] != etag
@@ -0,0 +1,123 @@
+# tests/test_db_routing.py
+import time
+import pytest
+from flask import Response, g
+from sqlalchemy import inspect
+from app import db
+from app.db_routing import STICKY_COOKIE, STICKY_HEADER, read_router
+from app.models import Book
+from tests.conftest import make_book, make_user, user_headers
+
+FRONTEND = 'https://booketlist.vercel.app'
+
+
+@pytest.fixture
+def app_env():
+    # Primario (test.db) y réplica en archivos distintos
+    return {'DATABASE_REPLICA_URLS': 'sqlite:///{tmp_path}/replica.db', 'DB_READ_YOUR_WRITES_SECONDS': '5'}
+
+
+@pytest.fixture
+def replica(app):
+    """Engine de la réplica con el mismo esquema y sin filas"""
+    engine = db.engines['replica_0']
+    db.metadata.create_all(engine)
+    return engine
+
+
+def copy_to_replica(engine, obj, **overrides):
+    """Insertar en la réplica la fila de obj (con los cambios indicados)"""
+    values = {attr.columns[0].name: getattr(obj, attr.key) for attr in inspect(obj).mapper.column_attrs}
+    values.update(overrides)
+    with engine.begin() as connection:
+        connection.execute(type(obj).__table__.insert().values(**values))
+
+
+def remember_write(app, headers=None):
+    with app.test_request_context('/api/my-library', method='POST', headers=headers or {}):
+        response = read_router._remember_writes(Response('{}', status=201))
+    read_router._sticky.clear()
+    return response
+
+
+def chosen_bind(app, headers=None):
+    with app.test_request_context('/api/my-library', headers=headers or {}):
+        read_router._choose_bind()
+        return g.db_replica
+
+
+def test_cross_origin_write_sets_samesite_none_cookie(app):
+    response = remember_write(app, {'Origin': FRONTEND})
+
+    cookie = response.headers['Set-Cookie']
+    assert f'{STICKY_COOKIE}=' in cookie
+    assert 'SameSite=None' in cookie and 'Secure' in cookie
+    assert float(response.headers[STICKY_HEADER]) > time.time()
+
+
+def test_same_origin_write_keeps_lax_cookie(app):
+    cookie = remember_write(app).headers['Set-Cookie']
+
+    assert 'SameSite=Lax' in cookie
+
+
+def test_echoed_header_reads_from_primary(app):
+    until = remember_write(app, {'Origin': FRONTEND}).headers[STICKY_HEADER]
+
+    assert chosen_bind(app) == 'replica_0'
+    assert chosen_bind(app, {STICKY_HEADER: until}) is None
+
+
+def test_header_beyond_window_is_ignored(app):
+    assert chosen_bind(app, {STICKY_HEADER: str(time.time() + 3600)}) == 'replica_0'
+
+
+def add_replicated_book(replica):
+    """Un libro con distinto título en el primario y en la réplica"""
+    book = make_book('Primario')
+    db.session.commit()
+    copy_to_replica(replica, book.autor)
+    copy_to_replica(replica, book.genero)
+    copy_to_replica(replica, book, titulo_libro='Réplica')
+    # Las peticiones del test client comparten esta sesión: vaciarla para que lean de su bind
+    db.session.expunge_all()
+    return book
+
+
+def test_get_reads_from_replica_file(client, replica):
+    book = add_replicated_book(replica)
+
+    response = client.get(f'/api/books/{book.id_libros}')
+
+    assert response.status_code == 200
+    assert response.get_json()['title'] == 'Réplica'
+
+
+def test_write_and_sticky_read_use_primary_file(app, client, replica):
+    book = add_replicated_book(replica)
+    user = make_user()
+    headers = user_headers(user)
+
+    response = client.post('/api/my-library/books', json={'id_libro': book.id_libros}, headers=headers)
+    assert response.status_code == 201
+    until = response.headers[STICKY_HEADER]
+    # Otro proceso: sin la marca en memoria ni la cookie, solo con la cabecera reenviada
+    read_router._sticky.clear()
+    other_client = app.test_client()
+
+    from_replica = other_client.get('/api/my-library', headers=headers).get_json()
+    from_primary = other_client.get('/api/my-library', headers={**headers, STICKY_HEADER: until}).get_json()
+
+    assert from_replica['total_books'] == 0
+    assert [item['book']['titulo_libro'] for item in from_primary['quiero_leer']] == ['Primario']
+    assert db.session.query(Book.titulo_libro).scalar() == 'Primario'
+
+
+def test_sticky_cookie_keeps_same_client_on_primary(client, replica):
+    book = add_replicated_book(replica)
+    headers = user_headers(make_user())
+
+    assert client.post('/api/my-library/books', json={'id_libro': book.id_libros}, headers=headers).status_code == 201
+    read_router._sticky.clear()
+
+    assert client.get('/api/my-library', headers=headers).get_json()['total_books'] == 1
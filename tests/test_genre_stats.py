@@ -0,0 +1,67 @@
+# tests/test_genre_stats.py
+from app import db, genre_stats
+from app.models import Author, GenreStats
+from tests.conftest import count_statements, make_book
+
+
+def add_author(apellido):
+    author = Author(nombre_autor='Autor', apellido_autor=apellido)
+    db.session.add(author)
+    db.session.flush()
+    return author
+
+
+def added(titulo, genero, author):
+    book = make_book(titulo=titulo, genero=genero, autor=author)
+    genre_stats.book_added(book.id_genero, author.id_autor)
+    return book
+
+
+def snapshot():
+    return {(row.id_genero, row.total_libros, row.total_autores) for row in GenreStats.query}
+
+
+def test_incremental_counters_match_rebuild(app):
+    borges, cortazar = add_author('Borges'), add_author('Cortázar')
+    added('Ficciones', 'Cuento', borges)
+    added('El Aleph', 'Cuento', borges)
+    added('Bestiario', 'Cuento', cortazar)
+    rayuela = added('Rayuela', 'Novela', cortazar)
+
+    novela = rayuela.id_genero
+    db.session.delete(rayuela)
+    genre_stats.book_removed(novela, cortazar.id_autor)
+    db.session.commit()
+
+    incremental = snapshot()
+    genre_stats.rebuild_genre_stats()
+
+    assert incremental == snapshot()
+    assert [(row.total_libros, row.total_autores) for row in GenreStats.query] == [(3, 2)]
+
+
+def test_genre_stats_percentages_add_up(client):
+    author = add_author('Prueba')
+    for index, genero in enumerate(['Cuento', 'Cuento', 'Novela']):
+        added(f'Libro {index}', genero, author)
+    db.session.commit()
+
+    data = client.get('/api/books/genres/stats').get_json()
+
+    assert data['summary'] == {'total_books': 3, 'total_genres': 2}
+    percentages = {genre['genre']: genre['percentage'] for genre in data['genres']}
+    assert percentages == {'Cuento': 66.67, 'Novela': 33.33}
+    assert client.get('/api/books/genres').get_json()['genres'] == ['Cuento', 'Novela']
+
+
+def test_first_book_of_genre_upserts_in_one_statement(app):
+    author = add_author('García')
+    book = make_book(titulo='Cuentos', genero='Cuento', autor=author)
+
+    with count_statements() as statements:
+        genre_stats.book_added(book.id_genero, author.id_autor)
+    writes = [statement for statement in statements if statement.startswith('INSERT INTO estadisticas_genero')]
+
+    assert len(writes) == 1
+    assert 'ON CONFLICT' in writes[0]
+    assert db.session.get(GenreStats, book.id_genero).total_libros == 1
@@ -0,0 +1,19 @@
+# tests/test_library.py
+import pytest
+from app import db
+from tests.conftest import count_statements, fill_library, make_user, user_headers
+
+
+@pytest.mark.parametrize('size', [1, 50])
+def test_my_library_constant_statements(client, size):
+    user = make_user()
+    fill_library(user, size)
+    headers = user_headers(user)
+    db.session.remove()
+
+    with count_statements() as statements:
+        response = client.get('/api/my-library', headers=headers)
+
+    assert response.status_code == 200
+    assert response.get_json()['total_books'] == size
+    assert len(statements) == 2, statements
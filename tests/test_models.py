@@ -0,0 +1,70 @@
+# tests/test_models.py
+import pytest
+from sqlalchemy import text
+from sqlalchemy.exc import IntegrityError
+from app import db
+from app.models import Genre, Rating, UserLibrary
+from app.models.genre import slugify
+from tests.conftest import make_book, make_user, user_headers
+
+
+@pytest.mark.parametrize('model', [UserLibrary, Rating])
+def test_one_row_per_user_and_book(app, model):
+    user, book = make_user(), make_book()
+    db.session.add(model(id_usuario=user.id_usuario, id_libro=book.id_libros))
+    db.session.flush()
+
+    db.session.add(model(id_usuario=user.id_usuario, id_libro=book.id_libros))
+    with pytest.raises(IntegrityError):
+        db.session.flush()
+    db.session.rollback()
+
+
+def test_duplicate_library_book_is_rejected_by_api(client):
+    user, book = make_user(), make_book()
+    db.session.commit()
+    headers = user_headers(user)
+
+    first = client.post('/api/my-library/books', json={'id_libro': book.id_libros}, headers=headers)
+    second = client.post('/api/my-library/books', json={'id_libro': book.id_libros}, headers=headers)
+
+    assert first.status_code == 201
+    assert second.status_code == 400
+    assert UserLibrary.query.filter_by(id_usuario=user.id_usuario).count() == 1
+
+
+@pytest.mark.parametrize('sql, index', [
+    ("SELECT id_calificacion FROM calificacion WHERE id_libro = 1 ORDER BY created_at DESC, id_calificacion DESC",
+     'ix_calificacion_libro_created'),
+    ("SELECT id_libros FROM libros WHERE id_autor = 1", 'ix_libros_id_autor'),
+    ("SELECT id_usuario FROM usuarios ORDER BY created_at, id_usuario", 'ix_usuarios_created_at')
+])
+def test_hot_paths_use_indexes(app, sql, index):
+    plan = ' '.join(row[-1] for row in db.session.execute(text(f'EXPLAIN QUERY PLAN {sql}')))
+
+    assert index in plan
+
+
+def test_slugify():
+    assert slugify('Ciencia Ficción') == 'ciencia-ficcion'
+    assert slugify('  No-Ficción ') == 'no-ficcion'
+
+
+def test_resolve_ignores_accents_and_keeps_legacy_slugs(app):
+    ciencia = Genre.resolve('Ciencia Ficción')
+    latino = Genre.resolve('Latinoamericano')
+
+    assert Genre.resolve('ciencia ficcion').id_genero == ciencia.id_genero
+    assert latino.slug == 'latinoamericanos'
+    assert Genre.by_slug('Ciencia Ficción').id_genero == ciencia.id_genero
+    assert Genre.query.count() == 2
+
+
+def test_books_by_genre_slug(client):
+    make_book(titulo='Dune', genero='Ciencia Ficción')
+    make_book(titulo='Rayuela', genero='Latinoamericano')
+    db.session.commit()
+
+    assert [book['title'] for book in client.get('/api/books/genre/ciencia-ficcion').get_json()] == ['Dune']
+    assert [book['title'] for book in client.get('/api/books/genre/latinoamericanos').get_json()] == ['Rayuela']
+    assert client.get('/api/books/genre/poesia').get_json() == []
@@ -0,0 +1,78 @@
+# tests/test_passwords.py
+import threading
+import time
+import pytest
+from app import db, passwords as passwords_module
+from app.passwords import HasherBusy, passwords
+from tests.conftest import TEST_PASSWORD, make_user
+
+
+def wait_idle(timeout=5):
+    deadline = time.monotonic() + timeout
+    while passwords.stats()['in_flight'] and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+
+def free_slots():
+    """Huecos libres del pool (se devuelven después de contarlos)"""
+    taken = 0
+    while passwords._slots.acquire(blocking=False):
+        taken += 1
+    for _ in range(taken):
+        passwords._slots.release()
+    return taken
+
+
+def test_hash_roundtrip(app):
+    password_hash = passwords.hash(TEST_PASSWORD)
+
+    assert passwords.verify(password_hash, TEST_PASSWORD)
+    assert not passwords.verify(password_hash, 'otra')
+    assert passwords.verify_and_update(password_hash, TEST_PASSWORD) == (True, None)
+
+
+def test_login_timeout_returns_503(app, client, monkeypatch):
+    make_user(email='lento@test.com')
+    db.session.commit()
+    check = passwords_module.check_password_hash
+
+    def slow_check(password_hash, password):
+        time.sleep(0.3)
+        return check(password_hash, password)
+
+    monkeypatch.setattr(passwords_module, 'check_password_hash', slow_check)
+    monkeypatch.setattr(passwords, 'timeout', 0.05)
+    completed = passwords.stats()['completed']
+
+    response = client.post('/api/auth/login', json={'email_usuario': 'lento@test.com', 'password_usuario': TEST_PASSWORD})
+
+    assert response.status_code == 503
+    assert response.headers['Retry-After'] == '1'
+    # La tarea sigue ejecutándose y libera su hueco al terminar
+    wait_idle()
+    stats = passwords.stats()
+    assert stats['timeouts'] == 1 and stats['in_flight'] == 0 and stats['completed'] == completed + 1
+    assert free_slots() == passwords.workers + passwords.queue_size
+
+
+def test_timeout_while_queued_releases_slot(app, monkeypatch):
+    app.config.update(PASSWORD_HASH_WORKERS=1, PASSWORD_HASH_TIMEOUT=5)
+    passwords.init_app(app)
+    release = threading.Event()
+    blocker = threading.Thread(target=passwords._run, args=(release.wait,))
+    blocker.start()
+    while not passwords.stats()['running']:
+        time.sleep(0.01)
+
+    # La única hebra está ocupada: esta tarea espera en cola y se cancela
+    monkeypatch.setattr(passwords, 'timeout', 0.05)
+    try:
+        with pytest.raises(HasherBusy):
+            passwords._run(lambda: None)
+        assert passwords.stats()['in_flight'] == 1
+    finally:
+        release.set()
+        blocker.join()
+    stats = passwords.stats()
+    assert stats['timeouts'] == 1 and stats['in_flight'] == 0 and stats['completed'] == 1
+    assert free_slots() == passwords.workers + passwords.queue_size
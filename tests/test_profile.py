@@ -0,0 +1,33 @@
+# tests/test_profile.py
+from app import db
+from tests.conftest import count_statements, fill_library, make_user, user_headers
+
+
+def get_profile(client, user, size):
+    fill_library(user, size)
+    headers = user_headers(user)
+    db.session.remove()
+    with count_statements() as statements:
+        response = client.get('/api/profile', headers=headers)
+    assert response.status_code == 200
+    return response.get_json(), len(statements)
+
+
+def test_profile_statistics(client):
+    profile, _ = get_profile(client, make_user(), 9)
+
+    assert profile['statistics'] == {
+        'totalBooksRead': 3,
+        'totalBooksReading': 3,
+        'totalBooksToRead': 3,
+        'totalReviews': 0
+    }
+    assert [len(profile['readingLists'][name]) for name in ('read', 'reading', 'toRead')] == [3, 3, 3]
+    assert profile['topAuthors'] == [{'name': 'Autora Prueba', 'booksCount': 3}]
+
+
+def test_profile_statements_do_not_grow_with_library(client):
+    _, small = get_profile(client, make_user(email='poco@test.com'), 1)
+    _, large = get_profile(client, make_user(email='mucho@test.com'), 50)
+
+    assert small == large
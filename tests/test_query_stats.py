@@ -0,0 +1,50 @@
+# tests/test_query_stats.py
+import logging
+import re
+import pytest
+from app import db
+from tests.conftest import make_book
+
+SERVER_TIMING = re.compile(
+    r'db;desc="(\d+) queries";dur=[\d.]+, db-slowest;dur=[\d.]+, app;dur=[\d.]+'
+)
+
+
+@pytest.fixture
+def app_env():
+    return {'QUERY_STATS_HEADERS': 'true', 'QUERY_BUDGET_COUNT': '0', 'QUERY_BUDGET_MS': '60000'}
+
+
+def test_server_timing_header_counts_queries(client):
+    make_book('Rayuela')
+    db.session.commit()
+
+    response = client.get('/api/books')
+
+    assert response.status_code == 200
+    match = SERVER_TIMING.fullmatch(response.headers['Server-Timing'])
+    assert match and int(match.group(1)) >= 1
+
+
+def test_request_over_budget_logs_warning(client, caplog):
+    make_book('Rayuela')
+    db.session.commit()
+
+    with caplog.at_level(logging.WARNING):
+        response = client.get('/api/books')
+
+    count = int(SERVER_TIMING.fullmatch(response.headers['Server-Timing']).group(1))
+    assert count >= 1
+    warnings = [record.getMessage() for record in caplog.records if 'fuera de presupuesto' in record.getMessage()]
+    assert len(warnings) == 1
+    assert f'{count} consultas' in warnings[0]
+    assert '/api/books' in warnings[0]
+
+
+def test_request_within_budget_does_not_log(app, client, caplog):
+    app.config['QUERY_BUDGET_COUNT'] = 100
+
+    with caplog.at_level(logging.WARNING):
+        client.get('/api/books')
+
+    assert not [record for record in caplog.records if 'fuera de presupuesto' in record.getMessage()]
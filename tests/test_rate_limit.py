@@ -0,0 +1,62 @@
+# tests/test_rate_limit.py
+import pytest
+from app import rate_limit
+from app.rate_limit import MemoryBackend, parse_limit
+
+
+@pytest.fixture
+def app_env():
+    return {'RATE_LIMIT_LOGIN_IP': '3/minute', 'RATE_LIMIT_LOGIN_EMAIL': '1/minute'}
+
+
+def login(client, email):
+    return client.post('/api/auth/login', json={'email_usuario': email, 'password_usuario': 'incorrecta'})
+
+
+def test_login_rejected_with_retry_after(client):
+    assert login(client, 'a@test.com').status_code == 401
+
+    response = login(client, 'a@test.com')
+
+    assert response.status_code == 429
+    assert 1 <= int(response.headers['Retry-After']) <= 60
+
+
+def test_email_rejection_does_not_spend_ip_tokens(client):
+    assert login(client, 'a@test.com').status_code == 401
+    assert login(client, 'a@test.com').status_code == 429
+
+    # La IP conserva 2 de sus 3 tokens
+    assert login(client, 'b@test.com').status_code == 401
+    assert login(client, 'c@test.com').status_code == 401
+    assert login(client, 'd@test.com').status_code == 429
+
+
+def test_memory_bucket_refills(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(rate_limit.time, 'monotonic', lambda: now[0])
+    backend = MemoryBackend()
+    capacity, rate = parse_limit('2/minute')
+
+    assert backend.take('k', capacity, rate)[0]
+    assert backend.take('k', capacity, rate)[0]
+    allowed, retry_after = backend.take('k', capacity, rate)
+    assert not allowed and retry_after == pytest.approx(30)
+
+    now[0] += 30
+    assert backend.take('k', capacity, rate)[0]
+    assert not backend.take('k', capacity, rate)[0]
+
+    # Nunca se acumulan más tokens que la capacidad
+    now[0] += 3600
+    assert [backend.take('k', capacity, rate)[0] for _ in range(3)] == [True, True, False]
+
+
+def test_memory_refund_is_capped():
+    backend = MemoryBackend()
+    capacity, rate = parse_limit('1/hour')
+    backend.take('k', capacity, rate)
+    backend.refund('k', capacity)
+    backend.refund('k', capacity)
+
+    assert [backend.take('k', capacity, rate)[0] for _ in range(2)] == [True, False]
@@ -0,0 +1,105 @@
+# tests/test_rating_stats.py
+from sqlalchemy.exc import IntegrityError
+from app import db, rating_stats
+from app.models import BookRatingStats, Rating
+from tests.conftest import admin_headers, count_statements, make_admin, make_book, make_user, user_headers
+
+
+def rate(user, book, calificacion, resena=None):
+    db.session.add(Rating(id_usuario=user.id_usuario, id_libro=book.id_libros, calificacion=calificacion, resena=resena))
+    rating_stats.rating_added(user.id_usuario, book.id_libros, calificacion, resena)
+
+
+def stats_of(client, book):
+    response = client.get(f'/api/books/{book.id_libros}/reviews/stats')
+    assert response.status_code == 200
+    return response.get_json()
+
+
+def test_incremental_counters_match_rebuild(client):
+    book = make_book()
+    ana, luis, eva = (make_user(email=f'{name}@test.com') for name in ('ana', 'luis', 'eva'))
+    rate(ana, book, 5, 'Excelente')
+    rate(luis, book, 3)
+    rate(eva, book, None, 'Sin nota')
+    rating_stats.rating_changed(luis.id_usuario, book.id_libros, (3, None), (4, 'Mejor de lo esperado'))
+    db.session.query(Rating).filter_by(id_usuario=luis.id_usuario).update({'calificacion': 4, 'resena': 'Mejor de lo esperado'})
+    db.session.commit()
+
+    incremental = stats_of(client, book)
+    rating_stats.rebuild_rating_stats()
+
+    assert incremental == stats_of(client, book)
+    assert incremental == {
+        'total_reviews': 3,
+        'average_rating': 4.5,
+        'rated_count': 2,
+        'text_reviews': 3,
+        'histogram': {'1': 0, '2': 0, '3': 0, '4': 1, '5': 1}
+    }
+
+
+def test_blocked_users_do_not_count(client):
+    headers = admin_headers(make_admin())
+    book = make_book()
+    ana, luis = make_user(email='ana@test.com'), make_user(email='luis@test.com')
+    rate(ana, book, 5)
+    rate(luis, book, 1)
+    db.session.commit()
+
+    response = client.put(f'/api/admin/users/{luis.id_usuario}/status', headers=headers)
+    assert response.status_code == 200
+
+    stats = stats_of(client, book)
+    assert stats['total_reviews'] == 1 and stats['average_rating'] == 5
+
+
+def test_book_without_ratings(client):
+    book = make_book()
+    db.session.commit()
+
+    assert stats_of(client, book)['total_reviews'] == 0
+    assert db.session.get(BookRatingStats, book.id_libros) is None
+
+
+def test_first_rating_upserts_stats_in_one_statement(app):
+    book = make_book()
+    ana = make_user(email='ana@test.com')
+    db.session.commit()
+
+    with count_statements() as statements:
+        rating_stats.rating_added(ana.id_usuario, book.id_libros, 4, None)
+    stats_statements = [statement for statement in statements if 'estadisticas_calificacion' in statement]
+
+    assert len(stats_statements) == 1
+    assert 'ON CONFLICT' in stats_statements[0]
+    rating_stats.rating_added(ana.id_usuario, book.id_libros, 2, None)
+    assert db.session.get(BookRatingStats, book.id_libros).total_calificadas == 2
+
+
+def test_mark_read_stats_conflict_is_not_a_duplicate_rating(client, monkeypatch):
+    book = make_book()
+    user = make_user()
+    db.session.commit()
+
+    def conflict(*args):
+        raise IntegrityError('INSERT INTO estadisticas_calificacion', {}, Exception('UNIQUE'))
+
+    monkeypatch.setattr(rating_stats, 'rating_added', conflict)
+    response = client.post(f'/api/my-library/books/{book.id_libros}/mark-read',
+                           json={'calificacion': 5}, headers=user_headers(user))
+
+    assert response.status_code == 500
+    assert 'ya está marcado' not in response.get_json()['error']
+    assert Rating.query.count() == 0
+
+
+def test_mark_read_twice_is_rejected(client):
+    book = make_book()
+    user = make_user()
+    db.session.commit()
+    url = f'/api/my-library/books/{book.id_libros}/mark-read'
+
+    assert client.post(url, json={'calificacion': 5}, headers=user_headers(user)).status_code == 201
+    assert client.post(url, json={'calificacion': 4}, headers=user_headers(user)).status_code == 400
+    assert db.session.get(BookRatingStats, book.id_libros).total_calificadas == 1
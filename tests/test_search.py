@@ -0,0 +1,107 @@
+# tests/test_search.py
+from sqlalchemy import event, text
+from sqlalchemy.engine import Engine
+from app import create_app, db, search
+from app.pagination import NEXT_CURSOR_HEADER, encode_cursor
+from app.models import Author
+from tests.conftest import make_book
+
+
+def add_indexed_books():
+    marquez = Author(nombre_autor='Gabriel', apellido_autor='García Márquez')
+    otro = Author(nombre_autor='Ana', apellido_autor='Soledad')
+    db.session.add_all([marquez, otro])
+    db.session.flush()
+    books = [
+        make_book(titulo='Cien Años de Soledad', autor=marquez),
+        make_book(titulo='El Otoño del Patriarca', autor=marquez),
+        make_book(titulo='Poemas', autor=otro)
+    ]
+    search.index_books(book.id_libros for book in books)
+    db.session.commit()
+    return books
+
+
+def test_normalize_text_removes_accents():
+    assert search.normalize_text('Canción de ÑANDÚ') == 'cancion de nandu'
+    assert search.tokenize('García-Márquez, 1967') == ['garcia', 'marquez', '1967']
+
+
+def test_search_ignores_accents_and_matches_prefixes(app):
+    cien, otono, _ = add_indexed_books()
+
+    assert search.get_backend() == 'fts5'
+    assert search.search_book_ids('otono', 10) == [otono.id_libros]
+    assert set(search.search_book_ids('marq', 10)) == {cien.id_libros, otono.id_libros}
+
+
+def test_title_matches_rank_before_author_matches(app):
+    cien, _, poemas = add_indexed_books()
+
+    # 'soledad' está en el título de un libro y en el autor del otro
+    assert search.search_book_ids('soledad', 10) == [cien.id_libros, poemas.id_libros]
+
+
+def test_search_endpoint_pages(client):
+    add_indexed_books()
+
+    first = client.get('/api/books/search?q=garcia&limit=1')
+    second = client.get(f"/api/books/search?q=garcia&limit=1&cursor={first.headers[NEXT_CURSOR_HEADER]}")
+
+    assert len(first.get_json()) == 1 and len(second.get_json()) == 1
+    assert first.get_json()[0]['id'] != second.get_json()[0]['id']
+    assert NEXT_CURSOR_HEADER not in second.headers
+
+
+def test_search_requires_query(client):
+    assert client.get('/api/books/search').status_code == 400
+
+
+def test_startup_runs_no_search_ddl_or_counts(tmp_path, monkeypatch):
+    monkeypatch.setenv('DATABASE_URL', f"sqlite:///{tmp_path / 'fresh.db'}")
+    monkeypatch.setenv('SECRET_KEY', 'clave-de-pruebas')
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    event.listen(Engine, 'before_cursor_execute', before_cursor_execute)
+    try:
+        fresh = create_app()
+    finally:
+        event.remove(Engine, 'before_cursor_execute', before_cursor_execute)
+
+    assert search.EXTENSION_KEY not in fresh.extensions
+    assert not [
+        statement for statement in statements
+        if 'libros_fts' in statement or statement.upper().startswith('SELECT COUNT(*)')
+    ]
+    with fresh.app_context():
+        assert search.get_backend() is None
+        db.session.remove()
+        for engine in db.engines.values():
+            engine.dispose()
+
+
+def test_missing_index_falls_back_to_ilike(client):
+    add_indexed_books()
+    db.session.execute(text('DROP TABLE libros_fts'))
+    db.session.commit()
+    client.application.extensions.pop(search.EXTENSION_KEY)
+
+    results = client.get('/api/books/search?q=Poemas').get_json()
+
+    assert search.get_backend() is None
+    assert [result['title'] for result in results] == ['Poemas']
+
+
+def test_search_depth_is_capped(app, client):
+    add_indexed_books()
+    app.config['SEARCH_MAX_RESULTS'] = 2
+
+    first = client.get('/api/books/search?q=garcia&limit=5')
+    too_deep = client.get(f"/api/books/search?q=garcia&cursor={encode_cursor(2)}")
+
+    assert len(first.get_json()) == 2
+    assert NEXT_CURSOR_HEADER not in first.headers
+    assert too_deep.status_code == 400
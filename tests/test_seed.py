@@ -0,0 +1,20 @@
+# tests/test_seed.py
+import pytest
+from app.verify_seed import run_checks
+
+
+@pytest.fixture
+def seed_module(app, monkeypatch):
+    # app.seed crea su propia aplicación al importarse; se usa la del test
+    from app import seed
+    monkeypatch.setattr(seed, 'app', app)
+    return seed
+
+
+@pytest.mark.parametrize('seed', [1, 2, 3, 4])
+def test_seed_passes_every_check(seed_module, seed):
+    seed_module.seed_database(seed=seed)
+
+    report = run_checks('all')
+
+    assert [check['name'] for check in report['checks'] if not check['passed']] == []
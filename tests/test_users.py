@@ -0,0 +1,80 @@
+# tests/test_users.py
+import json
+import pytest
+from sqlalchemy import text
+from app import db
+from app.pagination import NEXT_CURSOR_HEADER
+from app.routes import users as users_routes
+from tests.conftest import make_user
+
+
+def add_users(count):
+    for index in range(count):
+        make_user(email=f'lector{index}@test.com', nombre=f'Lector {index}')
+    db.session.commit()
+
+
+def test_public_users_stream_pages(client):
+    add_users(5)
+    seen, cursor = [], None
+    while True:
+        url = '/api/users/public?limit=2' + (f'&cursor={cursor}' if cursor else '')
+        response = client.get(url)
+        assert response.status_code == 200
+        seen.extend(user['id_usuario'] for user in json.loads(response.get_data(as_text=True)))
+        cursor = response.headers.get(NEXT_CURSOR_HEADER)
+        if not cursor:
+            break
+    assert seen == sorted(seen) and len(seen) == 5
+
+
+def test_public_users_last_full_page_has_no_cursor(client):
+    add_users(4)
+
+    response = client.get('/api/users/public?limit=2')
+    last = client.get(f"/api/users/public?limit=2&cursor={response.headers[NEXT_CURSOR_HEADER]}")
+
+    assert len(json.loads(last.get_data(as_text=True))) == 2
+    assert NEXT_CURSOR_HEADER not in last.headers
+
+
+def test_public_users_query_error_is_500(client, monkeypatch):
+    monkeypatch.setattr(users_routes, '_public_users_query', lambda limit, after_id=None: text('SELECT * FROM no_existe'))
+
+    response = client.get('/api/users/public')
+
+    assert response.status_code == 500
+
+
+class FailingResult:
+    """Devuelve el primer bloque y falla al seguir leyendo"""
+
+    def __init__(self, result):
+        self.result = result
+
+    def fetchmany(self, size):
+        return self.result.fetchmany(1)
+
+    def __iter__(self):
+        raise RuntimeError('conexión perdida')
+
+    def close(self):
+        self.result.close()
+
+    def __getattr__(self, name):
+        return getattr(self.result, name)
+
+
+def test_public_users_stream_error_leaves_invalid_json(client, monkeypatch):
+    add_users(3)
+    execute = db.session.execute
+    monkeypatch.setattr(db.session, 'execute', lambda *args, **kwargs: FailingResult(execute(*args, **kwargs)))
+
+    response = client.get('/api/users/public')
+
+    # El estado ya se envió: la lista queda sin cerrar para que el cliente detecte el corte
+    assert response.status_code == 200
+    body = response.get_data(as_text=True)
+    assert body.startswith('[{') and not body.endswith(']')
+    with pytest.raises(json.JSONDecodeError):
+        json.loads(body)
@@ -0,0 +1,55 @@
+# tests/test_verify_seed.py
+from app import db, genre_stats, rating_stats
+from app.models import Rating, UserLibrary
+from app.verify_seed import run_checks
+from tests.conftest import make_book, make_user
+
+
+def make_counted_book():
+    """Libro con los contadores por género al día"""
+    book = make_book()
+    genre_stats.refresh_genres({book.id_genero})
+    return book
+
+
+def failed_checks(group='integrity'):
+    report = run_checks(group)
+    return {check['name']: check for check in report['checks'] if not check['passed']}
+
+
+def test_consistent_data_passes(app):
+    user = make_user()
+    book = make_counted_book()
+    db.session.add(Rating(id_usuario=user.id_usuario, id_libro=book.id_libros, calificacion=5))
+    rating_stats.rating_added(user.id_usuario, book.id_libros, 5, None)
+    db.session.commit()
+
+    assert failed_checks() == {}
+
+
+def test_detects_library_rating_overlap(app):
+    user = make_user()
+    book = make_counted_book()
+    db.session.add(UserLibrary(id_usuario=user.id_usuario, id_libro=book.id_libros, estado_lectura='leyendo'))
+    db.session.add(Rating(id_usuario=user.id_usuario, id_libro=book.id_libros, calificacion=4))
+    rating_stats.rating_added(user.id_usuario, book.id_libros, 4, None)
+    db.session.commit()
+
+    failed = failed_checks()
+
+    assert set(failed) == {'library_rating_overlap'}
+    assert failed['library_rating_overlap']['violations'] == 1
+    assert failed['library_rating_overlap']['samples'][0]['id_usuario'] == user.id_usuario
+
+
+def test_detects_invalid_values_and_stats_drift(app):
+    user = make_user()
+    book = make_counted_book()
+    db.session.add(UserLibrary(id_usuario=user.id_usuario, id_libro=book.id_libros, estado_lectura='leido'))
+    # Calificación fuera de rango y sin actualizar los contadores
+    db.session.add(Rating(id_usuario=user.id_usuario, id_libro=book.id_libros, calificacion=9))
+    db.session.commit()
+
+    failed = failed_checks()
+
+    assert {'invalid_reading_states', 'invalid_ratings', 'rating_stats_drift'} <= set(failed)